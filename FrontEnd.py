@@ -75,6 +75,12 @@ def main(): # mccabe:disable=MC0001
 	debug =   "-d"        in sys_argv
 	verbose = "-v"        in sys_argv
 	quiet =   "-q"        in sys_argv
+	profile = None
+	for index, argument in enumerate(sys_argv):
+		if argument.startswith("--profile="):
+			profile = argument[10:]
+		elif ((argument == "--profile") and (index + 1 < len(sys_argv))):
+			profile = sys_argv[index + 1]
 
 	# configure Exit class
 	Exit.quiet = quiet
@@ -82,7 +88,7 @@ def main(): # mccabe:disable=MC0001
 	try:
 		Init.init()
 		# handover to a class instance
-		pyIPCMI = IPCoreManagementInfrastructure(debug, verbose, quiet, dryRun)
+		pyIPCMI = IPCoreManagementInfrastructure(debug, verbose, quiet, dryRun, profile=profile)
 		pyIPCMI.Run()
 		Exit.exit()
 
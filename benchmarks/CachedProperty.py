@@ -0,0 +1,90 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+#
+# ==============================================================================
+# Authors:          Patrick Lehmann
+#
+# Python Module:    Micro-benchmark of CachedReadOnlyProperty against a plain property.
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2018 Patrick Lehmann - Bötzingen, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from argparse         import ArgumentParser
+from timeit           import repeat
+
+from lib.Decorators   import CachedReadOnlyProperty
+
+
+__api__ = [
+	'Main'
+]
+__all__ = __api__
+
+
+class _PlainDevice:
+	def __init__(self, generation, family, number):
+		self._generation =  generation
+		self._family =      family
+		self._number =      number
+
+	@property
+	def ShortName(self):
+		return "XC{0}{1}{2}T".format(self._generation, self._family, self._number).upper()
+
+
+class _CachedDevice(_PlainDevice):
+	@CachedReadOnlyProperty
+	def ShortName(self):
+		return "XC{0}{1}{2}T".format(self._generation, self._family, self._number).upper()
+
+
+class _SlottedDevice:
+	__slots__ = ("_generation", "_family", "_number", "_cached_ShortName")
+
+	def __init__(self, generation, family, number):
+		self._generation =  generation
+		self._family =      family
+		self._number =      number
+
+	@CachedReadOnlyProperty
+	def ShortName(self):
+		return "XC{0}{1}{2}T".format(self._generation, self._family, self._number).upper()
+
+
+def Main():
+	argParser = ArgumentParser(description="Compare CachedReadOnlyProperty with a plain property.")
+	argParser.add_argument("--number", type=int, default=1000000, help="Attribute reads per measurement.")
+	argParser.add_argument("--repeat", type=int, default=5,       help="Measurements per variant; the fastest one is reported.")
+	args = argParser.parse_args()
+
+	variants = [
+		("property",                _PlainDevice(7, "k", 325)),
+		("cached (__dict__)",       _CachedDevice(7, "k", 325)),
+		("cached (__slots__)",      _SlottedDevice(7, "k", 325))
+	]
+
+	print("{0: <24} {1: >12}".format("Variant", "ns/read"))
+	print("-" * 37)
+	for name, device in variants:
+		timings = repeat(lambda: device.ShortName, number=args.number, repeat=args.repeat)
+		print("{0: <24} {1: >12.1f}".format(name, min(timings) / args.number * 1e9))
+
+
+if (__name__ == "__main__"):
+	Main()
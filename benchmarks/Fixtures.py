@@ -0,0 +1,303 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+#
+# ==============================================================================
+# Authors:          Patrick Lehmann
+#
+# Python Module:    Deterministic synthetic fixtures for the benchmark suite.
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2018 Patrick Lehmann - Bötzingen, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+"""Generate a synthetic pyIPCMI installation into a directory.
+
+The fixture consists of the repository's own defaults and boards files, a
+generated private configuration, a namespace tree of a configurable size in
+a structure file, one IP core per entity with one VHDL testbench, a
+``*.files`` file per IP core and testbench, a ``*.rules`` file per IP core
+and simulator logs. All names and contents depend only on the size
+parameters, so two fixtures of the same size are identical.
+"""
+from pathlib                    import Path
+
+from lib.ExtendedConfigParser   import ExtendedConfigParser
+from pyIPCMI.DataBase.Entity    import NamespaceRoot
+from pyIPCMI.DataBase.Solution  import Repository
+
+
+__api__ = [
+	'FixtureHost',
+	'Fixture'
+]
+__all__ = __api__
+
+
+LIBRARY_NAME =            "PoC"
+CONFIG_DIRECTORY =        Path(__file__).resolve().parent.parent / ".pyIPCMI"
+
+
+class FixtureHost:
+	"""The subset of :py:class:`pyIPCMI.IPCoreManagementInfrastructure` used by
+	the namespace tree, FQN resolution and the ``*.files`` parser."""
+	class __Directories__:
+		Root =      None
+
+	def __init__(self, rootDirectory, configFiles):
+		self.Platform =         "Linux"
+		self.Logger =           None
+		self.Profiler =         None
+		self.LibraryName =      LIBRARY_NAME
+		self.LibraryKey =       "INSTALL." + LIBRARY_NAME
+		self.Directories =      self.__Directories__()
+		self.Directories.Root = rootDirectory
+		self.ConfigFiles =      configFiles
+		self.Config =           None
+		self.Root =             None
+		self.Repository =       None
+
+	def ReadConfiguration(self):
+		"""Read all configuration files into a new parser."""
+		self.Config = ExtendedConfigParser()
+		self.Config.optionxform = str
+		for configFile in self.ConfigFiles:
+			self.Config.read(str(configFile), encoding="utf-8")
+		return self.Config
+
+	def LoadNamespaces(self):
+		"""Build the namespace tree and the repository from the configuration."""
+		self.Repository = Repository(self)
+		self.Root =       NamespaceRoot(self)
+		return self.Root
+
+
+class Fixture:
+	"""A synthetic installation with *fanout* sub-namespaces per namespace,
+	*depth* namespace levels and *entities* IP cores per namespace.
+
+	Each testbench includes a shared ``common.files`` file with *commonFiles*
+	VHDL files and the ``*.files`` file of its IP core with *files* VHDL files.
+	"""
+	def __init__(self, directory, fanout=4, depth=2, entities=5, files=4, commonFiles=10, logLines=20000):
+		self._directory =     Path(directory)
+		self._fanout =        fanout
+		self._depth =         depth
+		self._entities =      entities
+		self._files =         files
+		self._commonFiles =   commonFiles
+		self._logLines =      logLines
+
+		self._namespaces =    []
+		self._filesFiles =    []
+		self._rulesFiles =    []
+
+	@property
+	def Directory(self):      return self._directory
+	@property
+	def Namespaces(self):     return self._namespaces
+	@property
+	def FilesFiles(self):     return self._filesFiles
+	@property
+	def RulesFiles(self):     return self._rulesFiles
+	@property
+	def ConfigFiles(self):
+		return [
+			self._directory / "config.private.ini",
+			CONFIG_DIRECTORY / "config.defaults.ini",
+			CONFIG_DIRECTORY / "config.boards.ini",
+			self._directory / "config.structure.ini",
+			self._directory / "config.entity.ini"
+		]
+	@property
+	def GHDLLogFile(self):    return self._directory / "logs" / "ghdl.log"
+	@property
+	def VSimLogFile(self):    return self._directory / "logs" / "vsim.log"
+
+	def CreateHost(self):
+		return FixtureHost(self._directory, self.ConfigFiles)
+
+	def Generate(self):
+		"""Write all fixture files and return a host with the loaded namespace tree."""
+		self._WriteConfiguration()
+		host = self.CreateHost()
+		host.ReadConfiguration()
+		host.LoadNamespaces()
+		self._WriteFilesFiles(host)
+		self._WriteLogs()
+		return host
+
+	@staticmethod
+	def _Write(filePath, lines):
+		filePath.parent.mkdir(parents=True, exist_ok=True)
+		with filePath.open('w') as fileHandle:
+			fileHandle.write("\n".join(lines) + "\n")
+
+	def _WriteConfiguration(self):
+		private = [
+			"[INSTALL.{0}]".format(LIBRARY_NAME),
+			"InstallationDirectory =   {0}".format(self._directory.as_posix()),
+			"",
+			"[SOLUTION.Solutions]",
+			""
+		]
+		structure = [
+			"[{0}]".format(LIBRARY_NAME),
+			"Name =",
+			"Prefix =",
+			"DirectoryName =",
+			"RelDir =                  .",
+			"SrcDir =                  ${{INSTALL.{0}:InstallationDirectory}}/src".format(LIBRARY_NAME),
+			"TBDir =                   ${{INSTALL.{0}:InstallationDirectory}}/tb".format(LIBRARY_NAME),
+			"SimDir =                  ${{INSTALL.{0}:InstallationDirectory}}/sim".format(LIBRARY_NAME),
+			"NLDir =                   ${{INSTALL.{0}:InstallationDirectory}}/netlist".format(LIBRARY_NAME),
+			"XSTDir =                  ${{INSTALL.{0}:InstallationDirectory}}/xst".format(LIBRARY_NAME),
+			"QMAPDir =                 ${{INSTALL.{0}:InstallationDirectory}}/quartus".format(LIBRARY_NAME)
+		]
+		entity = []
+
+		def _AddNamespace(sectionName, level):
+			children = []
+			if (level < self._depth):
+				children = ["ns{0}".format(index) for index in range(self._fanout)]
+			names = ["ent{0}".format(index) for index in range(self._entities)] if (level > 0) else []
+
+			structure.extend("{0: <26}= Namespace".format(child) for child in children)
+			structure.extend("{0: <26}= Entity".format(name) for name in names)
+			structure.append("")
+
+			path = sectionName.split(".")[1:]
+			for name in names:
+				ipSectionName = ".".join(["IP"] + path + [name])
+				entity.extend([
+					"[{0}]".format(ipSectionName),
+					"{0: <26}= VHDLTestbench".format("tb"),
+					"",
+					"[{0}]".format(ipSectionName.replace("IP", "TB", 1) + ".tb"),
+					""
+				])
+
+			for child in children:
+				childSectionName = sectionName + "." + child
+				self._namespaces.append(childSectionName)
+				structure.append("[{0}]".format(childSectionName))
+				_AddNamespace(childSectionName, level + 1)
+
+		_AddNamespace(LIBRARY_NAME, 0)
+
+		self._Write(self._directory / "config.private.ini",   private)
+		self._Write(self._directory / "config.structure.ini", structure)
+		self._Write(self._directory / "config.entity.ini",    entity)
+
+	def _Relative(self, path):
+		return Path(path).relative_to(self._directory).as_posix()
+
+	def _WriteFilesFiles(self, host):
+		commonFile = self._directory / "src" / "common" / "common.files"
+		lines = ["# shared VHDL packages"]
+		lines.extend('vhdl\t\tpoc\t"src/common/common_{0}.vhdl"'.format(index) for index in range(self._commonFiles))
+		lines.append('library\tosvvm\t"temp/precompiled/osvvm"')
+		self._Write(commonFile, lines)
+		self._filesFiles.append(commonFile)
+
+		for ipCore in host.Root[LIBRARY_NAME].GetAllEntities():
+			testbench =     next(ipCore.GetTestbenches())
+			ipSection =     ipCore.ConfigSection
+			ipFilesFile =   Path(ipSection['FilesFile'])
+			ipSourceDir =   self._Relative(ipSection['SrcDir'])
+			prefix =        "{0}_{1}".format(ipSection['EntityPrefix'], ipCore.Name)
+
+			lines = [
+				"# {0!s}".format(ipCore),
+				'include\t\t"{0}"'.format(self._Relative(commonFile))
+			]
+			lines.extend('vhdl\t\tpoc\t"{0}/{1}_{2}.vhdl"'.format(ipSourceDir, prefix, index) for index in range(self._files))
+			lines.extend([
+				'if (DeviceVendor = "Xilinx") then',
+				'\tvhdl\tpoc\t"{0}/{1}_xilinx.vhdl"'.format(ipSourceDir, prefix),
+				'elseif (DeviceVendor = "Altera") then',
+				'\tvhdl\tpoc\t"{0}/{1}_altera.vhdl"'.format(ipSourceDir, prefix),
+				'else',
+				'\tvhdl\tpoc\t"{0}/{1}_generic.vhdl"'.format(ipSourceDir, prefix),
+				'end if'
+			])
+			self._Write(ipFilesFile, lines)
+			self._filesFiles.append(ipFilesFile)
+
+			rulesFile = ipFilesFile.with_suffix(".rules")
+			self._Write(rulesFile, [
+				"# {0!s}".format(ipCore),
+				"PreProcessRules",
+				'\tCopy "{0}/{1}_0.vhdl" To "temp/{1}_0.vhdl"'.format(ipSourceDir, prefix),
+				'\tFile "temp/{0}_0.vhdl"'.format(prefix),
+				'\t\tReplace "constant DEBUG : boolean := TRUE" With "constant DEBUG : boolean := FALSE"',
+				'\tEnd File',
+				"End PreProcessRules",
+				"PostProcessRules",
+				'\tDelete "temp/{0}_0.vhdl"'.format(prefix),
+				'\tFile "netlist/{0}.ngc"'.format(prefix),
+				'\t\tAppendLine "-- generated"',
+				'\tEnd File',
+				"End PostProcessRules"
+			])
+			self._rulesFiles.append(rulesFile)
+
+			testbenchSourceDir = self._Relative(testbench.ConfigSection['TBDir'])
+			lines = [
+				"# {0!s}".format(testbench),
+				'include\t\t"{0}"'.format(self._Relative(ipFilesFile)),
+				'if (Tool in ["GHDL", "Mentor_vSim", "Aldec_aSim"]) then',
+				'\tvhdl\ttest\t"{0}/{1}.vhdl"'.format(testbenchSourceDir, testbench.ModuleName),
+				'else',
+				'\tvhdl\ttest\t"{0}/{1}_legacy.vhdl"'.format(testbenchSourceDir, testbench.ModuleName),
+				'end if'
+			]
+			self._Write(testbench.FilesFile, lines)
+			self._filesFiles.append(testbench.FilesFile)
+
+	def _WriteLogs(self):
+		ghdl =  ["Linking in memory", "Starting simulation"]
+		vsim =  ["# Loading std.standard", "# Loading ieee.std_logic_1164(body)", "# //  Questa Sim-64", "# //  Version 10.5c"]
+		for index in range(self._logLines):
+			kind = index % 10
+			if (kind == 0):
+				ghdl.append("tb/arith/arith_prng_tb.vhdl:{0}:7:@{1}ns:(report note): Iteration {1} done.".format(100 + index % 300, index))
+				vsim.append("# ** Note: Iteration {0} done.".format(index))
+			elif (kind == 1):
+				ghdl.append("tb/arith/arith_prng_tb.vhdl:{0}:7:@{1}ns:(assertion warning): Unexpected value.".format(100 + index % 300, index))
+				vsim.append("# ** Warning: Unexpected value at {0} ns.".format(index))
+			else:
+				ghdl.append("Value {0}: 0x{1:08X}".format(index, (index * 2654435761) & 0xFFFFFFFF))
+				vsim.append("# Value {0}: 0x{1:08X}".format(index, (index * 2654435761) & 0xFFFFFFFF))
+
+		report = [
+			"========================================",
+			"POC TESTBENCH REPORT",
+			"========================================",
+			"Assertions   {0}".format(self._logLines),
+			"  failed     0",
+			"Processes    1",
+			"  active     0",
+			"Tests        1",
+			"========================================",
+			"SIMULATION RESULT = PASSED",
+			"========================================"
+		]
+		ghdl.extend(report)
+		vsim.extend("# " + line for line in report)
+
+		self._Write(self.GHDLLogFile, ghdl)
+		self._Write(self.VSimLogFile, vsim)
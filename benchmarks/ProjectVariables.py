@@ -0,0 +1,90 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+#
+# ==============================================================================
+# Authors:          Patrick Lehmann
+#
+# Python Module:    Benchmark of the project variable collection used by *.files parsing.
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2018 Patrick Lehmann - Bötzingen, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+from argparse                 import ArgumentParser
+from functools                import reduce
+from operator                 import or_
+from timeit                   import repeat
+
+from lib.Functions            import merge
+from pyIPCMI.Base.Project     import Project, Environment, ToolChain, Tool, VHDLVersion
+from pyIPCMI.DataBase.Config  import Board
+
+
+__api__ = [
+	'Main'
+]
+__all__ = __api__
+
+
+def _LegacyMerge(*dicts):
+	"""The former :py:func:`lib.Functions.merge` implementation as a reference."""
+	return {k : reduce(lambda d,x: x.get(k, d), dicts, None) for k in reduce(or_, map(lambda x: x.keys(), dicts), set()) }
+
+
+def _CreateProject():
+	project =               Project("benchmark")
+	project.RootDirectory = "."
+	project.Board =         Board(None, "custom", "XC7K325T-2FFG900")
+	project.Environment =   Environment.Simulation
+	project.ToolChain =     ToolChain.GHDL_GTKWave
+	project.Tool =          Tool.GHDL
+	project.VHDLVersion =   VHDLVersion.VHDL2008
+	return project
+
+
+def _GetUncachedVariables(project):
+	# a no-op assignment discards the cached variables, like any real change does
+	project.Tool = project.Tool
+	return project.GetVariables()
+
+
+def Main():
+	argParser = ArgumentParser(description="Measure the cost of collecting project variables per *.files evaluation.")
+	argParser.add_argument("--number", type=int, default=20000, help="Evaluations per measurement.")
+	argParser.add_argument("--repeat", type=int, default=5,     help="Measurements per variant; the fastest one is reported.")
+	args = argParser.parse_args()
+
+	project =     _CreateProject()
+	variables =   [project.GetVariables(), project.Board.GetVariables(), project.Device.GetVariables()]
+
+	variants = [
+		("legacy merge",          lambda: _LegacyMerge(*variables)),
+		("merge",                 lambda: merge(*variables)),
+		("GetVariables (miss)",   lambda: _GetUncachedVariables(project)),
+		("GetVariables (hit)",    lambda: project.GetVariables())
+	]
+
+	print("{0: <24} {1: >12}".format("Variant", "us/eval"))
+	print("-" * 37)
+	for name, func in variants:
+		timings = repeat(func, number=args.number, repeat=args.repeat)
+		print("{0: <24} {1: >12.2f}".format(name, min(timings) / args.number * 1e6))
+
+
+if (__name__ == "__main__"):
+	Main()
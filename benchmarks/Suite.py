@@ -0,0 +1,255 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+#
+# ==============================================================================
+# Authors:          Patrick Lehmann
+#
+# Python Module:    Benchmark suite for pyIPCMI's Python-side hot paths.
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2018 Patrick Lehmann - Bötzingen, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+"""Time configuration loading, namespace construction, FQN resolution,
+``*.files`` and ``*.rules`` parsing, project construction and simulator
+output filtering on a synthetic installation (see :py:mod:`benchmarks.Fixtures`).
+
+Results can be written as JSON and compared against a stored baseline. The
+exit code is 1, if a benchmark is slower than its baseline by more than the
+tolerance.
+"""
+import json
+import platform
+import sys
+from argparse                     import ArgumentParser
+from collections                  import namedtuple
+from fnmatch                      import fnmatch
+from pathlib                      import Path
+from tempfile                     import TemporaryDirectory
+from timeit                       import repeat
+
+from lib.CallBy                   import CallByRefParam
+from pyIPCMI.Base.Project         import Environment, ToolChain, Tool, VHDLVersion
+from pyIPCMI.DataBase.Config      import Board
+from pyIPCMI.DataBase.Entity      import NamespaceRoot, FQN, WildCard
+from pyIPCMI.DataBase.Solution    import VirtualProject, FileListFile
+from pyIPCMI.Parser.FilesCodeDOM  import Document as FilesDocument
+from pyIPCMI.Parser.RulesCodeDOM  import Document as RulesDocument
+from pyIPCMI.Simulator            import PoCSimulationResultFilter
+from pyIPCMI.ToolChain.GHDL       import GHDLRunFilter
+from pyIPCMI.ToolChain.Mentor.ModelSim import VSimFilter
+
+from benchmarks.Fixtures          import Fixture, LIBRARY_NAME
+
+
+__api__ = [
+	'Benchmark',
+	'Main'
+]
+__all__ = __api__
+
+
+_FORMAT_VERSION = 1
+
+Benchmark = namedtuple("Benchmark", ["Name", "Function", "Items"])
+
+
+def _LoadConfiguration(host):
+	"""Read all configuration files and interpolate all options of the
+	generated namespace, IP core and testbench sections, including the options
+	inherited from their ``*.DEFAULT`` templates."""
+	config =    host.ReadConfiguration()
+	prefixes =  (LIBRARY_NAME + ".", "IP.", "TB.")
+	count =     0
+	for sectionName in config.sections():
+		# templates are only interpolated through the sections inheriting them
+		if ((not sectionName.startswith(prefixes)) or sectionName.endswith(".DEFAULT")):
+			continue
+		section =     config[sectionName]
+		optionNames = set(config.options(sectionName)) | set(config.options(sectionName.split(".")[0] + ".DEFAULT"))
+		for optionName in optionNames:
+			section[optionName]
+			count += 1
+	return count
+
+
+def _BuildNamespaces(host):
+	host.Config.Interpolation.clear_cache()
+	root = NamespaceRoot(host)
+	return sum(1 for _ in root[LIBRARY_NAME].GetAllEntities())
+
+
+def _CreateProject(host, board, testbench):
+	project =               VirtualProject(testbench.Parent.Name)
+	project.RootDirectory = host.Directories.Root
+	project.Environment =   Environment.Simulation
+	project.ToolChain =     ToolChain.GHDL_GTKWave
+	project.Tool =          Tool.GHDL
+	project.VHDLVersion =   VHDLVersion.VHDL2008
+	project.Board =         board
+
+	fileListFile = project.AddFile(FileListFile(testbench.FilesFile))
+	fileListFile.Parse(host)
+	fileListFile.CopyFilesToFileSet()
+	fileListFile.CopyExternalLibraries()
+	project.ExtractVHDLLibrariesFromVHDLSourceFiles()
+	return project
+
+
+def _FilterLog(lines, lineFilter):
+	simulationResult = CallByRefParam(None)
+	for _ in PoCSimulationResultFilter(lineFilter(iter(lines)), simulationResult):
+		pass
+	return simulationResult
+
+
+def _ReadContent(filePath):
+	with filePath.open('r') as fileHandle:
+		return fileHandle.read()
+
+
+def CreateBenchmarks(fixture, host):
+	"""Return all benchmarks for a generated *fixture* and its *host*."""
+	testbenches = [next(ipCore.GetTestbenches()) for ipCore in host.Root[LIBRARY_NAME].GetAllEntities()]
+	board =       Board(host)
+
+	fqns = ["PoC.*"]
+	fqns.extend(namespace + ".*" for namespace in fixture.Namespaces)
+	fqns.extend(namespace + ".ent?" for namespace in fixture.Namespaces)
+	fqns.extend(str(testbench.Parent) for testbench in testbenches)
+
+	def _ResolveFQNs():
+		# resolve like Simulator.RunAll does
+		testbenchCount = 0
+		for fqn in fqns:
+			entity = FQN(host, fqn).Entity
+			if isinstance(entity, WildCard):
+				testbenchCount += sum(1 for _ in entity.GetVHDLTestbenches())
+			else:
+				testbenchCount += int(entity.VHDLTestbench is not None)
+		return testbenchCount
+
+	filesContents = [_ReadContent(filePath) for filePath in fixture.FilesFiles]
+	rulesContents = [_ReadContent(filePath) for filePath in fixture.RulesFiles]
+	ghdlLines =     _ReadContent(fixture.GHDLLogFile).splitlines()
+	vsimLines =     _ReadContent(fixture.VSimLogFile).splitlines()
+
+	return [
+		Benchmark("config.load",      lambda: _LoadConfiguration(fixture.CreateHost()),                                     _LoadConfiguration(fixture.CreateHost())),
+		Benchmark("namespace.build",  lambda: _BuildNamespaces(host),                                                       _BuildNamespaces(host)),
+		Benchmark("fqn.resolve",      _ResolveFQNs,                                                                          len(fqns)),
+		Benchmark("files.parse",      lambda: [FilesDocument.Parse(content, printChar=False) for content in filesContents],  len(filesContents)),
+		Benchmark("rules.parse",      lambda: [RulesDocument.Parse(content, printChar=False) for content in rulesContents],  len(rulesContents)),
+		Benchmark("project.build",    lambda: [_CreateProject(host, board, testbench) for testbench in testbenches],         len(testbenches)),
+		Benchmark("filter.ghdl",      lambda: _FilterLog(ghdlLines, GHDLRunFilter),                                          len(ghdlLines)),
+		Benchmark("filter.vsim",      lambda: _FilterLog(vsimLines, VSimFilter),                                             len(vsimLines))
+	]
+
+
+def _Compare(results, baseline, tolerance):
+	"""Return a dictionary of relative changes per benchmark and a list of regressed benchmarks."""
+	baselineSeconds = {result["Name"]: result["Seconds"] for result in baseline["Results"]}
+	changes =         {}
+	regressions =     []
+	for result in results:
+		reference = baselineSeconds.get(result["Name"])
+		if ((reference is None) or (reference <= 0)):
+			continue
+		change = result["Seconds"] / reference - 1.0
+		changes[result["Name"]] = change
+		if (change > tolerance):
+			regressions.append(result["Name"])
+	return changes, regressions
+
+
+def Main():
+	argParser = ArgumentParser(description="Benchmark pyIPCMI's Python-side hot paths on a synthetic installation.")
+	argParser.add_argument("--fanout",    type=int,   default=4,      help="Sub-namespaces per namespace.")
+	argParser.add_argument("--depth",     type=int,   default=2,      help="Namespace levels below the library.")
+	argParser.add_argument("--entities",  type=int,   default=5,      help="IP cores per namespace.")
+	argParser.add_argument("--log-lines", type=int,   default=20000,  dest="LogLines", help="Lines per synthetic simulator log.")
+	argParser.add_argument("--repeat",    type=int,   default=5,      help="Measurements per benchmark; the fastest one is reported.")
+	argParser.add_argument("--filter",    default="*",                help="Run only benchmarks matching this wildcard pattern.")
+	argParser.add_argument("--output",    type=Path,  default=None,   help="Write the results as JSON to this file.")
+	argParser.add_argument("--baseline",  type=Path,  default=None,   help="Compare the results against this JSON file.")
+	argParser.add_argument("--tolerance", type=float, default=0.10,   help="Allowed relative slowdown compared to the baseline.")
+	args = argParser.parse_args()
+
+	parameters = {
+		"Fanout":     args.fanout,
+		"Depth":      args.depth,
+		"Entities":   args.entities,
+		"LogLines":   args.LogLines
+	}
+
+	baseline = None
+	if (args.baseline is not None):
+		with args.baseline.open('r') as fileHandle:
+			baseline = json.load(fileHandle)
+		if (baseline.get("Version") != _FORMAT_VERSION):
+			print("Baseline '{0!s}' has an unsupported format version.".format(args.baseline))
+			return 2
+		if (baseline.get("Parameters") != parameters):
+			print("WARNING: Baseline '{0!s}' was recorded with different fixture parameters.".format(args.baseline))
+
+	results = []
+	with TemporaryDirectory(prefix="pyIPCMI-benchmark-") as directory:
+		fixture = Fixture(directory, fanout=args.fanout, depth=args.depth, entities=args.entities, logLines=args.LogLines)
+		host =    fixture.Generate()
+
+		for benchmark in CreateBenchmarks(fixture, host):
+			if (not fnmatch(benchmark.Name, args.filter)):
+				continue
+			seconds = min(repeat(benchmark.Function, number=1, repeat=args.repeat))
+			results.append({
+				"Name":           benchmark.Name,
+				"Seconds":        seconds,
+				"Items":          benchmark.Items,
+				"ItemsPerSecond": (benchmark.Items / seconds) if (seconds > 0) else None
+			})
+
+	changes, regressions = ({}, []) if (baseline is None) else _Compare(results, baseline, args.tolerance)
+
+	print("{0: <18} {1: >12} {2: >8} {3: >14} {4: >10}".format("Benchmark", "ms", "Items", "Items/s", "Change"))
+	print("-" * 66)
+	for result in results:
+		change = changes.get(result["Name"])
+		print("{0: <18} {1: >12.3f} {2: >8} {3: >14.0f} {4: >10}".format(
+			result["Name"],
+			result["Seconds"] * 1e3,
+			result["Items"],
+			result["ItemsPerSecond"] or 0,
+			"" if (change is None) else "{0:+.1%}".format(change)
+		))
+
+	if (args.output is not None):
+		with args.output.open('w') as fileHandle:
+			json.dump({
+				"Version":    _FORMAT_VERSION,
+				"Python":     platform.python_version(),
+				"Parameters": parameters,
+				"Results":    results
+			}, fileHandle, indent=2)
+
+	if (len(regressions) > 0):
+		print("Slower than baseline by more than {0:.0%}: {1}".format(args.tolerance, ", ".join(regressions)))
+		return 1
+	return 0
+
+
+if (__name__ == "__main__"):
+	sys.exit(Main())
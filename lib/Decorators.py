@@ -27,8 +27,6 @@
 # ==============================================================================
 #
 # load dependencies
-import functools
-
 from lib.SphinxExtensions import DocumentMemberAttribute
 
 
@@ -36,7 +34,8 @@ __api__ = [
 	'MethodAlias',
 	'ILazyLoadable',
 	'LazyLoadTrigger',
-	'CachedReadOnlyProperty'
+	'CachedReadOnlyProperty',
+	'InvalidateCachedProperties'
 ]
 __all__ = __api__
 
@@ -81,21 +80,69 @@ class LazyLoadTrigger:
 
 
 class CachedReadOnlyProperty:
-	def __init__(self, func):
-		self.func =    func
-		self.__cache =  None
+	"""``CachedReadOnlyProperty`` is a read-only property, which computes its
+	value once per instance.
 
-	def __call__(self, *args):
-		if self.__cache is None:
-			result = self.func(*args)
-			self.__cache = result
-		return self.__cache
+	The value is stored in the instance's ``__dict__`` under the property's name.
+	As a non-data descriptor, the stored value shadows the property, so later
+	reads are plain attribute lookups. Classes using ``__slots__`` must declare a
+	slot named ``_cached_<name>`` for each cached property.
+
+	Use :py:func:`InvalidateCachedProperties` to discard cached values.
+	"""
+
+	def __init__(self, func):
+		self.func =       func
+		self.name =       func.__name__
+		self.slotName =   "_cached_" + func.__name__
+		self.__doc__ =    func.__doc__
+
+	def __get__(self, obj, objType=None):
+		if (obj is None):
+			return self
+
+		# a value stored in __dict__ shadows this descriptor, so only the first
+		# read of a cached property or reads from a slotted instance get here
+		try:
+			return getattr(obj, self.slotName)
+		except AttributeError:
+			pass
+
+		value = self.func(obj)
+		try:
+			obj.__dict__[self.name] = value
+		except AttributeError:
+			setattr(obj, self.slotName, value)
+		return value
 
 	def __repr__(self):
 		return self.func.__doc__
 
-	def __get__(self, obj, _):
-		functools.partial(self.__call__, obj)
+	def Invalidate(self, obj):
+		"""Discard the cached value of this property on *obj*."""
+		try:
+			instanceDict = obj.__dict__
+		except AttributeError:
+			try:
+				delattr(obj, self.slotName)
+			except AttributeError:
+				pass
+		else:
+			instanceDict.pop(self.name, None)
+
+
+def InvalidateCachedProperties(obj, *names):
+	"""Discard cached values of :py:class:`CachedReadOnlyProperty` properties on
+	*obj*, so they are recomputed on next access.
+
+	:param obj:   The instance, whose cached values are discarded.
+	:param names: Names of the properties to invalidate. If none are given, all
+	              cached properties of the instance's class are invalidated.
+	"""
+	for cls in type(obj).__mro__:
+		for name, member in cls.__dict__.items():
+			if (isinstance(member, CachedReadOnlyProperty) and ((len(names) == 0) or (name in names))):
+				member.Invalidate(obj)
 
 # def property(function):
 #   import sys
@@ -41,8 +41,11 @@ __all__ = __api__
 
 
 def merge(*dicts):
-	"""Merge 2 or more dictionaries."""
-	return {k : reduce(lambda d,x: x.get(k, d), dicts, None) for k in reduce(or_, map(lambda x: x.keys(), dicts), set()) }
+	"""Merge 2 or more dictionaries. If a key exists in multiple dictionaries, the value of the last dictionary wins."""
+	result = {}
+	for d in dicts:
+		result.update(d)
+	return result
 
 def merge_with(f, *dicts):
 	"""Merge 2 or more dictionaries. Apply function f to each element during merge."""
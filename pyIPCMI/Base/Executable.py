@@ -27,10 +27,21 @@
 # ==============================================================================
 #
 # load dependencies
+from os                     import name as os_name
 from pathlib                import Path
 from subprocess             import Popen				as Subprocess_Popen
 from subprocess             import PIPE					as Subprocess_Pipe
 from subprocess             import STDOUT				as Subprocess_StdOut
+from threading              import Event, Lock, Thread
+from time                   import monotonic
+
+if (os_name == "posix"):
+	from os                   import getpgid, killpg
+	from signal               import SIGKILL
+else:
+	from subprocess           import CREATE_NEW_PROCESS_GROUP	as Subprocess_NewProcessGroup
+	from subprocess           import DEVNULL				as Subprocess_DevNull
+	from subprocess           import call					as Subprocess_Call
 
 from pyIPCMI.Base.Exceptions        import CommonException, ExceptionBase
 from pyIPCMI.Base.Logging           import ILogable, Logger
@@ -38,6 +49,7 @@ from pyIPCMI.Base.Logging           import ILogable, Logger
 
 __api__ = [
 	'ExecutableException',
+	'ExecutableTimeoutException',
 	'CommandLineArgument',
 	'ExecutableArgument',
 	'NamedCommandLineArgument',
@@ -51,6 +63,7 @@ __api__ = [
 	'TupleArgument',          'ShortTupleArgument',           'LongTupleArgument',          'WindowsTupleArgument',
 	'CommandLineArgumentList',
 	'Environment',
+	'Watchdog',
 	'Executable'
 ]
 __all__ = __api__
@@ -65,6 +78,9 @@ class ExecutableException(ExceptionBase):
 class DryRunException(ExecutableException):
 	"""This exception is raised if a simulator runs in dry-run mode."""
 
+class ExecutableTimeoutException(ExecutableException):
+	"""This exception is raised if a process was killed by a :py:class:`Watchdog`."""
+
 
 class CommandLineArgument(type):
 	"""Base class (and meta class) for all Arguments classes."""
@@ -538,6 +554,110 @@ class Environment:
 		self.Variables = {}
 
 
+class Watchdog:
+	"""Kill all processes started within a ``with`` block, if a wall-clock
+	timeout expires or if no process wrote any output line for a given time.
+
+	Processes are started in their own process group (POSIX) or a new process
+	group (Windows). On expiry, the whole process group (POSIX) or process tree
+	(Windows, via ``taskkill /T``) is killed, so child processes of a tool are
+	killed, too.
+	"""
+	_active =         None        #: The watchdog of the currently executed ``with`` block.
+	_pollInterval =   0.5
+
+	def __init__(self, timeout=None, inactivityTimeout=None):
+		"""Class initializer
+
+		:type  timeout:           float
+		:param timeout:           Wall-clock timeout in seconds or ``None``.
+		:type  inactivityTimeout: float
+		:param inactivityTimeout: Maximum time in seconds without an output line or ``None``.
+		"""
+		self._timeout =           timeout
+		self._inactivityTimeout = inactivityTimeout
+		self._processes =         []
+		self._lock =              Lock()
+		self._stopEvent =         Event()
+		self._thread =            None
+		self._startedAt =         None
+		self._lastActivity =      None
+		self._reason =            None
+
+	@classmethod
+	def GetActive(cls):         return cls._active
+
+	@property
+	def IsEnabled(self):        return (self._timeout is not None) or (self._inactivityTimeout is not None)
+	@property
+	def HasExpired(self):       return (self._reason is not None)
+	@property
+	def Reason(self):           return self._reason
+
+	def __enter__(self):
+		if self.IsEnabled:
+			self._startedAt =     monotonic()
+			self._lastActivity =  self._startedAt
+			self._thread =        Thread(target=self._Watch, name="Watchdog", daemon=True)
+			self._thread.start()
+			Watchdog._active =    self
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		if (self._thread is not None):
+			self._stopEvent.set()
+			self._thread.join()
+			self._thread =        None
+			Watchdog._active =    None
+
+	def Register(self, process):
+		"""Register a started process to be killed on expiry."""
+		with self._lock:
+			self._processes.append(process)
+			if self.HasExpired:
+				self._Kill(process)
+
+	def Notify(self):
+		"""Report an output line, which resets the inactivity timeout."""
+		self._lastActivity = monotonic()
+
+	def _Watch(self):
+		while (not self._stopEvent.wait(self._pollInterval)):
+			now = monotonic()
+			if ((self._timeout is not None) and (now - self._startedAt > self._timeout)):
+				self._Expire("Wall-clock timeout of {0} s expired.".format(self._timeout))
+			elif ((self._inactivityTimeout is not None) and (now - self._lastActivity > self._inactivityTimeout)):
+				self._Expire("No output for {0} s.".format(self._inactivityTimeout))
+			else:
+				continue
+			break
+
+	def _Expire(self, reason):
+		with self._lock:
+			self._reason = reason
+			for process in self._processes:
+				self._Kill(process)
+
+	@staticmethod
+	def _Kill(process):
+		if (process.poll() is not None):
+			return
+		try:
+			if (os_name == "posix"):
+				killpg(getpgid(process.pid), SIGKILL)
+				return
+			if (Subprocess_Call(["taskkill", "/T", "/F", "/PID", str(process.pid)], stdout=Subprocess_DevNull, stderr=Subprocess_DevNull) == 0):
+				return
+		except OSError:
+			if (os_name == "posix"):
+				return
+		# taskkill is not available or failed; kill at least the direct child
+		try:
+			process.kill()
+		except OSError:
+			pass
+
+
 class Executable(ILogable):
 	"""Represent an executable."""
 	_pyIPCMI_BOUNDARY = "====== pyIPCMI BOUNDARY ======"
@@ -549,6 +669,8 @@ class Executable(ILogable):
 		self._dryrun =      dryrun
 		self._environment = environment #if (environment is not None) else Environment()
 		self._process =     None
+		self._watchdog =    None
+		self._workingDirectory = None
 
 		if isinstance(executablePath, str):             executablePath = Path(executablePath)
 		elif (not isinstance(executablePath, Path)):    raise ValueError("Parameter 'executablePath' is not of type str or Path.")
@@ -564,15 +686,32 @@ class Executable(ILogable):
 	def Path(self):
 		return self._executablePath
 
-	def StartProcess(self, parameterList):
+	@property
+	def WorkingDirectory(self):
+		"""Working directory of all processes started by this executable or ``None`` to inherit the current directory."""
+		return self._workingDirectory
+	@WorkingDirectory.setter
+	def WorkingDirectory(self, value):
+		self._workingDirectory = value
+
+	def StartProcess(self, parameterList, cwd=None):
 		# start child process
 		# parameterList.insert(0, str(self._executablePath))
+		if (cwd is None):
+			cwd = self._workingDirectory
 		if (not self._dryrun):
 			if (self._environment is not None):
 				envVariables = self._environment.Variables
 			else:
 				envVariables = None
 
+			# run the process in its own process group, so a watchdog can kill the whole process tree
+			self._watchdog =  Watchdog.GetActive()
+			processGroupOptions = {}
+			if (self._watchdog is not None):
+				if (os_name == "posix"):  processGroupOptions["start_new_session"] = True
+				else:                     processGroupOptions["creationflags"] =     Subprocess_NewProcessGroup
+
 			try:
 				self._process = Subprocess_Popen(
 					parameterList,
@@ -580,13 +719,21 @@ class Executable(ILogable):
 					stdout=Subprocess_Pipe,
 					stderr=Subprocess_StdOut,
 					env=envVariables,
+					cwd=(str(cwd) if (cwd is not None) else None),
 					universal_newlines=True,
-					bufsize=256
+					bufsize=256,
+					**processGroupOptions
 				)
 			except OSError as ex:
 				raise CommonException("Error while accessing '{0!s}'.".format(self._executablePath)) from ex
+
+			if (self._watchdog is not None):
+				self._watchdog.Register(self._process)
 		else:
-			self.LogDryRun("Start process: {0}".format(" ".join(parameterList)))
+			if (cwd is not None):
+				self.LogDryRun("Start process in '{0!s}': {1}".format(cwd, " ".join(parameterList)))
+			else:
+				self.LogDryRun("Start process: {0}".format(" ".join(parameterList)))
 
 	def Send(self, line, end="\n"):
 		self._process.stdin.write(line + end)
@@ -602,9 +749,13 @@ class Executable(ILogable):
 		if (not self._dryrun):
 			try:
 				for line in iter(self._process.stdout.readline, ""):
+					if (self._watchdog is not None):
+						self._watchdog.Notify()
 					yield line[:-1]
 			except Exception as ex:
 				raise ex
+			if ((self._watchdog is not None) and self._watchdog.HasExpired):
+				raise ExecutableTimeoutException("Process '{0!s}' was killed: {1}".format(self._executablePath, self._watchdog.Reason))
 			# finally:
 				# self._process.terminate()
 		else:
@@ -0,0 +1,222 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+#
+# ==============================================================================
+# Authors:          Patrick Lehmann
+#
+# Python Module:    Runtime history: a SQLite database of all testbench runs,
+#                   their results and phase timings.
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2018 Patrick Lehmann - Bötzingen, Germany
+# Copyright 2007-2016 Technische Universität Dresden - Germany
+#                     Chair of VLSI-Design, Diagnostics and Architecture
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+import sqlite3
+from collections              import namedtuple
+
+from pyIPCMI.Base.Exceptions  import CommonException
+from pyIPCMI.Base.Logging     import ILogable
+
+
+__api__ = [
+	'HistoryEntry',
+	'RuntimeHistory'
+]
+__all__ = __api__
+
+
+HistoryEntry = namedtuple("HistoryEntry", ["Testbench", "Tool", "ToolVersion", "Runs", "Last", "Average", "Maximum", "Trend"])
+
+
+class RuntimeHistory(ILogable):
+	"""Persistent record of all testbench runs in a SQLite database.
+
+	Each run stores the testbench's FQN, the tool and its version, the result
+	and the overall and per-phase run times in nanoseconds. Runtime estimates are
+	computed from the most recent runs, which completed the simulation phase.
+	"""
+	_FORMAT_VERSION =   1
+	ESTIMATE_RUNS =     5
+	_SCHEMA = """\
+		CREATE TABLE IF NOT EXISTS Runs (
+			ID          INTEGER PRIMARY KEY AUTOINCREMENT,
+			Testbench   TEXT NOT NULL,
+			Tool        TEXT NOT NULL,
+			ToolVersion TEXT NOT NULL,
+			StartTime   TEXT NOT NULL,
+			Status      TEXT NOT NULL,
+			Duration    INTEGER NOT NULL
+		);
+		CREATE INDEX IF NOT EXISTS RunsByTestbench ON Runs (Tool, Testbench, ID);
+		CREATE TABLE IF NOT EXISTS Phases (
+			RunID       INTEGER NOT NULL REFERENCES Runs (ID) ON DELETE CASCADE,
+			Phase       TEXT NOT NULL,
+			Duration    INTEGER NOT NULL
+		);
+		CREATE INDEX IF NOT EXISTS PhasesByRun ON Phases (RunID);
+		"""
+	#: Statuses of runs, which reached the end of the simulation phase.
+	COMPLETED_STATUSES = ("SimulationSuccess", "SimulationFailed", "SimulationNoAsserts", "SimulationTimeout")
+
+	def __init__(self, databaseFilePath, logger=None):
+		"""Class initializer
+
+		:type  databaseFilePath: pathlib.Path
+		:param databaseFilePath: Path of the SQLite database file.
+		"""
+		super().__init__(logger)
+
+		self._databaseFilePath =  databaseFilePath
+		self._connection =        None
+
+	@property
+	def DatabaseFilePath(self): return self._databaseFilePath
+
+	def _GetConnection(self):
+		if (self._connection is not None):
+			return self._connection
+
+		try:
+			if (not self._databaseFilePath.parent.exists()):
+				self._databaseFilePath.parent.mkdir(parents=True)
+			connection = sqlite3.connect(str(self._databaseFilePath), timeout=30)
+			version = connection.execute("PRAGMA user_version").fetchone()[0]
+			if (version not in (0, self._FORMAT_VERSION)):
+				connection.close()
+				raise CommonException("Runtime history '{0!s}' has an unsupported format version {1}.".format(self._databaseFilePath, version))
+			with connection:
+				connection.executescript(self._SCHEMA)
+				connection.execute("PRAGMA user_version = {0}".format(self._FORMAT_VERSION))
+		except (OSError, sqlite3.Error) as ex:
+			raise CommonException("Cannot open runtime history '{0!s}'.".format(self._databaseFilePath)) from ex
+
+		self._connection = connection
+		return connection
+
+	def Close(self):
+		"""Close the database connection."""
+		if (self._connection is not None):
+			self._connection.close()
+			self._connection = None
+
+	def Record(self, testbench, tool, toolVersion, testCase):
+		"""Record the result and timings of *testCase*.
+
+		:type  testbench:   str
+		:param testbench:   The testbench's FQN.
+		:type  tool:        str
+		:param tool:        Name of the simulator.
+		:type  toolVersion: str
+		:param toolVersion: Version of the simulator.
+		"""
+		connection = self._GetConnection()
+		try:
+			with connection:
+				cursor = connection.execute(
+					"INSERT INTO Runs (Testbench, Tool, ToolVersion, StartTime, Status, Duration) VALUES (?, ?, ?, ?, ?, ?)",
+					(testbench, tool, toolVersion, testCase.StartTime.replace(microsecond=0).isoformat(), testCase.Status.name, testCase.OverallRunTimeNs)
+				)
+				connection.executemany(
+					"INSERT INTO Phases (RunID, Phase, Duration) VALUES (?, ?, ?)",
+					[(cursor.lastrowid, phase, duration) for phase, duration in testCase.PhaseTimes.items()]
+				)
+		except sqlite3.Error as ex:
+			raise CommonException("Cannot write to runtime history '{0!s}'.".format(self._databaseFilePath)) from ex
+		self.LogDebug("Recorded run of '{0}' in runtime history.".format(testbench))
+
+	def _Query(self, statement, parameters=()):
+		connection = self._GetConnection()
+		try:
+			return connection.execute(statement, parameters).fetchall()
+		except sqlite3.Error as ex:
+			raise CommonException("Cannot read from runtime history '{0!s}'.".format(self._databaseFilePath)) from ex
+
+	def GetEstimates(self, tool, toolVersion):
+		"""Return a dictionary of estimated run times in nanoseconds per testbench.
+
+		The estimate is the average of the most recent completed runs with the
+		same tool version. Testbenches without such runs fall back to runs with
+		other versions of the same tool.
+		"""
+		completed = ", ".join("?" * len(self.COMPLETED_STATUSES))
+		rows = self._Query(
+			"SELECT Testbench, ToolVersion, Duration FROM Runs WHERE Tool = ? AND Status IN ({0}) ORDER BY ID DESC".format(completed),
+			(tool,) + self.COMPLETED_STATUSES
+		)
+
+		sameVersion =   {}
+		otherVersion =  {}
+		for testbench, version, duration in rows:
+			durations = (sameVersion if (version == toolVersion) else otherVersion).setdefault(testbench, [])
+			if (len(durations) < self.ESTIMATE_RUNS):
+				durations.append(duration)
+
+		estimates = {testbench: sum(durations) // len(durations) for testbench, durations in otherVersion.items()}
+		estimates.update({testbench: sum(durations) // len(durations) for testbench, durations in sameVersion.items()})
+		return estimates
+
+	def GetSlowest(self, count=10, tool=None):
+		"""Return the *count* testbenches with the highest average run time.
+
+		Each :py:class:`HistoryEntry` covers the most recent completed runs of a
+		testbench with one tool version. ``Trend`` is the relative change of the
+		last run compared to the average of the previous runs or ``None``, if there
+		is only one run.
+		"""
+		completed = ", ".join("?" * len(self.COMPLETED_STATUSES))
+		statement = "SELECT Testbench, Tool, ToolVersion, Duration FROM Runs WHERE Status IN ({0})".format(completed)
+		parameters = self.COMPLETED_STATUSES
+		if (tool is not None):
+			statement += " AND Tool = ?"
+			parameters += (tool,)
+		rows = self._Query(statement + " ORDER BY ID DESC", parameters)
+
+		groups = {}
+		for testbench, toolName, version, duration in rows:
+			durations = groups.setdefault((testbench, toolName, version), [])
+			if (len(durations) < self.ESTIMATE_RUNS):
+				durations.append(duration)
+
+		entries = []
+		for (testbench, toolName, version), durations in groups.items():
+			last =      durations[0]
+			previous =  durations[1:]
+			trend =     None
+			if (len(previous) > 0):
+				previousAverage = sum(previous) / len(previous)
+				if (previousAverage > 0):
+					trend =   (last - previousAverage) / previousAverage
+			entries.append(HistoryEntry(testbench, toolName, version, len(durations), last, sum(durations) // len(durations), max(durations), trend))
+
+		entries.sort(key=lambda entry: entry.Average, reverse=True)
+		return entries[:count]
+
+	def GetRuns(self, testbench, count=10):
+		"""Return the *count* most recent runs of *testbench* as a list of
+		``(startTime, tool, toolVersion, status, duration, phases)`` tuples, where
+		*phases* is a list of ``(phase, duration)`` tuples."""
+		runs = []
+		for runID, startTime, toolName, version, status, duration in self._Query(
+			"SELECT ID, StartTime, Tool, ToolVersion, Status, Duration FROM Runs WHERE Testbench = ? ORDER BY ID DESC LIMIT ?",
+			(testbench, count)
+		):
+			phases = self._Query("SELECT Phase, Duration FROM Phases WHERE RunID = ? ORDER BY rowid", (runID,))
+			runs.append((startTime, toolName, version, status, duration, phases))
+		return runs
@@ -0,0 +1,305 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+#
+# ==============================================================================
+# Authors:          Patrick Lehmann
+#
+# Python Module:    Incremental analysis support: file fingerprints, VHDL design
+#                   unit dependencies and a persistent analysis state.
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2018 Patrick Lehmann - Bötzingen, Germany
+# Copyright 2007-2016 Technische Universität Dresden - Germany
+#                     Chair of VLSI-Design, Diagnostics and Architecture
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+import json
+from hashlib                  import sha1
+from re                       import compile as re_compile, IGNORECASE, MULTILINE
+
+from pyIPCMI.Base.Exceptions  import CommonException
+from pyIPCMI.Base.Logging     import ILogable
+
+
+__api__ = [
+	'GetFileHash',
+	'VHDLDesignUnits',
+	'AnalysisState'
+]
+__all__ = __api__
+
+
+def GetFileHash(filePath):
+	"""
+	Compute a SHA-1 fingerprint of a file's content.
+
+	:type filePath:   pathlib.Path
+	:param filePath:  Path of the file to hash.
+	:rtype:           str
+	:return:          The hex digest of the file's content.
+	"""
+	hash = sha1()
+	with filePath.open('rb') as fileHandle:
+		for chunk in iter(lambda: fileHandle.read(65536), b""):
+			hash.update(chunk)
+	return hash.hexdigest()
+
+
+class VHDLDesignUnits:
+	"""Scan a VHDL source file for the design units it declares and for the
+	design units it references by ``use`` clauses, ``context`` references,
+	direct entity instantiations and secondary units.
+
+	Design units are represented as ``(library, unit)`` tuples in lower case.
+	The library name ``work`` is resolved to the library the file is analyzed
+	into. This is a lightweight scanner, not a VHDL parser.
+	"""
+	_COMMENT_REGEXP =       re_compile(r"--[^\n]*")
+	_ENTITY_REGEXP =        re_compile(r"\bentity\s+(\w+)\s+is\b", IGNORECASE)
+	_PACKAGE_REGEXP =       re_compile(r"\bpackage\s+(?!body\b)(\w+)\s+is\b", IGNORECASE)
+	_CONTEXT_REGEXP =       re_compile(r"\bcontext\s+(\w+)\s+is\b", IGNORECASE)
+	_CONFIGURATION_REGEXP = re_compile(r"\bconfiguration\s+(\w+)\s+of\s+(\w+)\s+is\b", IGNORECASE)
+	_ARCHITECTURE_REGEXP =  re_compile(r"\barchitecture\s+\w+\s+of\s+(\w+)\s+is\b", IGNORECASE)
+	_PACKAGE_BODY_REGEXP =  re_compile(r"\bpackage\s+body\s+(\w+)\s+is\b", IGNORECASE)
+	_USE_REGEXP =           re_compile(r"^\s*use\s+([\w\s.,]+?);", IGNORECASE | MULTILINE)
+	_CONTEXT_REF_REGEXP =   re_compile(r"^\s*context\s+(\w+)\.(\w+)\s*;", IGNORECASE | MULTILINE)
+	_INSTANTIATION_REGEXP = re_compile(r"\b(?:entity|configuration)\s+(\w+)\.(\w+)", IGNORECASE)
+
+	def __init__(self, filePath, libraryName):
+		self._provides =  set()
+		self._requires =  set()
+
+		libraryName = libraryName.lower()
+		try:
+			with filePath.open('r', encoding="utf-8", errors="replace") as fileHandle:
+				content = fileHandle.read()
+		except OSError as ex:
+			raise CommonException("Cannot read VHDL source file '{0!s}'.".format(filePath)) from ex
+
+		content = self._COMMENT_REGEXP.sub("", content).lower()
+
+		def _resolve(library, unit):
+			return (libraryName if (library == "work") else library, unit)
+
+		for match in self._ENTITY_REGEXP.finditer(content):
+			self._provides.add((libraryName, match.group(1)))
+		for match in self._PACKAGE_REGEXP.finditer(content):
+			self._provides.add((libraryName, match.group(1)))
+		for match in self._CONTEXT_REGEXP.finditer(content):
+			self._provides.add((libraryName, match.group(1)))
+		for match in self._CONFIGURATION_REGEXP.finditer(content):
+			self._provides.add((libraryName, match.group(1)))
+			self._requires.add((libraryName, match.group(2)))
+		for match in self._ARCHITECTURE_REGEXP.finditer(content):
+			self._requires.add((libraryName, match.group(1)))
+		for match in self._PACKAGE_BODY_REGEXP.finditer(content):
+			self._requires.add((libraryName, match.group(1)))
+		for match in self._USE_REGEXP.finditer(content):
+			for name in match.group(1).split(","):
+				parts = [part.strip() for part in name.split(".")]
+				if (len(parts) >= 2):
+					self._requires.add(_resolve(parts[0], parts[1]))
+		for match in self._CONTEXT_REF_REGEXP.finditer(content):
+			self._requires.add(_resolve(match.group(1), match.group(2)))
+		for match in self._INSTANTIATION_REGEXP.finditer(content):
+			self._requires.add(_resolve(match.group(1), match.group(2)))
+
+		# a design unit declared in the same file is no external dependency
+		self._requires -= self._provides
+
+	@property
+	def Provides(self):   return self._provides
+	@property
+	def Requires(self):   return self._requires
+
+
+class AnalysisState(ILogable):
+	"""Persistent record of all VHDL source files analyzed into a tool's working
+	directory.
+
+	For each file (keyed by library and path), the state stores the file's size,
+	modification time, content hash, the tool options used for analysis and the
+	scanned design unit dependencies. Each analysis gets a sequence number, which
+	is recorded for the design units declared by the analyzed file, and each file
+	records the sequence numbers of the design units it required when it was
+	analyzed. A file is outdated, if its content or the analysis options changed,
+	if it depends on a design unit declared in another outdated file, or if such
+	a design unit was reanalyzed after the file, e.g. by a run with another file
+	list.
+	"""
+	_FORMAT_VERSION = 2
+
+	def __init__(self, stateFilePath, logger=None):
+		"""Class initializer
+
+		:type  stateFilePath: pathlib.Path
+		:param stateFilePath: Path of the JSON file to persist the analysis state.
+		"""
+		super().__init__(logger)
+
+		self._stateFilePath = stateFilePath
+		self._files =         {}
+		self._units =         {}
+		self._sequence =      0
+		self._pending =       {}
+
+	@property
+	def StateFilePath(self):  return self._stateFilePath
+
+	@staticmethod
+	def _GetKey(file):
+		return "{0}:{1}".format(file.LibraryName.lower(), file.Path.as_posix())
+
+	def Load(self):
+		"""Load the analysis state from disk. A missing or unreadable state file
+		results in an empty state, so all files are analyzed."""
+		self._files =     {}
+		self._units =     {}
+		self._sequence =  0
+		self._pending =   {}
+		if (not self._stateFilePath.exists()):
+			self.LogDebug("No analysis state found at '{0!s}'.".format(self._stateFilePath))
+			return
+
+		try:
+			with self._stateFilePath.open('r') as fileHandle:
+				state = json.load(fileHandle)
+		except (OSError, ValueError) as ex:
+			self.LogWarning("Ignoring unreadable analysis state '{0!s}': {1!s}".format(self._stateFilePath, ex))
+			return
+
+		if (state.get("Version") != self._FORMAT_VERSION):
+			self.LogDebug("Ignoring analysis state with an unsupported format version.")
+			return
+		self._files =     state.get("Files", {})
+		self._units =     state.get("Units", {})
+		self._sequence =  state.get("Sequence", 0)
+
+	def Save(self):
+		"""Write the analysis state to disk."""
+		state = {
+			"Version":  self._FORMAT_VERSION,
+			"Sequence": self._sequence,
+			"Units":    self._units,
+			"Files":    self._files
+		}
+		try:
+			with self._stateFilePath.open('w') as fileHandle:
+				json.dump(state, fileHandle, indent=1, sort_keys=True)
+		except OSError as ex:
+			raise CommonException("Cannot write analysis state '{0!s}'.".format(self._stateFilePath)) from ex
+
+	def RemoveLibrary(self, libraryName):
+		"""Forget all files analyzed into the VHDL library *libraryName*, e.g.
+		because the library was created anew and is empty."""
+		prefix = libraryName.lower() + ":"
+		for key in [key for key in self._files if key.startswith(prefix)]:
+			del self._files[key]
+
+	def _GetFingerprint(self, file, entry):
+		"""Return a new state entry for *file*, if the file changed compared to
+		*entry*, otherwise ``None``. Size and modification time are checked first,
+		so unchanged files are not read."""
+		stat = file.Path.stat()
+		if ((entry is not None) and (entry["Size"] == stat.st_size) and (entry["MTime"] == stat.st_mtime_ns)):
+			return None
+
+		hash = GetFileHash(file.Path)
+		if ((entry is not None) and (entry["Hash"] == hash)):
+			# only touched; refresh the timestamp but keep the analysis result
+			entry["Size"] =   stat.st_size
+			entry["MTime"] =  stat.st_mtime_ns
+			return None
+
+		units = VHDLDesignUnits(file.Path, file.LibraryName)
+		return {
+			"Size":     stat.st_size,
+			"MTime":    stat.st_mtime_ns,
+			"Hash":     hash,
+			"Provides": sorted(".".join(unit) for unit in units.Provides),
+			"Requires": sorted(".".join(unit) for unit in units.Requires)
+		}
+
+	def GetOutdatedFiles(self, files, options):
+		"""Return all files, which need to be (re-)analyzed.
+
+		Files must be passed in analysis order. A single pass propagates changes
+		from a file to all following files depending on one of its design units.
+		Outdated files are removed from the state until they are reported as
+		analyzed by :py:meth:`Update`.
+
+		:type  files:   list
+		:param files:   VHDL source files in analysis order.
+		:type  options: str
+		:param options: A string describing all analysis options, which affect the analysis result.
+		:rtype:         list
+		:return:        The outdated files in analysis order.
+		"""
+		outdatedFiles = []
+		dirtyUnits =    set()
+		for file in files:
+			key =     self._GetKey(file)
+			entry =   self._files.get(key)
+			newEntry = self._GetFingerprint(file, entry)
+
+			if (newEntry is not None):
+				reason = "new file" if (entry is None) else "content changed"
+			elif (entry["Options"] != options):
+				reason = "options changed"
+				newEntry = entry
+			elif (not dirtyUnits.isdisjoint(entry["Requires"])):
+				reason = "dependency changed"
+				newEntry = entry
+			elif self._IsDependencyReanalyzed(entry):
+				reason = "dependency reanalyzed"
+				newEntry = entry
+			else:
+				continue
+
+			self.LogDebug("Outdated: '{0!s}' ({1})".format(file.Path, reason))
+			newEntry["Options"] = options
+			self._pending[key] =  newEntry
+			self._files.pop(key, None)
+			dirtyUnits.update(newEntry["Provides"])
+			outdatedFiles.append(file)
+
+		return outdatedFiles
+
+	def _IsDependencyReanalyzed(self, entry):
+		"""Return true, if a design unit required by *entry* was reanalyzed after
+		the entry's file was analyzed."""
+		dependencies = entry["Dependencies"]
+		return any((self._units.get(unit, 0) > dependencies.get(unit, 0)) for unit in entry["Requires"])
+
+	def Update(self, files):
+		"""Mark *files* as successfully analyzed. Files must be passed in analysis
+		order, so the recorded dependencies refer to the latest analysis of each
+		required design unit."""
+		for file in files:
+			key = self._GetKey(file)
+			try:
+				entry = self._pending.pop(key)
+			except KeyError:
+				continue
+
+			self._sequence +=       1
+			entry["Sequence"] =     self._sequence
+			entry["Dependencies"] = {unit: self._units[unit] for unit in entry["Requires"] if (unit in self._units)}
+			for unit in entry["Provides"]:
+				self._units[unit] =   self._sequence
+			self._files[key] =      entry
@@ -0,0 +1,119 @@
+# EMACS settings: -*-	tab-width: 2; indent-tabs-mode: t; python-indent-offset: 2 -*-
+# vim: tabstop=2:shiftwidth=2:noexpandtab
+# kate: tab-width 2; replace-tabs off; indent-width 2;
+#
+# ==============================================================================
+# Authors:          Patrick Lehmann
+#
+# Python Module:    Built-in CPU and memory profiling of a pyIPCMI command.
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2018 Patrick Lehmann - Bötzingen, Germany
+# Copyright 2007-2016 Technische Universität Dresden - Germany
+#                     Chair of VLSI-Design, Diagnostics and Architecture
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+# load dependencies
+import cProfile
+import pstats
+import tracemalloc
+from datetime                 import datetime
+from io                       import StringIO
+
+from pyIPCMI.Base.Exceptions  import CommonException
+from pyIPCMI.Base.Logging     import ILogable
+
+
+__api__ = [
+	'Profiler'
+]
+__all__ = __api__
+
+
+class Profiler(ILogable):
+	"""Profile a whole pyIPCMI command.
+
+	``cpu`` runs the command under :py:mod:`cProfile`, dumps the statistics into
+	a ``*.pstats`` file and prints the functions with the highest cumulative
+	time. ``mem`` traces all allocations with :py:mod:`tracemalloc` and prints
+	the current and peak memory usage and the top allocation sites at the end
+	of each phase reported by :py:meth:`Phase`.
+	"""
+	KINDS =       ("cpu", "mem")
+	TOP_COUNT =   20
+
+	def __init__(self, kind, logger=None):
+		if (kind not in self.KINDS):
+			raise CommonException("Unknown profile kind '{0}'. Expected one of: {1}.".format(kind, ", ".join(self.KINDS)))
+		super().__init__(logger)
+
+		self._kind =      kind
+		self._profile =   None
+		self._startAt =   None
+
+	@property
+	def Kind(self):     return self._kind
+
+	def Start(self):
+		self._startAt = datetime.now()
+		if (self._kind == "cpu"):
+			self._profile = cProfile.Profile()
+			self._profile.enable()
+		else:
+			tracemalloc.start()
+
+	def Phase(self, phase):
+		"""Report the memory usage at the end of *phase*."""
+		if ((self._kind != "mem") or (not tracemalloc.is_tracing())):
+			return
+
+		current, peak = tracemalloc.get_traced_memory()
+		snapshot =      tracemalloc.take_snapshot().filter_traces((
+			tracemalloc.Filter(False, tracemalloc.__file__),
+			tracemalloc.Filter(False, __file__),
+			tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+			tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>")
+		))
+		self.LogNormal("Memory profile after phase '{0}': current {1:.1f} KiB, peak {2:.1f} KiB".format(phase, current / 1024, peak / 1024))
+		for statistic in snapshot.statistics("lineno")[:self.TOP_COUNT]:
+			frame = statistic.traceback[0]
+			self.LogNormal("  {0: >10.1f} KiB  {1: >8}x  {2}:{3}".format(statistic.size / 1024, statistic.count, frame.filename, frame.lineno))
+
+	def Stop(self, outputDirectory):
+		"""Stop profiling and write the report.
+
+		:type  outputDirectory: pathlib.Path
+		:param outputDirectory: Directory for the ``*.pstats`` file of a CPU profile.
+		"""
+		if (self._kind == "mem"):
+			self.Phase("Total")
+			tracemalloc.stop()
+			return
+
+		self._profile.disable()
+		statsFilePath = outputDirectory / "profile-{0:%Y%m%d-%H%M%S}.pstats".format(self._startAt)
+		try:
+			outputDirectory.mkdir(parents=True, exist_ok=True)
+			self._profile.dump_stats(str(statsFilePath))
+		except OSError as ex:
+			raise CommonException("Cannot write CPU profile '{0!s}'.".format(statsFilePath)) from ex
+
+		stream = StringIO()
+		pstats.Stats(self._profile, stream=stream).sort_stats("cumulative").print_stats(self.TOP_COUNT)
+		self.LogNormal("CPU profile written to '{0!s}'.".format(statsFilePath))
+		for line in stream.getvalue().splitlines():
+			if (line.strip() != ""):
+				self.LogNormal("  " + line)
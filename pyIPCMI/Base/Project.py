@@ -248,6 +248,7 @@ class Project:
 		self._toolChain =             ToolChain.Any
 		self._tool =                  Tool.Any
 		self._vhdlVersion =           VHDLVersion.Any
+		self._variables =             None
 
 		self.CreateFileSet("default", setDefault=True)
 
@@ -263,6 +264,7 @@ class Project:
 	def RootDirectory(self, value):
 		if isinstance(value, str):  value = Path(value)
 		self._rootDirectory = value
+		self._variables =     None
 
 	@property
 	def Board(self):
@@ -273,8 +275,9 @@ class Project:
 		if isinstance(value, str):
 			value = Board(value)
 		elif (not isinstance(value, Board)):            raise ValueError("Parameter 'board' is not of type Board.")
-		self._board =   value
-		self._device =  value.Device
+		self._board =     value
+		self._device =    value.Device
+		self._variables = None
 
 	@property
 	def Device(self):
@@ -285,28 +288,37 @@ class Project:
 		if isinstance(value, (str, Device)):
 			board = Board("custom", value)
 		else:                                            raise ValueError("Parameter 'device' is not of type str or Device.")
-		self._board =   board
-		self._device =  board.Device
+		self._board =     board
+		self._device =    board.Device
+		self._variables = None
 
 	@property
 	def Environment(self):        return self._environment
 	@Environment.setter
-	def Environment(self, value): self._environment = value
+	def Environment(self, value):
+		self._environment = value
+		self._variables =   None
 
 	@property
 	def ToolChain(self):          return self._toolChain
 	@ToolChain.setter
-	def ToolChain(self, value):   self._toolChain = value
+	def ToolChain(self, value):
+		self._toolChain = value
+		self._variables = None
 
 	@property
 	def Tool(self):               return self._tool
 	@Tool.setter
-	def Tool(self, value):        self._tool = value
+	def Tool(self, value):
+		self._tool =      value
+		self._variables = None
 
 	@property
 	def VHDLVersion(self):        return self._vhdlVersion
 	@VHDLVersion.setter
-	def VHDLVersion(self, value): self._vhdlVersion = value
+	def VHDLVersion(self, value):
+		self._vhdlVersion = value
+		self._variables =   None
 
 
 	def CreateFileSet(self, name, setDefault=True):
@@ -401,15 +413,23 @@ class Project:
 		self._externalVHDLLibraries.append(library)
 
 	def GetVariables(self):
-		result = {
-			"ProjectName":      self._name,
-			"RootDirectory":    str(self._rootDirectory),
-			"Environment":      self._environment.name,
-			"ToolChain":        self._toolChain.name,
-			"Tool":             self._tool.name,
-			"VHDLVersion":      self._vhdlVersion.value
-		}
-		return merge(result, self._board.GetVariables(), self._device.GetVariables())
+		"""Return a new dictionary of all project, board and device variables.
+
+		The merged dictionary is cached until the root directory, board, device,
+		environment, tool chain, tool or VHDL version changes. Callers get a copy,
+		so they can add their own variables.
+		"""
+		if (self._variables is None):
+			result = {
+				"ProjectName":      self._name,
+				"RootDirectory":    str(self._rootDirectory),
+				"Environment":      self._environment.name,
+				"ToolChain":        self._toolChain.name,
+				"Tool":             self._tool.name,
+				"VHDLVersion":      self._vhdlVersion.value
+			}
+			self._variables = merge(result, self._board.GetVariables(), self._device.GetVariables())
+		return self._variables.copy()
 
 	def pprint(self, indent=0):
 		_indent = "  " * indent
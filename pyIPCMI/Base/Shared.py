@@ -27,9 +27,14 @@
 # ==============================================================================
 #
 # load dependencies
+import atexit
+import json
 import shutil
 from datetime           import datetime
-from os                 import chdir
+from hashlib            import sha1
+from itertools          import count
+from os                 import getpid
+from threading          import Lock, Thread
 
 from pyIPCMI.Base import IHost
 from lib.Functions      import Init
@@ -51,18 +56,52 @@ __all__ = __api__
 def to_time(seconds):
 	"""
 	Convert *n* seconds to a :py:class:`str` with this pattern: "{min}:{sec:02}".
+	Durations below one minute are formatted with a sub-second resolution.
 
-	:type seconds:  int
+	:type seconds:  int or float
 	:param seconds: Number of seconds to be converted.
 	:rtype:         str
-	:return:        Returns a string formatted as #:##. E.g. "1:05"
+	:return:        Returns a string formatted as #:## or #.##. E.g. "1:05" or "0.42"
 	"""
+	if (seconds < 60):
+		return "{sec:.2f}".format(sec=seconds)
 
+	seconds = int(seconds)
 	minutes = int(seconds / 60)
 	seconds -= minutes * 60
 	return "{min}:{sec:02}".format(min=minutes, sec=seconds)
 
 
+# Tombstones are renamed working directories, which are deleted in the background.
+_TOMBSTONE_INFIX =    ".tombstone-"
+_tombstoneCounter =   count()
+_tombstoneLock =      Lock()
+_tombstoneThreads =   []
+_tombstonePaths =     set()
+
+def _DeleteTombstones(paths):
+	for path in paths:
+		shutil.rmtree(str(path), ignore_errors=True)
+
+def _ReapTombstones(paths):
+	"""Delete *paths* in a background thread, unless they are already scheduled
+	for deletion by this process."""
+	with _tombstoneLock:
+		paths = [path for path in paths if (path not in _tombstonePaths)]
+		if (len(paths) == 0):
+			return
+		_tombstonePaths.update(paths)
+		thread = Thread(target=_DeleteTombstones, args=(paths,), name="TombstoneReaper", daemon=True)
+		_tombstoneThreads.append(thread)
+	thread.start()
+
+@atexit.register
+def _WaitForTombstones():
+	"""Finish all pending tombstone deletions at process exit."""
+	for thread in _tombstoneThreads:
+		thread.join()
+
+
 class Shared(ILogable):
 	"""
 	Base class for Simulator and Compiler.
@@ -142,16 +181,26 @@ class Shared(ILogable):
 			# except OSError as ex:
 			# 	raise CommonException("Error while creating '{0!s}'.".format(self.Directories.Working)) from ex
 
-		self._PrepareEnvironment_ChangeDirectory()
-		# change working directory to temporary path
-		# self.LogVerbose("Changing working directory to temporary directory.")
-		# self.LogDebug("cd \"{0!s}\"".format(self.Directories.Working))
-		# try:
-		# 	chdir(str(self.Directories.Working))
-		# except OSError as ex:
-		# 	raise CommonException("Error while changing to '{0!s}'.".format(self.Directories.Working)) from ex
-
 	def _PrepareEnvironment_PurgeDirectory(self):
+		"""Replace the working directory by a fresh one. The old directory is
+		renamed to a tombstone, which is deleted in a background thread. If it
+		can't be renamed (e.g. it's in use on Windows), its content is deleted
+		synchronously."""
+		workingDirectory =  self.Directories.Working
+		tombstone =         workingDirectory.with_name("{0}{1}{2}.{3}".format(workingDirectory.name, _TOMBSTONE_INFIX, getpid(), next(_tombstoneCounter)))
+		self.LogDebug("Moving temporary directory to tombstone: {0!s}".format(tombstone))
+		try:
+			workingDirectory.rename(tombstone)
+		except OSError as ex:
+			self.LogDebug("Cannot rename temporary directory: {0!s}".format(ex))
+			self._PrepareEnvironment_PurgeDirectoryContent()
+			return
+
+		# also reap tombstones left behind by killed processes
+		_ReapTombstones(sorted(workingDirectory.parent.glob(workingDirectory.name + _TOMBSTONE_INFIX + "*")))
+		self._PrepareEnvironment_CreatingDirectory()
+
+	def _PrepareEnvironment_PurgeDirectoryContent(self):
 		self.LogDebug("Purging temporary directory: {0!s}".format(self.Directories.Working))
 		for item in self.Directories.Working.iterdir():
 			try:
@@ -169,15 +218,6 @@ class Shared(ILogable):
 		except OSError as ex:
 			raise CommonException("Error while creating '{0!s}'.".format(self.Directories.Working)) from ex
 
-	def _PrepareEnvironment_ChangeDirectory(self):
-		"""Change working directory to temporary path 'temp/<tool>'."""
-		self.LogVerbose("Changing working directory to temporary directory.")
-		self.LogDebug("cd \"{0!s}\"".format(self.Directories.Working))
-		try:
-			chdir(str(self.Directories.Working))
-		except OSError as ex:
-			raise CommonException("Error while changing to '{0!s}'.".format(self.Directories.Working)) from ex
-
 	def _Prepare(self):
 		self.LogNormal("Preparing {0}.".format(self.TOOL.LongName))
 
@@ -232,3 +272,102 @@ class Shared(ILogable):
 					raise CommonException("Syntax error in option 'HDLParameters' within section {section}.".format(section=configSectionName))
 				result[key.strip()] = value.strip()
 		return result
+
+	def _SelectShard(self, items, shard, key):
+		"""Return the items of one shard, if a regression is split into several
+		shards, e.g. to run them on different machines.
+
+		Items are distributed by a stable hash of their key, so every shard
+		computes the same partitioning without sharing any local state like the
+		runtime history. The shard and the names of all items are recorded in the
+		test suite, so :py:meth:`CheckShardCoverage` can verify merged results.
+
+		:type  items:     list
+		:param items:     Testbenches or netlists of the whole regression.
+		:type  shard:     tuple
+		:param shard:     A tuple of ``(index, count)`` with a 1-based shard index or ``None``.
+		:type  key:       callable
+		:param key:       Returns a stable name for an item.
+		:rtype:           list
+		:return:          The shard's items in their original order.
+		"""
+		if (shard is None):
+			return items
+
+		index, count =  shard
+		names =         [key(item) for item in items]
+		selected =      [name for name in names if (int(sha1(name.encode("utf-8")).hexdigest(), 16) % count == index - 1)]
+		self._testSuite.Shard = {
+			"Index":    index,
+			"Count":    count,
+			"Items":    sorted(names),
+			"Selected": sorted(selected)
+		}
+
+		selected =      set(selected)
+		result =        [item for item, name in zip(items, names) if (name in selected)]
+		self.LogNormal("Shard {0}/{1}: selected {2} of {3} items.".format(index, count, len(result), len(items)))
+		return result
+
+	def CheckShardCoverage(self):
+		"""Check that the merged results of sharded runs contain all shards of the
+		same regression, so no testbench or netlist was dropped.
+
+		:raises CommonException: If shards are missing, duplicated or were run with
+		                         different selections.
+		"""
+		shards = self._testSuite.MergedShards
+		if (len(shards) == 0):
+			return
+
+		count = shards[0]["Count"]
+		items = shards[0]["Items"]
+		if any(((shard["Count"] != count) or (shard["Items"] != items)) for shard in shards):
+			raise CommonException("Result files belong to different sharded runs (shard count or selected items differ).")
+
+		indices =     [shard["Index"] for shard in shards]
+		missing =     sorted(set(range(1, count + 1)) - set(indices))
+		duplicates =  sorted(set(index for index in indices if (indices.count(index) > 1)))
+		if (len(duplicates) > 0):
+			raise CommonException("Result files contain shard(s) {0} more than once.".format(", ".join(str(index) for index in duplicates)))
+		if (len(missing) > 0):
+			raise CommonException("Result files of shard(s) {0} of {1} are missing.".format(", ".join(str(index) for index in missing), count))
+
+		covered =     set()
+		for shard in shards:
+			covered.update(shard["Selected"])
+		uncovered =   sorted(set(items) - covered)
+		if (len(uncovered) > 0):
+			raise CommonException("Merged shards do not cover {0} item(s): {1}".format(len(uncovered), ", ".join(uncovered)))
+		self.LogVerbose("Merged shards 1..{0} cover all {1} items.".format(count, len(items)))
+
+	def WriteResultFile(self, resultFilePath):
+		"""Write the serialized test suite to a JSON file, so it can be merged with
+		the results of other shards.
+
+		:type  resultFilePath:  pathlib.Path
+		:param resultFilePath:  Path of the result file.
+		"""
+		self.LogVerbose("Writing results to '{0!s}'.".format(resultFilePath))
+		try:
+			resultFilePath.parent.mkdir(parents=True, exist_ok=True)
+			with resultFilePath.open('w') as fileHandle:
+				json.dump(self._testSuite.Serialize(), fileHandle, indent=1)
+		except OSError as ex:
+			raise CommonException("Cannot write result file '{0!s}'.".format(resultFilePath)) from ex
+
+	def ReadResultFile(self, resultFilePath):
+		"""Merge the results from a JSON file written by :py:meth:`WriteResultFile`
+		into the test suite.
+
+		:type  resultFilePath:  pathlib.Path
+		:param resultFilePath:  Path of the result file.
+		"""
+		self.LogVerbose("Reading results from '{0!s}'.".format(resultFilePath))
+		try:
+			with resultFilePath.open('r') as fileHandle:
+				self._testSuite.Merge(json.load(fileHandle))
+		except OSError as ex:
+			raise CommonException("Cannot read result file '{0!s}'.".format(resultFilePath)) from ex
+		except (ValueError, KeyError, TypeError) as ex:
+			raise CommonException("Result file '{0!s}' is not valid.".format(resultFilePath)) from ex
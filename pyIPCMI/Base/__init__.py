@@ -46,6 +46,7 @@ class IHost(ILogable):
 	# instance fields
 	Platform =    "string"
 	Config =   ExtendedConfigParser()
+	Profiler =    None
 
 	# methods
 	def SaveAndReloadConfiguration(self): pass
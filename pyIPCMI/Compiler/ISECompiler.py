@@ -43,22 +43,25 @@ class Compiler(BaseCompiler):
 	TOOL_CHAIN =      ToolChain.Xilinx_ISE
 	TOOL =            Tool.Any
 
-	def __init__(self, host, dryRun, noCleanUp):
-		super().__init__(host, dryRun, noCleanUp)
+	def __init__(self, host, dryRun, noCleanUp, noCache=False):
+		super().__init__(host, dryRun, noCleanUp, noCache)
 
 		self._PrepareCompiler()
 
 	def _PrepareCompiler(self):
 		self.LogVerbose("Preparing Meta-Compiler for the Xilinx ISE tool chain.")
 
-	def RunAll(self, fqnList, *args, **kwargs):
+	def RunAll(self, fqnList, *args, shard=None, **kwargs):
+		entities = []
 		for fqn in fqnList:
 			entity = fqn.Entity
 			if (isinstance(entity, WildCard)):
-				for ent in entity.GetEntities():
-					self.Run(ent, args, kwargs)
+				entities.extend(entity.GetEntities())
 			else:
-				self.Run(entity, args, kwargs)
+				entities.append(entity)
+
+		for entity in self._SelectShard(entities, shard, str):
+			self.Run(entity, args, kwargs)
 
 	def Run(self, entity, args, kwargs):
 		self.LogVerbose("Checking '{0!s}' for dependencies...".format(entity))
@@ -72,8 +75,15 @@ class Compiler(BaseCompiler):
 
 		for tool,fqn in dependencies:
 			if (tool is Tool.Xilinx_CoreGen):
-				compiler = XCOCompiler(self.Host, self.DryRun, self.NoCleanUp)
+				compiler = XCOCompiler(self.Host, self.DryRun, self.NoCleanUp, self.NoCache)
 				compiler.RunAll([fqn], *args, **kwargs)
+				self._MergeTestSuite(compiler)
 			elif (tool is Tool.Xilinx_XST):
-				compiler = XSTCompiler(self.Host, self.DryRun, self.NoCleanUp)
+				compiler = XSTCompiler(self.Host, self.DryRun, self.NoCleanUp, self.NoCache)
 				compiler.RunAll([fqn], *args, **kwargs)
+				self._MergeTestSuite(compiler)
+
+	def _MergeTestSuite(self, compiler):
+		"""Add the results of a sub-compiler to this compiler's test suite."""
+		self._testSuite.LoadDict(compiler.TestSuite.ToDict())
+		self._testSuite.IsAborted |= compiler.TestSuite.IsAborted
@@ -33,7 +33,6 @@ from pathlib                    import Path
 
 from pyIPCMI.Base.Exceptions            import PlatformNotSupportedException
 from pyIPCMI.Base.Project               import ToolChain, Tool, VHDLVersion
-from pyIPCMI.DataBase.Entity            import WildCard
 from pyIPCMI.ToolChain.Lattice          import LatticeException
 from pyIPCMI.ToolChain.Lattice.Diamond  import Diamond, SynthesisArgumentFile
 from pyIPCMI.Compiler                   import CompilerException, SkipableCompilerException, CompileState, Compiler as BaseCompiler
@@ -49,8 +48,8 @@ class Compiler(BaseCompiler):
 	TOOL_CHAIN =      ToolChain.Lattice_Diamond
 	TOOL =            Tool.Lattice_LSE
 
-	def __init__(self, host, dryRun, noCleanUp):
-		super().__init__(host, dryRun, noCleanUp)
+	def __init__(self, host, dryRun, noCleanUp, noCache=False):
+		super().__init__(host, dryRun, noCleanUp, noCache)
 
 		self._vhdlVersion = VHDLVersion.VHDL2008
 
@@ -74,28 +73,8 @@ class Compiler(BaseCompiler):
 		self._toolChain =       Diamond(self.Host.Platform, self.DryRun, binaryPath, version, logger=self.Logger)
 		self._toolChain.PreparseEnvironment(installationDirectory)
 
-	def RunAll(self, fqnList, *args, **kwargs):
-		"""Run a list of netlist compilations. Expand wildcards to all selected netlists."""
-		self._testSuite.StartTimer()
-		self.Logger.BaseIndent = int(len(fqnList) > 1)
-		try:
-			for fqn in fqnList:
-				entity = fqn.Entity
-				if (isinstance(entity, WildCard)):
-					self.Logger.BaseIndent = 1
-					for netlist in entity.GetLatticeNetlists():
-						self.TryRun(netlist, *args, **kwargs)
-				else:
-					netlist = entity.LatticeNetlist
-					self.TryRun(netlist, *args, **kwargs)
-		except KeyboardInterrupt:
-			self.LogError("Received a keyboard interrupt.")
-		finally:
-			self._testSuite.StopTimer()
-
-		self.PrintOverallCompileReport()
-
-		return self._testSuite.IsAllSuccess
+	def _GetNetlists(self, wildcard):   return wildcard.GetLatticeNetlists()
+	def _GetNetlist(self, entity):      return entity.LatticeNetlist
 
 	def Run(self, netlist, board):
 		super().Run(netlist, board)
@@ -112,9 +91,11 @@ class Compiler(BaseCompiler):
 		self._RunPreReplace(netlist)
 		self._preTasksTime = self._GetTimeDeltaSinceLastEvent()
 
-		self.LogNormal("Running Lattice Diamond LSE...")
 		self._state = CompileState.Compile
-		self._RunCompile(netlist, lseArgumentFile)			# attach to netlist
+		if (not self._TryRestoreFromNetlistCache(netlist, board.Device, [netlist.PrjFile])):
+			self.LogNormal("Running Lattice Diamond LSE...")
+			self._RunCompile(netlist, lseArgumentFile)			# attach to netlist
+			self._StoreInNetlistCache(netlist)
 		self._compileTime = self._GetTimeDeltaSinceLastEvent()
 
 		self.LogNormal("Executing post-processing tasks...")
@@ -146,6 +127,7 @@ class Compiler(BaseCompiler):
 
 	def _RunCompile(self, netlist, lseArgumentFile):
 		synth = self._toolChain.GetSynthesizer()
+		synth.WorkingDirectory = self.Directories.Working
 		synth.Parameters[synth.SwitchProjectFile] = netlist.ModuleName + ".prj"
 
 		try:
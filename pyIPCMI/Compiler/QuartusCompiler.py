@@ -32,7 +32,6 @@ from datetime                   import datetime
 from pathlib                    import Path
 
 from pyIPCMI.Base.Project               import ToolChain, Tool
-from pyIPCMI.DataBase.Entity            import WildCard
 from pyIPCMI.ToolChain.Altera.Quartus   import QuartusException, Quartus, QuartusSettings, QuartusProjectFile
 from pyIPCMI.Compiler                   import CompilerException, SkipableCompilerException, CompileState, Compiler as BaseCompiler
 
@@ -47,8 +46,8 @@ class Compiler(BaseCompiler):
 	TOOL_CHAIN =      ToolChain.Altera_Quartus
 	TOOL =            Tool.Altera_Quartus_Map
 
-	def __init__(self, host, dryRun, noCleanUp):
-		super().__init__(host, dryRun, noCleanUp)
+	def __init__(self, host, dryRun, noCleanUp, noCache=False):
+		super().__init__(host, dryRun, noCleanUp, noCache)
 
 		configSection = host.Config['CONFIG.DirectoryNames']
 		self.Directories.Working = host.Directories.Temp / configSection['QuartusSynthesisFiles']
@@ -68,28 +67,8 @@ class Compiler(BaseCompiler):
 		version =     self.Host.Config['INSTALL.Quartus']['Version']
 		self._toolChain =    Quartus(self.Host.Platform, self.DryRun, binaryPath, version, logger=self.Logger)
 
-	def RunAll(self, fqnList, *args, **kwargs):
-		"""Run a list of netlist compilations. Expand wildcards to all selected netlists."""
-		self._testSuite.StartTimer()
-		self.Logger.BaseIndent = int(len(fqnList) > 1)
-		try:
-			for fqn in fqnList:
-				entity = fqn.Entity
-				if (isinstance(entity, WildCard)):
-					self.Logger.BaseIndent = 1
-					for netlist in entity.GetQuartusNetlists():
-						self.TryRun(netlist, *args, **kwargs)
-				else:
-					netlist = entity.QuartusNetlist
-					self.TryRun(netlist, *args, **kwargs)
-		except KeyboardInterrupt:
-			self.LogError("Received a keyboard interrupt.")
-		finally:
-			self._testSuite.StopTimer()
-
-		self.PrintOverallCompileReport()
-
-		return self._testSuite.IsAllSuccess
+	def _GetNetlists(self, wildcard):   return wildcard.GetQuartusNetlists()
+	def _GetNetlist(self, entity):      return entity.QuartusNetlist
 
 	def Run(self, netlist, board):
 		super().Run(netlist, board)
@@ -107,9 +86,11 @@ class Compiler(BaseCompiler):
 		self._RunPreReplace(netlist)
 		self._preTasksTime = self._GetTimeDeltaSinceLastEvent()
 
-		self.LogNormal("Running Altera Quartus Map...")
 		self._state = CompileState.Compile
-		self._RunCompile(netlist)
+		if (not self._TryRestoreFromNetlistCache(netlist, board.Device, [netlist.QsfFile])):
+			self.LogNormal("Running Altera Quartus Map...")
+			self._RunCompile(netlist)
+			self._StoreInNetlistCache(netlist)
 		self._compileTime = self._GetTimeDeltaSinceLastEvent()
 
 		self.LogNormal("Executing post-processing tasks...")
@@ -148,6 +129,7 @@ class Compiler(BaseCompiler):
 
 	def _RunCompile(self, netlist):
 		q2map = self._toolChain.GetMap()
+		q2map.WorkingDirectory = self.Directories.Working
 		q2map.Parameters[q2map.ArgProjectName] =  str(netlist.QsfFile)
 
 		try:
@@ -31,7 +31,6 @@ from datetime                 import datetime
 from pathlib                  import Path
 
 from pyIPCMI.Base.Project             import ToolChain, Tool, FileTypes
-from pyIPCMI.DataBase.Entity          import WildCard
 from pyIPCMI.ToolChain.Xilinx.Vivado import Vivado, VivadoException
 from pyIPCMI.Compiler                 import CompilerException, SkipableCompilerException, CompileState, Compiler as BaseCompiler
 
@@ -46,8 +45,8 @@ class Compiler(BaseCompiler):
 	TOOL_CHAIN =      ToolChain.Xilinx_Vivado
 	TOOL =            Tool.Xilinx_Synth
 
-	def __init__(self, host, dryRun, noCleanUp):
-		super().__init__(host, dryRun, noCleanUp)
+	def __init__(self, host, dryRun, noCleanUp, noCache=False):
+		super().__init__(host, dryRun, noCleanUp, noCache)
 
 		configSection = host.Config['CONFIG.DirectoryNames']
 		self.Directories.Working =  host.Directories.Temp / configSection['VivadoSynthesisFiles']
@@ -65,28 +64,8 @@ class Compiler(BaseCompiler):
 		self._toolChain =       Vivado(self.Host.Platform, self.DryRun, binaryPath, version, logger=self.Logger)
 		self._toolChain.PreparseEnvironment(installationDirectory)
 
-	def RunAll(self, fqnList, *args, **kwargs):
-		"""Run a list of netlist compilations. Expand wildcards to all selected netlists."""
-		self._testSuite.StartTimer()
-		self.Logger.BaseIndent = int(len(fqnList) > 1)
-		try:
-			for fqn in fqnList:
-				entity = fqn.Entity
-				if (isinstance(entity, WildCard)):
-					self.Logger.BaseIndent = 1
-					for netlist in entity.GetVivadoNetlists():
-						self.TryRun(netlist, *args, **kwargs)
-				else:
-					netlist = entity.VivadoNetlist
-					self.TryRun(netlist, *args, **kwargs)
-		except KeyboardInterrupt:
-			self.LogError("Received a keyboard interrupt.")
-		finally:
-			self._testSuite.StopTimer()
-
-		self.PrintOverallCompileReport()
-
-		return self._testSuite.IsAllSuccess
+	def _GetNetlists(self, wildcard):   return wildcard.GetVivadoNetlists()
+	def _GetNetlist(self, entity):      return entity.VivadoNetlist
 
 	def Run(self, netlist, board):
 		super().Run(netlist, board)
@@ -102,9 +81,11 @@ class Compiler(BaseCompiler):
 		self._RunPreReplace(netlist)
 		self._preTasksTime = self._GetTimeDeltaSinceLastEvent()
 
-		self.LogNormal("Running Xilinx Vivado Synthesis...")
 		self._state = CompileState.Compile
-		self._RunCompile(netlist)
+		if (not self._TryRestoreFromNetlistCache(netlist, board.Device, [netlist.TclFile])):
+			self.LogNormal("Running Xilinx Vivado Synthesis...")
+			self._RunCompile(netlist)
+			self._StoreInNetlistCache(netlist)
 		self._compileTime = self._GetTimeDeltaSinceLastEvent()
 
 		self.LogNormal("Executing post-processing tasks...")
@@ -129,6 +110,7 @@ class Compiler(BaseCompiler):
 		reportFilePath = self.Directories.Working / (netlist.ModuleName + ".log")
 
 		synth = self._toolChain.GetSynthesizer()
+		synth.WorkingDirectory = self.Directories.Working
 		synth.Parameters[synth.SwitchSourceFile] =  netlist.ModuleName + ".tcl"
 		synth.Parameters[synth.SwitchLogFile] =     str(reportFilePath)
 		try:
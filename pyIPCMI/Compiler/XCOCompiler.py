@@ -29,13 +29,11 @@
 #
 # load dependencies
 from datetime               import datetime
-from os                     import chdir
 from pathlib                import Path
 from shutil                 import copy as shutil_copy
 from textwrap               import dedent
 
 from pyIPCMI.Base.Project           import ToolChain, Tool
-from pyIPCMI.DataBase.Entity        import WildCard
 from pyIPCMI.ToolChain.Xilinx.ISE   import ISE, ISEException
 from pyIPCMI.Compiler               import CompilerException, SkipableCompilerException, CompileState, Compiler as BaseCompiler
 
@@ -50,8 +48,8 @@ class Compiler(BaseCompiler):
 	TOOL_CHAIN =      ToolChain.Xilinx_ISE
 	TOOL =            Tool.Xilinx_CoreGen
 
-	def __init__(self, host, dryRun, noCleanUp):
-		super().__init__(host, dryRun, noCleanUp)
+	def __init__(self, host, dryRun, noCleanUp, noCache=False):
+		super().__init__(host, dryRun, noCleanUp, noCache)
 
 		configSection = host.Config['CONFIG.DirectoryNames']
 		self.Directories.Working = host.Directories.Temp / configSection['ISECoreGeneratorFiles']
@@ -68,28 +66,8 @@ class Compiler(BaseCompiler):
 		self._toolChain =       ISE(self.Host.Platform, self.DryRun, binaryPath, version, logger=self.Logger)
 		self._toolChain.PreparseEnvironment(installationDirectory)
 
-	def RunAll(self, fqnList, *args, **kwargs):
-		"""Run a list of netlist compilations. Expand wildcards to all selected netlists."""
-		self._testSuite.StartTimer()
-		self.Logger.BaseIndent = int(len(fqnList) > 1)
-		try:
-			for fqn in fqnList:
-				entity = fqn.Entity
-				if (isinstance(entity, WildCard)):
-					self.Logger.BaseIndent = 1
-					for netlist in entity.GetCoreGenNetlists():
-						self.TryRun(netlist, *args, **kwargs)
-				else:
-					netlist = entity.CGNetlist
-					self.TryRun(netlist, *args, **kwargs)
-		except KeyboardInterrupt:
-			self.LogError("Received a keyboard interrupt.")
-		finally:
-			self._testSuite.StopTimer()
-
-		self.PrintOverallCompileReport()
-
-		return self._testSuite.IsAllSuccess
+	def _GetNetlists(self, wildcard):   return wildcard.GetCoreGenNetlists()
+	def _GetNetlist(self, entity):      return entity.CGNetlist
 
 	def Run(self, netlist, board):
 		super().Run(netlist, board)
@@ -102,9 +80,11 @@ class Compiler(BaseCompiler):
 		self._RunPreReplace(netlist)
 		self._preTasksTime = self._GetTimeDeltaSinceLastEvent()
 
-		self.LogNormal("Running Xilinx Core Generator...")
 		self._state = CompileState.Compile
-		self._RunCompile(netlist, board.Device)
+		if (not self._TryRestoreFromNetlistCache(netlist, board.Device, [netlist.XcoFile, self.Directories.Netlist / "template.cgc"])):
+			self.LogNormal("Running Xilinx Core Generator...")
+			self._RunCompile(netlist, board.Device)
+			self._StoreInNetlistCache(netlist)
 		self._compileTime = self._GetTimeDeltaSinceLastEvent()
 
 		self.LogNormal("Executing post-processing tasks...")
@@ -196,17 +176,11 @@ class Compiler(BaseCompiler):
 		except OSError as ex:
 			raise CompilerException("Error while copying '{0!s}'.".format(xcoInputFilePath)) from ex
 
-		# change working directory to temporary CoreGen path
-		self.LogDebug("cd {0!s}".format(self.Directories.Working))
-		try:
-			chdir(str(self.Directories.Working))
-		except OSError as ex:
-			raise CompilerException("Error while changing to '{0!s}'.".format(self.Directories.Working)) from ex
-
 		# running CoreGen
 		# ==========================================================================
 		self.LogVerbose("Executing CoreGen...")
 		coreGen = self._toolChain.GetCoreGenerator()
+		coreGen.WorkingDirectory =                      self.Directories.Working
 		coreGen.Parameters[coreGen.SwitchProjectFile] = "."		# use current directory and the default project name
 		coreGen.Parameters[coreGen.SwitchBatchFile] =   str(xcoFilePath)
 		coreGen.Parameters[coreGen.FlagRegenerate] =    True
@@ -32,7 +32,6 @@ from datetime                 import datetime
 from pathlib                  import Path
 
 from pyIPCMI.Base.Project             import ToolChain, Tool
-from pyIPCMI.DataBase.Entity          import WildCard
 from pyIPCMI.ToolChain.Xilinx         import XilinxProjectExportMixIn
 from pyIPCMI.ToolChain.Xilinx.ISE     import ISE, ISEException
 from pyIPCMI.Compiler                 import CompilerException, SkipableCompilerException, CompileState, Compiler as BaseCompiler
@@ -51,8 +50,8 @@ class Compiler(BaseCompiler, XilinxProjectExportMixIn):
 	class __Directories__(BaseCompiler.__Directories__):
 		XSTFiles =    None
 
-	def __init__(self, host, dryRun, noCleanUp):
-		super().__init__(host, dryRun, noCleanUp)
+	def __init__(self, host, dryRun, noCleanUp, noCache=False):
+		super().__init__(host, dryRun, noCleanUp, noCache)
 		XilinxProjectExportMixIn.__init__(self)
 
 		configSection = host.Config['CONFIG.DirectoryNames']
@@ -71,28 +70,8 @@ class Compiler(BaseCompiler, XilinxProjectExportMixIn):
 		self._toolChain =       ISE(self.Host.Platform, self.DryRun, binaryPath, version, logger=self.Logger)
 		self._toolChain.PreparseEnvironment(installationDirectory)
 
-	def RunAll(self, fqnList, *args, **kwargs):
-		"""Run a list of netlist compilations. Expand wildcards to all selected netlists."""
-		self._testSuite.StartTimer()
-		self.Logger.BaseIndent = int(len(fqnList) > 1)
-		try:
-			for fqn in fqnList:
-				entity = fqn.Entity
-				if (isinstance(entity, WildCard)):
-					self.Logger.BaseIndent = 1
-					for netlist in entity.GetXSTNetlists():
-						self.TryRun(netlist, *args, **kwargs)
-				else:
-					netlist = entity.XSTNetlist
-					self.TryRun(netlist, *args, **kwargs)
-		except KeyboardInterrupt:
-			self.LogError("Received a keyboard interrupt.")
-		finally:
-			self._testSuite.StopTimer()
-
-		self.PrintOverallCompileReport()
-
-		return self._testSuite.IsAllSuccess
+	def _GetNetlists(self, wildcard):   return wildcard.GetXSTNetlists()
+	def _GetNetlist(self, entity):      return entity.XSTNetlist
 
 	def Run(self, netlist, board):
 		super().Run(netlist, board)
@@ -111,9 +90,11 @@ class Compiler(BaseCompiler, XilinxProjectExportMixIn):
 		self._RunPreReplace(netlist)
 		self._preTasksTime = self._GetTimeDeltaSinceLastEvent()
 
-		self.LogNormal("Running Xilinx Synthesis Tool...")
 		self._state = CompileState.Compile
-		self._RunCompile(netlist)
+		if (not self._TryRestoreFromNetlistCache(netlist, board.Device, [netlist.XstFile, netlist.PrjFile])):
+			self.LogNormal("Running Xilinx Synthesis Tool...")
+			self._RunCompile(netlist)
+			self._StoreInNetlistCache(netlist)
 		self._compileTime = self._GetTimeDeltaSinceLastEvent()
 
 		self.LogNormal("Executing post-processing tasks...")
@@ -138,6 +119,7 @@ class Compiler(BaseCompiler, XilinxProjectExportMixIn):
 		reportFilePath = self.Directories.Working / (netlist.ModuleName + ".log")
 
 		xst = self._toolChain.GetXst()
+		xst.WorkingDirectory = self.Directories.Working
 		xst.Parameters[xst.SwitchIntStyle] =    "xflow"
 		xst.Parameters[xst.SwitchXstFile] =      netlist.ModuleName + ".xst"
 		xst.Parameters[xst.SwitchReportFile] =  str(reportFilePath)
@@ -26,10 +26,19 @@
 # limitations under the License.
 # ==============================================================================
 #
+from collections                  import OrderedDict
+from contextlib                   import contextmanager
 from enum                         import unique, Enum
+from hashlib                      import sha256
+from locale                       import getpreferredencoding
+from mmap                         import mmap, ACCESS_READ
+from multiprocessing              import get_context
+from os                           import getpid, unlink, link as os_link, replace as os_replace
 from pathlib                      import Path
-from re                           import compile as re_compile, subn as re_subn, IGNORECASE as RE_IGNORECASE, MULTILINE as RE_MULTILINE, DOTALL as RE_DOTALL
-from shutil                       import copy as shutil_copy
+from queue                        import Queue
+from re                           import compile as re_compile, IGNORECASE as RE_IGNORECASE, MULTILINE as RE_MULTILINE, DOTALL as RE_DOTALL
+from shutil                       import copy as shutil_copy, copy2 as shutil_copy2, copymode as shutil_copymode, rmtree as shutil_rmtree
+from tempfile                     import NamedTemporaryFile
 
 from flags                        import Flags
 
@@ -37,8 +46,11 @@ from lib.Functions                import Init
 from lib.Parser                   import ParserException
 from pyIPCMI.Base                 import IHost
 from pyIPCMI.Base.Exceptions      import ExceptionBase, SkipableException
+from pyIPCMI.Base.Incremental     import GetFileHash
+from pyIPCMI.Base.Logging         import ILogable
 from pyIPCMI.Base.Project         import Environment, VHDLVersion, FileTypes
 from pyIPCMI.Base.Shared          import Shared, to_time
+from pyIPCMI.DataBase.Entity      import WildCard
 from pyIPCMI.Parser.RulesParser   import CopyRuleMixIn, DeleteRuleMixIn, ReplaceRuleMixIn, AppendLineRuleMixIn
 from pyIPCMI.DataBase.Solution    import RulesFile
 from pyIPCMI.DataBase.TestCase    import SynthesisSuite, CompileStatus, Synthesis
@@ -56,6 +68,7 @@ __api__ = [
 	'AppendLineTask',
 	'CompileState',
 	'CompileResult',
+	'NetlistCache',
 	'Compiler'
 ]
 __all__ = __api__
@@ -145,19 +158,136 @@ class CompileResult(Enum):
 	Success =     3
 
 
+class NetlistCache(ILogable):
+	"""A content-addressed cache for generated netlist files.
+
+	Each cache entry is a directory named by a cache key. It holds a copy of all
+	files, which are consumed by the post-copy tasks of a netlist. Entries are
+	written to a temporary directory first and then renamed, so a cache entry is
+	either complete or missing.
+	"""
+	def __init__(self, directory, logger=None):
+		"""Class initializer
+
+		:type  directory: pathlib.Path
+		:param directory: The cache's root directory.
+		"""
+		super().__init__(logger)
+
+		self._directory = directory
+
+	@property
+	def Directory(self):      return self._directory
+
+	@staticmethod
+	def _GetEntryFileName(index, filePath):
+		return "{0:03}_{1}".format(index, filePath.name)
+
+	def Restore(self, key, filePaths):
+		"""Restore all cached files of entry *key* to *filePaths*. Files are
+		hardlinked if possible, otherwise copied.
+
+		:type  key:       str
+		:param key:       The cache key.
+		:type  filePaths: list
+		:param filePaths: Destination paths of the cached files.
+		:rtype:           bool
+		:return:          True, if the entry was found and restored.
+		"""
+		entryDirectory = self._directory / key
+		if (not entryDirectory.exists()):
+			return False
+
+		cachedFiles = [(entryDirectory / self._GetEntryFileName(index, filePath), filePath) for index, filePath in enumerate(filePaths)]
+		for cachedFile, _ in cachedFiles:
+			if (not cachedFile.exists()):
+				self.LogWarning("Netlist cache entry '{0}' is incomplete.".format(key))
+				return False
+
+		for cachedFile, filePath in cachedFiles:
+			self.LogDebug("Restoring '{0!s}' from netlist cache.".format(filePath))
+			try:
+				if (not filePath.parent.exists()):
+					filePath.parent.mkdir(parents=True)
+				if (filePath.exists()):
+					filePath.unlink()
+				try:
+					os_link(str(cachedFile), str(filePath))
+				except OSError:
+					shutil_copy2(str(cachedFile), str(filePath))
+			except OSError as ex:
+				raise CompilerException("Error while restoring '{0!s}' from netlist cache.".format(filePath)) from ex
+		return True
+
+	def Store(self, key, filePaths):
+		"""Copy *filePaths* into a new cache entry *key*.
+
+		:type  key:       str
+		:param key:       The cache key.
+		:type  filePaths: list
+		:param filePaths: Paths of the files to be cached.
+		"""
+		entryDirectory =      self._directory / key
+		temporaryDirectory =  self._directory / "{0}.{1}.tmp".format(key, getpid())
+		for filePath in filePaths:
+			if (not filePath.exists()):
+				self.LogDebug("Not caching netlist, because '{0!s}' doesn't exist.".format(filePath))
+				return
+
+		try:
+			if (temporaryDirectory.exists()):
+				shutil_rmtree(str(temporaryDirectory))
+			temporaryDirectory.mkdir(parents=True)
+			for index, filePath in enumerate(filePaths):
+				shutil_copy2(str(filePath), str(temporaryDirectory / self._GetEntryFileName(index, filePath)))
+			if (entryDirectory.exists()):
+				# an identical entry was stored by a parallel job
+				shutil_rmtree(str(temporaryDirectory))
+				return
+			os_replace(str(temporaryDirectory), str(entryDirectory))
+		except OSError as ex:
+			raise CompilerException("Error while writing netlist cache entry '{0!s}'.".format(entryDirectory)) from ex
+		self.LogDebug("Stored netlist in cache entry '{0}'.".format(key))
+
+
+# State shared with forked worker processes, see :py:meth:`Compiler._RunAllParallel`.
+_parallelJob = None
+
+def _RunNetlistInWorker(index):
+	"""Compile the *index*-th netlist of the current parallel job in a forked
+	worker process.
+
+	Each netlist is compiled in its own subdirectory of the compiler's working
+	directory. Only the result is returned to the parent process.
+	"""
+	compiler, netlists, workingDirectory, args, kwargs = _parallelJob
+	netlist = netlists[index]
+
+	compiler.Directories.Working =  workingDirectory / netlist.ModuleName
+	compiler._testSuite =           SynthesisSuite()
+	try:
+		compiler.TryRun(netlist, *args, **kwargs)
+	except ExceptionBase as ex:
+		compiler.LogError("{0!s}: {1}".format(netlist, ex.message))
+	synthesis = compiler._lastSynthesis
+	return synthesis.Status, synthesis.CacheHit
+
+
 class Compiler(Shared):
 	"""Base class for all Compiler classes."""
 
 	ENVIRONMENT =     Environment.Synthesis
 	VHDL_VERSION =    VHDLVersion.VHDL93
 
+	REPLACE_MMAP_THRESHOLD =  16 * 1024 * 1024   #: Files of this size (in bytes) or larger are patched line by line, if possible.
+
 	class __Directories__(Shared.__Directories__):
 		Netlist =     None
 		Source =      None
 		Destination = None
 
 	@DocumentMemberAttribute()
-	def __init__(self, host : IHost, dryRun, noCleanUp):
+	def __init__(self, host : IHost, dryRun, noCleanUp, noCache=False):
 		"""Class initializer
 
 		:type  host:      object
@@ -166,25 +296,209 @@ class Compiler(Shared):
 		:param dryRun:    Enable dry-run mode
 		:type  noCleanUp: bool
 		:param noCleanUp: Don't clean up after a run.
+		:type  noCache:   bool
+		:param noCache:   Don't use the netlist cache.
 		"""
 		super().__init__(host, dryRun)
 
 		self._noCleanUp =       noCleanUp
+		self._noCache =         noCache
+		self._netlistCache =    None
+		self._cacheKey =        None
+		self._cacheHit =        None
+
+		if (not (noCache or dryRun)):
+			cacheDirectory =      host.Directories.Root / host.Config['CONFIG.DirectoryNames']['NetlistCacheFiles']
+			self._netlistCache =  NetlistCache(cacheDirectory, logger=self.Logger)
 
 		self._testSuite =       SynthesisSuite()  # TODO: This includes not the read ini files phases ...
+		self._lastSynthesis =   None
+		self._replaceRegExpCache = {}
 		self._state =           CompileState.Prepare
 		self._preTasksTime =    None
 		self._compileTime =     None
 		self._postTasksTime =   None
 
+	@property
+	def TestSuite(self):      return self._testSuite
 	@property
 	def NoCleanUp(self):      return self._noCleanUp
+	@property
+	def NoCache(self):        return self._noCache
 
 	def _PrepareCompiler(self):
 		"""Prepare for compilation. This method forwards to :py:meth:`Base.Compiler.Compiler._Prepare`,
 		which is inherited from :py:class:`Base.Shared.Shared`.
 		"""
 
+	def _GetNetlists(self, wildcard):
+		"""Return all netlists of a wildcard, which are supported by this compiler."""
+		raise NotImplementedError("Method '_GetNetlists' is not implemented by '{0}'.".format(self.__class__.__name__))
+
+	def _GetNetlist(self, entity):
+		"""Return the netlist of an IP core, which is supported by this compiler."""
+		raise NotImplementedError("Method '_GetNetlist' is not implemented by '{0}'.".format(self.__class__.__name__))
+
+	def RunAll(self, fqnList, *args, jobs=1, maxFailures=None, shard=None, **kwargs):
+		"""Run a list of netlist compilations. Expand wildcards to all selected netlists.
+
+		If *jobs* is greater than 1, independent netlists are compiled in parallel.
+		If *maxFailures* is given, no further netlists are started after this number
+		of netlists failed. The remaining netlists are reported as not run. If
+		*shard* is given as ``(index, count)``, only the netlists of this shard are
+		compiled.
+		"""
+		self._testSuite.StartTimer()
+		self.Logger.BaseIndent = int(len(fqnList) > 1)
+		try:
+			netlists = []
+			for fqn in fqnList:
+				entity = fqn.Entity
+				if (isinstance(entity, WildCard)):
+					self.Logger.BaseIndent = 1
+					netlists.extend(self._GetNetlists(entity))
+				else:
+					netlists.append(self._GetNetlist(entity))
+			netlists = self._SelectShard(netlists, shard, str)
+
+			if ((jobs > 1) and (len(netlists) > 1)):
+				self._RunAllParallel(netlists, jobs, maxFailures, *args, **kwargs)
+			else:
+				for index, netlist in enumerate(netlists):
+					self.TryRun(netlist, *args, **kwargs)
+					if self._IsMaxFailuresReached(maxFailures):
+						self._SkipRemainingNetlists(netlists[index + 1:], maxFailures)
+						break
+		except KeyboardInterrupt:
+			self.LogError("Received a keyboard interrupt.")
+		finally:
+			self._testSuite.StopTimer()
+
+		self.PrintOverallCompileReport()
+
+		return self._testSuite.IsAllSuccess
+
+	def _IsMaxFailuresReached(self, maxFailures):
+		return ((maxFailures is not None) and (self._testSuite.FailedCount + self._testSuite.ErrorCount >= maxFailures))
+
+	def _SkipRemainingNetlists(self, netlists, maxFailures):
+		"""Report all *netlists* as not run, because *maxFailures* was reached."""
+		if (len(netlists) == 0):
+			return
+
+		self.LogWarning("Reached the maximum number of failures ({0}). Skipping {1} remaining netlist(s).".format(maxFailures, len(netlists)))
+		self._testSuite.IsAborted = True
+		for netlist in netlists:
+			synthesis = Synthesis(netlist)
+			synthesis.Status = CompileStatus.NotRun
+			self._testSuite.AddSynthesis(synthesis)
+
+	def _GetNetlistDependencies(self, netlists):
+		"""Build a dependency graph for *netlists* from the ``Dependencies`` entries
+		of each netlist and its IP core.
+
+		A dependency can name a netlist's or an IP core's config section, optionally
+		prefixed by a tool name (``tool:name``). Dependencies, which are not part of
+		*netlists*, are expected to be compiled already.
+
+		:rtype:   dict
+		:return:  A mapping of each netlist to the set of netlists it depends on.
+		"""
+		netlistsByName = {}
+		for netlist in netlists:
+			for name in (netlist.ConfigSectionName, netlist.Parent.ConfigSectionName, str(netlist.Parent)):
+				netlistsByName.setdefault(name.lower(), []).append(netlist)
+
+		dependencies = {}
+		for netlist in netlists:
+			dependencies[netlist] = set()
+			for dependency in netlist.Dependencies + netlist.Parent.Dependencies:
+				name = dependency.split(":")[-1].lower()
+				if (name not in netlistsByName):
+					self.LogDebug("Dependency '{0}' of '{1!s}' is not part of this run.".format(dependency, netlist))
+					continue
+				dependencies[netlist].update(nl for nl in netlistsByName[name] if (nl is not netlist))
+		return dependencies
+
+	def _RunAllParallel(self, netlists, jobs, maxFailures, *args, **kwargs):
+		"""Compile *netlists* on a pool of *jobs* worker processes.
+
+		Netlists are scheduled in dependency order: a netlist is started after all
+		its dependencies were compiled successfully, and it is skipped if one of its
+		dependencies failed. Each worker compiles in its own subdirectory of the
+		working directory. Results are merged into this compiler's test suite.
+		Once *maxFailures* is reached, no further netlists are started; running
+		compilations are completed.
+		"""
+		global _parallelJob
+
+		try:
+			context = get_context("fork")
+		except ValueError:
+			self.LogWarning("Parallel compilation is not supported on this platform. Compiling serially.")
+			for index, netlist in enumerate(netlists):
+				self.TryRun(netlist, *args, **kwargs)
+				if self._IsMaxFailuresReached(maxFailures):
+					self._SkipRemainingNetlists(netlists[index + 1:], maxFailures)
+					break
+			return
+
+		dependencies =  self._GetNetlistDependencies(netlists)
+		pending =       list(netlists)
+		running =       {}
+		succeeded =     set()
+		failed =        set()
+		results =       Queue()
+
+		self.LogNormal("Compiling {0} netlists with {1} parallel jobs...".format(len(netlists), jobs))
+		_parallelJob = (self, netlists, self.Directories.Working, args, kwargs)
+		try:
+			with context.Pool(processes=jobs) as pool:
+				while (len(pending) + len(running) > 0):
+					if self._IsMaxFailuresReached(maxFailures):
+						self._SkipRemainingNetlists(pending, maxFailures)
+						pending = []
+					for netlist in list(pending):
+						if (not dependencies[netlist].isdisjoint(failed)):
+							pending.remove(netlist)
+							failed.add(netlist)
+							synthesis = Synthesis(netlist)
+							synthesis.Status = CompileStatus.NotRun
+							self._testSuite.AddSynthesis(synthesis)
+							self.LogWarning("Skipping '{0!s}', because a dependency failed.".format(netlist))
+						elif ((len(running) < jobs) and (dependencies[netlist] <= succeeded)):
+							pending.remove(netlist)
+							synthesis = Synthesis(netlist)
+							self._testSuite.AddSynthesis(synthesis)
+							synthesis.StartTimer()
+							running[netlist] = synthesis
+							pool.apply_async(
+								_RunNetlistInWorker, (netlists.index(netlist),),
+								callback=lambda result, netlist=netlist: results.put((netlist, result, None)),
+								error_callback=lambda ex, netlist=netlist: results.put((netlist, None, ex))
+							)
+
+					if (len(running) == 0):
+						if (len(pending) > 0):
+							raise CompilerException("Circular dependency between netlists: {0}".format(", ".join(str(netlist) for netlist in pending)))
+						break
+
+					netlist, result, ex = results.get()
+					synthesis = running.pop(netlist)
+					synthesis.StopTimer()
+					if (ex is not None):
+						self.LogError("Error while compiling '{0!s}': {1!s}".format(netlist, ex))
+						synthesis.Status = CompileStatus.SystemError
+					else:
+						synthesis.Status, synthesis.CacheHit = result
+
+					if (synthesis.Status is CompileStatus.CompileSuccess):
+						succeeded.add(netlist)
+					else:
+						failed.add(netlist)
+		finally:
+			_parallelJob = None
+
 	def TryRun(self, netlist, *args, **kwargs):
 		"""Try to run a testbench. Skip skipable exceptions by printing the error and its cause."""
 
@@ -200,7 +514,9 @@ class Compiler(Shared):
 
 		synthesis = Synthesis(netlist)
 		self._testSuite.AddSynthesis(synthesis)
+		self._lastSynthesis = synthesis
 		synthesis.StartTimer()
+		self._cacheHit = None
 		try:
 			self.Run(netlist, *args, **kwargs)
 			# synthesis.UpdateStatus(netlist.Result)
@@ -223,6 +539,7 @@ class Compiler(Shared):
 			synthesis.Status = CompileStatus.SystemError
 			raise
 		finally:
+			synthesis.CacheHit = self._cacheHit
 			synthesis.StopTimer()
 
 	def Run(self, netlist, board):
@@ -282,6 +599,13 @@ class Compiler(Shared):
 
 	def _RunPreCopy(self, netlist):
 		self.LogVerbose("Copy further input files into temporary directory...")
+		preCopyTasks = self._GetPreCopyTasks(netlist)
+		if (len(preCopyTasks) != 0):
+			self._ExecuteCopyTasks(preCopyTasks, "pre")
+		else:
+			self.LogDebug("Nothing to copy")
+
+	def _GetPreCopyTasks(self, netlist):
 		rulesFiles = [file for file in self.pyIPCMIProject.Files(fileType=FileTypes.RulesFile)]		# FIXME: get rulefile from netlist object as a rulefile object instead of a path
 		preCopyTasks = []
 		if (rulesFiles):
@@ -294,14 +618,17 @@ class Compiler(Shared):
 		else:
 			preCopyRules = self.Host.Config[netlist.ConfigSectionName]['PreCopyRules']
 			self._ParseCopyRules(preCopyRules, preCopyTasks, "pre")
+		return preCopyTasks
 
-		if (len(preCopyTasks) != 0):
-			self._ExecuteCopyTasks(preCopyTasks, "pre")
+	def _RunPostCopy(self, netlist):
+		self.LogVerbose("copy generated files into netlist directory...")
+		postCopyTasks = self._GetPostCopyTasks(netlist)
+		if (len(postCopyTasks) != 0):
+			self._ExecuteCopyTasks(postCopyTasks, "post")
 		else:
 			self.LogDebug("Nothing to copy")
 
-	def _RunPostCopy(self, netlist):
-		self.LogVerbose("copy generated files into netlist directory...")
+	def _GetPostCopyTasks(self, netlist):
 		rulesFiles = [file for file in self.pyIPCMIProject.Files(fileType=FileTypes.RulesFile)]		# FIXME: get rulefile from netlist object as a rulefile object instead of a path
 		postCopyTasks = []
 		if (rulesFiles):
@@ -314,11 +641,68 @@ class Compiler(Shared):
 		else:
 			postCopyRules = self.Host.Config[netlist.ConfigSectionName]['PostCopyRules']
 			self._ParseCopyRules(postCopyRules, postCopyTasks, "post")
+		return postCopyTasks
+
+	def _GetNetlistCacheKey(self, netlist, device, optionFiles):
+		"""Compute the netlist cache key from the tool, its version, the device,
+		all project files (incl. the rules file), all pre-copy source files and
+		the generated tool option files."""
+		hash = sha256()
+		def _update(value):
+			hash.update(str(value).encode("utf-8"))
+			hash.update(b"\0")
+
+		_update(self.TOOL)
+		_update(self._toolChain.Version)
+		_update(device)
+		_update(netlist.ModuleName)
+		filePaths =  [file.Path for file in self.pyIPCMIProject.Files()]
+		filePaths += [task.SourcePath for task in self._GetPreCopyTasks(netlist)]
+		filePaths += optionFiles
+		for filePath in filePaths:
+			_update(filePath.as_posix())
+			_update(GetFileHash(filePath))
+		return hash.hexdigest()
+
+	def _TryRestoreFromNetlistCache(self, netlist, device, optionFiles):
+		"""Restore the compile step's outputs from the netlist cache.
+
+		The cached outputs are the source files of all post-copy tasks. On a hit,
+		these files are restored into their original location, so the post-copy
+		and post-replace tasks can process them as usual.
+
+		:type  optionFiles: list
+		:param optionFiles: Generated tool option files (e.g. ``*.xst``, ``*.tcl``, ``*.qsf``), which affect the outputs.
+		:rtype:             bool
+		:return:            True, if the compile step can be skipped.
+		"""
+		self._cacheKey = None
+		if (self._netlistCache is None):
+			return False
 
-		if (len(postCopyTasks) != 0):
-			self._ExecuteCopyTasks(postCopyTasks, "post")
-		else:
-			self.LogDebug("Nothing to copy")
+		filePaths = [task.SourcePath for task in self._GetPostCopyTasks(netlist)]
+		if (len(filePaths) == 0):
+			self.LogDebug("No post-copy tasks. Netlist cache not applicable.")
+			return False
+
+		try:
+			self._cacheKey = self._GetNetlistCacheKey(netlist, device, optionFiles)
+		except OSError as ex:
+			self.LogWarning("Cannot compute netlist cache key: {0!s}".format(ex))
+			return False
+
+		self.LogDebug("Netlist cache key: {0}".format(self._cacheKey))
+		self._cacheHit = self._netlistCache.Restore(self._cacheKey, filePaths)
+		if self._cacheHit:
+			self.LogNormal("Restored netlist from cache.")
+		return self._cacheHit
+
+	def _StoreInNetlistCache(self, netlist):
+		"""Store the compile step's outputs in the netlist cache."""
+		if (self._cacheKey is None):
+			return
+		filePaths = [task.SourcePath for task in self._GetPostCopyTasks(netlist)]
+		self._netlistCache.Store(self._cacheKey, filePaths)
 
 	def _ParseCopyRules(self, rawList, copyTasks, text):
 		# read copy tasks
@@ -516,39 +900,146 @@ class Compiler(Shared):
 		else:
 			self.LogDebug("No {0}-replace tasks specified in config file.".format(text))
 
+	# Pattern fragments, which can match across line boundaries in a regular
+	# expression compiled without MULTILINE or DOTALL.
+	__NON_LINE_LOCAL_PATTERN_FRAGMENTS__ = ("\n", "\\n", "\\s", "\\D", "\\W", "[^", "^", "$", "\\Z", "\\A")
+	# Inline flags like (?s), (?m) or (?s:...) can enable DOTALL or MULTILINE within a pattern.
+	__INLINE_FLAGS_REGEXP__ = re_compile(r"\(\?[aiLmsux-]+[:)]")
+
+	def _GetReplaceRegExp(self, task):
+		"""Return the compiled search pattern of a replace task. Compiled patterns
+		are cached for all rules processed by this compiler."""
+		regExpFlags = 0
+		if task.RegExpOption_CaseInsensitive: regExpFlags |= RE_IGNORECASE
+		if task.RegExpOption_MultiLine:       regExpFlags |= RE_MULTILINE
+		if task.RegExpOption_DotAll:          regExpFlags |= RE_DOTALL
+
+		key = (task.SearchPattern, regExpFlags)
+		try:
+			return self._replaceRegExpCache[key]
+		except KeyError:
+			regExp = re_compile(task.SearchPattern, regExpFlags)
+			self._replaceRegExpCache[key] = regExp
+			return regExp
+
+	def _IsLineLocal(self, task):
+		"""Check if a replace task's search pattern can only match within a single line."""
+		if (task.RegExpOption_MultiLine or task.RegExpOption_DotAll):
+			return False
+		if (self.__INLINE_FLAGS_REGEXP__.search(task.SearchPattern) is not None):
+			return False
+		return not any((fragment in task.SearchPattern) for fragment in self.__NON_LINE_LOCAL_PATTERN_FRAGMENTS__)
+
 	def _ExecuteReplaceTasks(self, tasks, text):
+		"""Execute all replace and append-line tasks.
+
+		Tasks are grouped by target file. Each file is read once, all its tasks are
+		applied in order in a single pass and the result is written back atomically
+		via a temporary file. Very large files are read line by line through a
+		memory map, if all search patterns are line-local.
+		"""
+		tasksPerFile = OrderedDict()
 		for task in tasks:
-			if (not self.DryRun and not task.FilePath.exists()):
-				raise CompilerException("Cannot {0}-replace in file '{1!s}'.".format(text, task.FilePath)) from FileNotFoundError(str(task.FilePath))
-			self.LogDebug("{0}-replace in file '{1!s}': search for '{2}' replace by '{3}'.".format(text, task.FilePath, task.SearchPattern, task.ReplacePattern))
+			tasksPerFile.setdefault(task.FilePath, []).append(task)
+
+		for filePath, fileTasks in tasksPerFile.items():
+			if (not self.DryRun and not filePath.exists()):
+				raise CompilerException("Cannot {0}-replace in file '{1!s}'.".format(text, filePath)) from FileNotFoundError(str(filePath))
+			for task in fileTasks:
+				if isinstance(task, AppendLineRuleMixIn):
+					self.LogDebug("{0}-append in file '{1!s}': append '{2}'.".format(text, filePath, task.AppendPattern))
+				else:
+					self.LogDebug("{0}-replace in file '{1!s}': search for '{2}' replace by '{3}'.".format(text, filePath, task.SearchPattern, task.ReplacePattern))
 
 			if self.DryRun:
-				self.LogDryRun("Patch '{0!s}'.".format(task.FilePath))
-			else:
-				regExpFlags = 0
-				if task.RegExpOption_CaseInsensitive: regExpFlags |= RE_IGNORECASE
-				if task.RegExpOption_MultiLine:       regExpFlags |= RE_MULTILINE
-				if task.RegExpOption_DotAll:          regExpFlags |= RE_DOTALL
-
-				# compile regexp
-				regExp = re_compile(task.SearchPattern, regExpFlags)
-				# open file and read all lines
-				with task.FilePath.open('r') as fileHandle:
-					FileContent = fileHandle.read()
-				# replace
-				NewContent,replaceCount = re_subn(regExp, task.ReplacePattern, FileContent)
+				self.LogDryRun("Patch '{0!s}'.".format(filePath))
+				continue
+
+			replaceTasks = [task for task in fileTasks if not isinstance(task, AppendLineRuleMixIn)]
+			appendTasks =  [task for task in fileTasks if isinstance(task, AppendLineRuleMixIn)]
+			# appended lines must not be subject to a following replace task
+			appendsLast =  (fileTasks[len(replaceTasks):] == appendTasks)
+
+			try:
+				if (appendsLast and all(self._IsLineLocal(task) for task in replaceTasks) and (filePath.stat().st_size >= self.REPLACE_MMAP_THRESHOLD)):
+					replaceCounts = self._ReplaceInFileByLine(filePath, replaceTasks, appendTasks)
+				else:
+					replaceCounts = self._ReplaceInFile(filePath, fileTasks)
+			except OSError as ex:
+				raise CompilerException("Error while patching '{0!s}'.".format(filePath)) from ex
+
+			for task, replaceCount in zip(replaceTasks, replaceCounts):
 				if (replaceCount == 0):
-					self.LogWarning("  Search pattern '{0}' not found in file '{1!s}'.".format(task.SearchPattern, task.FilePath))
-				# open file to write the replaced data
-				with task.FilePath.open('w') as fileHandle:
-					fileHandle.write(NewContent)
+					self.LogWarning("  Search pattern '{0}' not found in file '{1!s}'.".format(task.SearchPattern, filePath))
+
+	def _ReplaceInFile(self, filePath, tasks):
+		"""Apply all tasks to the file's content in memory. Returns the replace count per replace task."""
+		with filePath.open('r') as fileHandle:
+			content = fileHandle.read()
+
+		replaceCounts = []
+		for task in tasks:
+			if isinstance(task, AppendLineRuleMixIn):
+				if (content and not content.endswith("\n")):
+					content += "\n"
+				content += task.AppendPattern + "\n"
+			else:
+				content, replaceCount = self._GetReplaceRegExp(task).subn(task.ReplacePattern, content)
+				replaceCounts.append(replaceCount)
+
+		with self._OpenForAtomicWrite(filePath) as fileHandle:
+			fileHandle.write(content)
+		return replaceCounts
+
+	def _ReplaceInFileByLine(self, filePath, replaceTasks, appendTasks):
+		"""Apply line-local replace tasks to a memory-mapped file line by line, then
+		append all lines of append tasks. Returns the replace count per replace task."""
+		regExps =       [(self._GetReplaceRegExp(task), task.ReplacePattern) for task in replaceTasks]
+		replaceCounts = [0] * len(regExps)
+		encoding =      getpreferredencoding(False)
+		lastLine =      "\n"
+
+		with filePath.open('rb') as inputHandle, self._OpenForAtomicWrite(filePath) as outputHandle:
+			with mmap(inputHandle.fileno(), 0, access=ACCESS_READ) as mappedFile:
+				for rawLine in iter(mappedFile.readline, b""):
+					line = rawLine.decode(encoding)
+					if line.endswith("\r\n"):
+						line = line[:-2] + "\n"
+					for index, (regExp, replacePattern) in enumerate(regExps):
+						line, replaceCount = regExp.subn(replacePattern, line)
+						replaceCounts[index] += replaceCount
+					outputHandle.write(line)
+					lastLine = line
+
+			if (appendTasks and not lastLine.endswith("\n")):
+				outputHandle.write("\n")
+			for task in appendTasks:
+				outputHandle.write(task.AppendPattern + "\n")
+		return replaceCounts
+
+	@contextmanager
+	def _OpenForAtomicWrite(self, filePath):
+		"""Open a temporary file next to *filePath* for writing. On success, the
+		temporary file replaces *filePath*, otherwise it is removed."""
+		fileHandle = NamedTemporaryFile('w', dir=str(filePath.parent), prefix=filePath.name + ".", suffix=".tmp", delete=False)
+		try:
+			with fileHandle:
+				yield fileHandle
+			shutil_copymode(str(filePath), fileHandle.name)
+			os_replace(fileHandle.name, str(filePath))
+		except BaseException:
+			try:
+				unlink(fileHandle.name)
+			except OSError:
+				pass
+			raise
 
 	def PrintOverallCompileReport(self):
 		self.LogQuiet("{HEADLINE}{line}{NOCOLOR}".format(line="=" * 80, **Init.Foreground))
 		self.LogQuiet("{HEADLINE}{headline: ^80s}{NOCOLOR}".format(headline="Overall Compile Report", **Init.Foreground))
 		self.LogQuiet("{HEADLINE}{line}{NOCOLOR}".format(line="=" * 80, **Init.Foreground))
 		# table header
-		self.LogQuiet("{Name: <24} | {Duration: >5} | {Status: ^11}".format(Name="Name", Duration="Time", Status="Status"))
+		self.LogQuiet("{Name: <24} | {Duration: >5} | {Status: ^11} | {Cache: ^5}".format(Name="Name", Duration="Time", Status="Status", Cache="Cache"))
 		self.LogQuiet("-" * 80)
 		self.PrintCompileReportLine(self._testSuite, 0, 24)
 
@@ -560,10 +1051,20 @@ class Compiler(Shared):
 			failed=self._testSuite.FailedCount,
 			error=self._testSuite.ErrorCount
 		))
+		if ((self._netlistCache is not None) or (self._testSuite.CacheHitCount + self._testSuite.CacheMissCount > 0)):
+			self.LogQuiet("Netlist cache:  Hits: {hits: <3}  Misses: {misses: <3}".format(
+				hits=self._testSuite.CacheHitCount,
+				misses=self._testSuite.CacheMissCount
+			))
+		if self._testSuite.IsAborted:
+			self.LogQuiet("{RED}Aborted after too many failures.{NOCOLOR}  Not run: {notrun: <3}".format(notrun=self._testSuite.NotRunCount, **Init.Foreground))
+		elif (self._testSuite.NotRunCount > 0):
+			self.LogQuiet("{RED}Skipped because a dependency failed.{NOCOLOR}  Not run: {notrun: <3}".format(notrun=self._testSuite.NotRunCount, **Init.Foreground))
 		self.LogQuiet("{HEADLINE}{line}{NOCOLOR}".format(line="=" * 80, **Init.Foreground))
 
 	__COMPILE_REPORT_COLOR_TABLE__ = {
 		CompileStatus.Unknown:        "RED",
+		CompileStatus.NotRun:         "DARK_GRAY",
 		CompileStatus.InternalError:  "DARK_RED",
 		CompileStatus.SystemError:    "DARK_RED",
 		CompileStatus.CompileError:   "RED",
@@ -572,12 +1073,19 @@ class Compiler(Shared):
 
 	__COMPILE_REPORT_STATUS_TEXT_TABLE__ = {
 		CompileStatus.Unknown:        "-- ?? --",
+		CompileStatus.NotRun:         "NOT RUN",
 		CompileStatus.InternalError:  "INT. ERROR",
 		CompileStatus.SystemError:    "SYS. ERROR",
 		CompileStatus.CompileError:   "COMP. ERROR",
 		CompileStatus.CompileSuccess: "SUCCESS"
 	}
 
+	__COMPILE_REPORT_CACHE_TEXT_TABLE__ = {
+		None:   "",
+		False:  "miss",
+		True:   "hit"
+	}
+
 	def PrintCompileReportLine(self, testObject, indent, nameColumnWidth):
 		_indent = "  " * indent
 		for group in testObject.Groups.values():
@@ -585,10 +1093,11 @@ class Compiler(Shared):
 			self.LogQuiet(pattern.format(groupName=group.Name))
 			self.PrintCompileReportLine(group, indent + 1, nameColumnWidth - 2)
 		for synthesis in testObject.Synthesises.values():
-			pattern = "{indent}{{netlistName: <{nameColumnWidth}}} | {{duration: >5}} | {{{color}}}{{status: ^11}}{{NOCOLOR}}".format(
+			pattern = "{indent}{{netlistName: <{nameColumnWidth}}} | {{duration: >5}} | {{{color}}}{{status: ^11}}{{NOCOLOR}} | {{cache: ^5}}".format(
 				indent=_indent, nameColumnWidth=nameColumnWidth, color=self.__COMPILE_REPORT_COLOR_TABLE__[synthesis.Status])
 			self.LogQuiet(pattern.format(
 				netlistName=synthesis.Name,
 				duration=to_time(synthesis.OverallRunTime),
-				status=self.__COMPILE_REPORT_STATUS_TEXT_TABLE__[synthesis.Status], **Init.Foreground
+				status=self.__COMPILE_REPORT_STATUS_TEXT_TABLE__[synthesis.Status],
+				cache=self.__COMPILE_REPORT_CACHE_TEXT_TABLE__[synthesis.CacheHit], **Init.Foreground
 			))
@@ -31,6 +31,7 @@
 from enum                 import Enum, unique
 from re                   import compile as re_compile
 
+from lib.Decorators       import CachedReadOnlyProperty
 from pyIPCMI.ToolChain            import ConfigurationException
 
 
@@ -259,6 +260,8 @@ class Packages(BaseEnum):
 
 
 class Device:
+	_devices = {}     #: Interned devices by device string, see :py:meth:`FromString`.
+
 	def __init__(self, deviceString):
 		# Device members
 		self.__vendor =       Vendors.Unknown
@@ -287,6 +290,17 @@ class Device:
 		elif (deviceString[0:3].lower() == "lfe"):  self._DecodeLatticeLFE(deviceString)	# lfe - Lattice ECP series
 		else:                                       raise ConfigurationException("Unknown manufacturer code in device string '{0}'".format(deviceString))
 
+	@classmethod
+	def FromString(cls, deviceString):
+		"""Return the device for *deviceString*. Devices are immutable, so each
+		device string is decoded only once and the resulting instance is shared."""
+		try:
+			return cls._devices[deviceString]
+		except (KeyError, TypeError):
+			device = cls(deviceString)
+			cls._devices[deviceString] = device
+			return device
+
 	def _DecodeGeneric(self):
 		self.__vendor =   Vendors.Generic
 		self.__family =   GenericFamilies.Generic
@@ -420,8 +434,7 @@ class Device:
 	@property
 	def Name(self):       return self.FullName.upper()
 
-	# @CachedReadOnlyProperty
-	@property
+	@CachedReadOnlyProperty
 	def ShortName(self):
 		if (self.__vendor is Vendors.Generic):
 			return "GENERIC"
@@ -446,8 +459,7 @@ class Device:
 		else:
 			raise NotImplementedError("Device.ShortName() not implemented for vendor {0!s}".format(self.__vendor))
 
-	# @CachedReadOnlyProperty
-	@property
+	@CachedReadOnlyProperty
 	def FullName(self):
 		if (self.__vendor is Vendors.Generic):
 			return "GENERIC"
@@ -474,8 +486,7 @@ class Device:
 		else:
 			raise NotImplementedError("Device.FullName() not implemented for vendor {0!s}".format(self.__vendor))
 
-	# @CachedReadOnlyProperty
-	@property
+	@CachedReadOnlyProperty
 	def FullName2(self):
 		if (self.__vendor is Vendors.Generic):
 			return "GENERIC"
@@ -502,16 +513,14 @@ class Device:
 		else:
 			raise NotImplementedError("Device.FullName() not implemented for vendor {0!s}".format(self.__vendor))
 
-	# @CachedReadOnlyProperty
-	@property
+	@CachedReadOnlyProperty
 	def FamilyName(self):
 		if (self.__family is XilinxFamilies.Zynq):
 			return str(self.__family)
 		else:
 			return str(self.__family) + str(self.__generation)
 
-	# @CachedReadOnlyProperty
-	@property
+	@CachedReadOnlyProperty
 	def Series(self):
 		if self.__vendor is Vendors.Generic:
 			return "GENERIC"
@@ -546,6 +555,9 @@ class Device:
 
 
 class Board:
+	_boardIndex =       None    #: Case-folded board names mapped to their board section names.
+	_boardIndexConfig = None    #: The configuration, from which :py:attr:`_boardIndex` was built.
+
 	def __init__(self, host, boardName=None, device=None):
 		# Board members
 		if (boardName is None):
@@ -563,22 +575,33 @@ class Board:
 			elif isinstance(device, Device):
 				self.__device = device
 			else:
-				self.__device = Device(device)
+				self.__device = Device.FromString(device)
 		else:
-			boardSectionName = None
-			for board in host.Config['BOARDS']:
-				if (board.lower() == boardName):
-					boardSectionName = host.Config['BOARDS'][board] # real board name
-					boardName = boardSectionName.split('.')[1]
-					break
-			else:
-				raise ConfigurationException("Unknown board '{0}'".format(boardName))
+			try:
+				boardSectionName = self._GetBoardIndex(host.Config)[boardName]  # real board name
+			except KeyError as ex:
+				raise ConfigurationException("Unknown board '{0}'".format(boardName)) from ex
+			boardName = boardSectionName.split('.')[1]
 
 			deviceName = host.Config[boardSectionName]['FPGA']
-			self.__device = Device(deviceName)
+			self.__device = Device.FromString(deviceName)
 
 		self.__boardName = boardName
 
+	@classmethod
+	def _GetBoardIndex(cls, config):
+		if ((cls._boardIndex is None) or (cls._boardIndexConfig is not config)):
+			boardsSection =         config['BOARDS']
+			cls._boardIndex =       {board.lower(): boardsSection[board] for board in boardsSection}
+			cls._boardIndexConfig = config
+		return cls._boardIndex
+
+	@classmethod
+	def ResetBoardIndex(cls):
+		"""Discard the board index. It's rebuilt from the configuration on next use."""
+		cls._boardIndex =       None
+		cls._boardIndexConfig = None
+
 	@property
 	def Name(self):      return self.__boardName
 	@property
@@ -33,7 +33,7 @@ from pathlib              import Path
 from flags                import Flags
 
 from lib.Functions        import Init
-from lib.Decorators       import LazyLoadTrigger, ILazyLoadable
+from lib.Decorators       import LazyLoadTrigger, ILazyLoadable, CachedReadOnlyProperty
 from pyIPCMI.ToolChain            import ConfigurationException
 
 
@@ -182,7 +182,7 @@ class PathElement:
 	@property
 	def IsVisible(self):          return self._host.Repository.Kind <= self._visibility
 
-	@property
+	@CachedReadOnlyProperty
 	def Path(self):
 		cur = self
 		result = []
@@ -195,11 +195,15 @@ class PathElement:
 			raise ConfigurationException("Hierarchy error. Expected Library.")
 		return result
 
+	@CachedReadOnlyProperty
+	def _FullName(self):
+		return "{0!s}.{1}".format(self.Parent, self.Name)
+
 	def _Load(self):
 		self._visibility = Visibility.Parse(self.ConfigSection['Visibility'])
 
 	def __str__(self):
-		return "{0!s}.{1}".format(self.Parent, self.Name)
+		return self._FullName
 
 
 class Namespace(PathElement):
@@ -514,9 +518,6 @@ class LazyPathElement(PathElement, ILazyLoadable):
 	@property
 	def Kind(self):                return self._kind
 
-	def __str__(self):
-		return "{0!s}.{1}".format(self._parent, self._name)
-
 
 @unique
 class SimulationResult(Enum):
@@ -612,6 +613,7 @@ class Netlist(LazyPathElement):
 	def __init__(self, host, name, configSectionName, parent):
 		self._kind =            NetlistKind.Unknown
 		self._moduleName =      ""
+		self._dependencies =    []
 		self._rulesFile =       None
 		super().__init__(host, name, configSectionName, parent)
 
@@ -620,6 +622,9 @@ class Netlist(LazyPathElement):
 	def ModuleName(self):     return self._moduleName
 	@property
 	@LazyLoadTrigger
+	def Dependencies(self):   return self._dependencies
+	@property
+	@LazyLoadTrigger
 	def RulesFile(self):      return self._rulesFile
 
 	def _LazyLoadable_Load(self):
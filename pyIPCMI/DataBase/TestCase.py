@@ -29,9 +29,17 @@
 #
 # load dependencies
 from collections      import OrderedDict
-from datetime         import datetime
+from datetime         import datetime, timedelta
 from enum             import Enum, unique
 
+try:
+	from time           import perf_counter_ns
+except ImportError:   # Python < 3.7
+	from time           import perf_counter
+
+	def perf_counter_ns():
+		return int(perf_counter() * 1000000000)
+
 
 __api__ = [
 	'SimulationStatus', 'CompileStatus',
@@ -47,20 +55,24 @@ __all__ = __api__
 class SimulationStatus(Enum):
 	Unknown =              0
 	DryRun =               1
+	NotRun =               2
 	SystemError =          5
 	InternalError =        6
 	AnalyzeError =         7
 	ElaborationError =     8
 	SimulationError =      9
 	SimulationFailed =    10
+	SimulationTimeout =   11
 	SimulationNoAsserts = 15
 	SimulationSuccess =   20
+	SimulationCached =    25
 	SimulationGUIRun =    30
 
 @unique
 class CompileStatus(Enum):
 	Unknown =              0
 	DryRun =               1
+	NotRun =               2
 	SystemError =          5
 	InternalError =        6
 	CompileError =         7
@@ -101,6 +113,34 @@ class GroupBase(ElementBase):
 	@property
 	def Count(self):      return len(self)
 
+	def _CreateGroup(self, name):
+		raise NotImplementedError("Method '_CreateGroup' is not implemented by '{0}'.".format(self.__class__.__name__))
+
+	def _CreateTest(self, name):
+		raise NotImplementedError("Method '_CreateTest' is not implemented by '{0}'.".format(self.__class__.__name__))
+
+	def ToDict(self):
+		"""Return this group, its sub-groups and tests as a JSON serializable dictionary."""
+		return {
+			"Name":   self._name,
+			"Groups": [group.ToDict() for group in self._groups.values()],
+			"Tests":  [test.ToDict() for test in self._tests.values()]
+		}
+
+	def LoadDict(self, data):
+		"""Add all sub-groups and tests from a dictionary created by :py:meth:`ToDict`.
+		Existing groups are extended, existing tests are replaced."""
+		for groupData in data["Groups"]:
+			group = self._groups.get(groupData["Name"])
+			if (group is None):
+				group = self._CreateGroup(groupData["Name"])
+				self[groupData["Name"]] = group
+			group.LoadDict(groupData)
+		for testData in data["Tests"]:
+			test = self._CreateTest(testData["Name"])
+			test.LoadDict(testData)
+			self[testData["Name"]] = test
+
 
 class TestGroup(GroupBase):
 	def __setitem__(self, key, value):
@@ -108,6 +148,9 @@ class TestGroup(GroupBase):
 		elif isinstance(value, TestCase):   self._tests[key] =  value
 		else:                               raise ValueError("Parameter 'value' is not of type TestGroup or TestCase")
 
+	def _CreateGroup(self, name):   return TestGroup(name, self)
+	def _CreateTest(self, name):    return TestCase(None, name)
+
 	@property
 	def TestCases(self):      return self._tests
 
@@ -126,6 +169,16 @@ class TestGroup(GroupBase):
 		return sum([tg.DryRunCount for tg in self._groups.values()]) \
 						+ sum([1 for tc in self._tests.values() if tc.Status is SimulationStatus.DryRun])
 
+	@property
+	def CachedCount(self):
+		return sum([tg.CachedCount for tg in self._groups.values()]) \
+						+ sum([1 for tc in self._tests.values() if tc.Status is SimulationStatus.SimulationCached])
+
+	@property
+	def NotRunCount(self):
+		return sum([tg.NotRunCount for tg in self._groups.values()]) \
+						+ sum([1 for tc in self._tests.values() if tc.Status is SimulationStatus.NotRun])
+
 	@property
 	def FailedCount(self):
 		return sum([tg.FailedCount for tg in self._groups.values()]) \
@@ -133,7 +186,7 @@ class TestGroup(GroupBase):
 
 	@property
 	def ErrorCount(self):
-		errors = (SimulationStatus.SystemError, SimulationStatus.InternalError, SimulationStatus.AnalyzeError, SimulationStatus.ElaborationError, SimulationStatus.SimulationError)
+		errors = (SimulationStatus.SystemError, SimulationStatus.InternalError, SimulationStatus.AnalyzeError, SimulationStatus.ElaborationError, SimulationStatus.SimulationError, SimulationStatus.SimulationTimeout)
 		return sum([tg.ErrorCount for tg in self._groups.values()]) \
 						+ sum([1 for tc in self._tests.values() if tc.Status in errors])
 
@@ -144,6 +197,9 @@ class SynthesisGroup(GroupBase):
 		elif isinstance(value, Synthesis):    self._tests[key] =  value
 		else:                                 raise ValueError("Parameter 'value' is not of type SynthesisGroup or Synthesis")
 
+	def _CreateGroup(self, name):   return SynthesisGroup(name, self)
+	def _CreateTest(self, name):    return Synthesis(None, name)
+
 	@property
 	def Synthesises(self):    return self._tests
 
@@ -157,6 +213,11 @@ class SynthesisGroup(GroupBase):
 		return sum([tg.DryRunCount for tg in self._groups.values()]) \
 						+ sum([1 for tc in self._tests.values() if tc.Status is CompileStatus.DryRun])
 
+	@property
+	def NotRunCount(self):
+		return sum([tg.NotRunCount for tg in self._groups.values()]) \
+						+ sum([1 for tc in self._tests.values() if tc.Status is CompileStatus.NotRun])
+
 	@property
 	def FailedCount(self):
 		return sum([tg.FailedCount for tg in self._groups.values()]) \
@@ -168,17 +229,44 @@ class SynthesisGroup(GroupBase):
 		return sum([tg.ErrorCount for tg in self._groups.values()]) \
 						+ sum([1 for tc in self._tests.values() if tc.Status in errors])
 
+	@property
+	def CacheHitCount(self):
+		return sum([tg.CacheHitCount for tg in self._groups.values()]) \
+						+ sum([1 for tc in self._tests.values() if tc.CacheHit is True])
+
+	@property
+	def CacheMissCount(self):
+		return sum([tg.CacheMissCount for tg in self._groups.values()]) \
+						+ sum([1 for tc in self._tests.values() if tc.CacheHit is False])
+
 
 class SuiteMixIn:
+	_FORMAT_VERSION = 1
+
 	def __init__(self):
 		self._startedAt =       datetime.now()
 		self._endedAt =         None
 		self._initRuntime =     None
 		self._overallRuntime =  None
+		self._isAborted =       False
+		self._shard =           None
+		self._mergedShards =    []
 
 	def __str__(self):
 		return self._name
 
+	@property
+	def IsAborted(self):          return self._isAborted
+	@IsAborted.setter
+	def IsAborted(self, value):   self._isAborted = value
+
+	@property
+	def Shard(self):              return self._shard
+	@Shard.setter
+	def Shard(self, value):       self._shard = value
+	@property
+	def MergedShards(self):       return self._mergedShards
+
 	def StartTimer(self):
 		now = datetime.now()
 		self._initRuntime =   now - self._startedAt
@@ -195,7 +283,42 @@ class SuiteMixIn:
 	@property
 	def InitializationTime(self): return self._initRuntime.microseconds
 	@property
-	def OverallRunTime(self):     return self._overallRuntime.seconds
+	def OverallRunTime(self):     return self._overallRuntime.total_seconds()
+
+	def Serialize(self):
+		"""Return the results of this suite as a JSON serializable dictionary,
+		which can be combined with other results by :py:meth:`Merge`."""
+		data = self.ToDict()
+		data["Version"] =   self._FORMAT_VERSION
+		data["Kind"] =      self.__class__.__name__
+		data["StartTime"] = self._startedAt.replace(microsecond=0).isoformat()
+		data["Duration"] =  self.OverallRunTime if (self._overallRuntime is not None) else 0.0
+		data["IsAborted"] = self._isAborted
+		data["Shard"] =     self._shard
+		return data
+
+	def Merge(self, data):
+		"""Add the results of a serialized suite (e.g. of another shard) to this suite.
+
+		The merged suite starts at the earliest start time and its run time is the
+		run time of the slowest merged suite.
+		"""
+		if ((data.get("Version") != self._FORMAT_VERSION) or (data.get("Kind") != self.__class__.__name__)):
+			raise ValueError("Data is no serialized {0} (format version {1}).".format(self.__class__.__name__, self._FORMAT_VERSION))
+
+		self.LoadDict(data)
+		startTime =   datetime.strptime(data["StartTime"], "%Y-%m-%dT%H:%M:%S")
+		runtime =     timedelta(seconds=data["Duration"])
+		if (self._overallRuntime is None):
+			self._startedAt =       startTime
+			self._overallRuntime =  runtime
+		else:
+			self._startedAt =       min(self._startedAt, startTime)
+			self._overallRuntime =  max(self._overallRuntime, runtime)
+		self._endedAt =     self._startedAt + self._overallRuntime
+		self._isAborted |=  data["IsAborted"]
+		if (data.get("Shard") is not None):
+			self._mergedShards.append(data["Shard"])
 
 
 class TestSuite(TestGroup, SuiteMixIn):
@@ -205,7 +328,7 @@ class TestSuite(TestGroup, SuiteMixIn):
 
 	@property
 	def IsAllPassed(self):
-		return (self.Count == self.PassedCount + self.NoAssertsCount + self.DryRunCount)
+		return (self.Count == self.PassedCount + self.CachedCount + self.NoAssertsCount + self.DryRunCount)
 
 	def AddTestCase(self, testCase):
 		cur = self
@@ -247,8 +370,8 @@ class SynthesisSuite(SynthesisGroup, SuiteMixIn):
 
 
 class TestBase(ElementBase):
-	def __init__(self, test):
-		super().__init__(test.Parent.Name, None)
+	def __init__(self, test, name=None):
+		super().__init__(test.Parent.Name if (name is None) else name, None)
 
 		self._test =              test
 		self._group =             None
@@ -259,7 +382,8 @@ class TestBase(ElementBase):
 
 		self._startedAt =         None
 		self._endedAt =           None
-		self._overallRuntime =    None
+		self._startedAtNs =       None
+		self._overallRuntimeNs =  None
 
 	@property
 	def Parent(self):           return self._parent
@@ -278,23 +402,70 @@ class TestBase(ElementBase):
 
 	def StartTimer(self):
 		self._startedAt =         datetime.now()
+		self._startedAtNs =       perf_counter_ns()
 
 	def StopTimer(self):
 		self._endedAt =           datetime.now()
-		self._overallRuntime =    self._endedAt - self._startedAt
+		self._overallRuntimeNs =  perf_counter_ns() - self._startedAtNs
 
 	@property
-	def OverallRunTime(self):   return self._overallRuntime.seconds
+	def StartTime(self):        return self._startedAt
+	@property
+	def EndTime(self):          return self._endedAt
+	@property
+	def OverallRunTimeNs(self): return self._overallRuntimeNs
+	@property
+	def OverallRunTime(self):   return (self._overallRuntimeNs / 1e9) if (self._overallRuntimeNs is not None) else 0.0
+
+	def ToDict(self):
+		"""Return the result of this test as a JSON serializable dictionary."""
+		return {
+			"Name":       self._name,
+			"Status":     self._status.name,
+			"StartTime":  self._startedAt.replace(microsecond=0).isoformat() if (self._startedAt is not None) else None,
+			"Duration":   self._overallRuntimeNs
+		}
+
+	def LoadDict(self, data):
+		"""Restore the result of this test from a dictionary created by :py:meth:`ToDict`."""
+		self._status =            self._status.__class__[data["Status"]]
+		self._startedAt =         datetime.strptime(data["StartTime"], "%Y-%m-%dT%H:%M:%S") if (data["StartTime"] is not None) else None
+		self._overallRuntimeNs =  data["Duration"]
 
 
 class TestCase(TestBase):
-	def __init__(self, testbench):
-		super().__init__(testbench)
+	def __init__(self, testbench, name=None):
+		super().__init__(testbench, name)
 
 		self._status =          SimulationStatus.Unknown
+		self._phaseTimes =      OrderedDict()
+		self._phaseStartedAt =  None
+		self._cachedRuntimeNs = None
 
 	@property
 	def Testbench(self):      return self._test
+	@property
+	def PhaseTimes(self):
+		"""Durations of all executed simulation phases in nanoseconds, keyed by phase name."""
+		return self._phaseTimes
+
+	def StartTimer(self):
+		super().StartTimer()
+		self._phaseStartedAt =  self._startedAtNs
+
+	def StopTimer(self):
+		super().StopTimer()
+		if (self._status is SimulationStatus.SimulationCached):
+			self._overallRuntimeNs = self._cachedRuntimeNs
+
+	def StopPhaseTimer(self, phase):
+		"""Record the time elapsed since the previous phase (or since the test
+		case was started) as the duration of *phase* and return it in nanoseconds."""
+		now =                       perf_counter_ns()
+		duration =                  now - self._phaseStartedAt
+		self._phaseStartedAt =      now
+		self._phaseTimes[phase] =   duration
+		return duration
 
 	def UpdateStatus(self, testResult):
 		if (testResult is testResult.NotRun):       self._status = SimulationStatus.Unknown
@@ -306,19 +477,50 @@ class TestCase(TestBase):
 		elif (testResult is testResult.GUIRun):     self._status = SimulationStatus.SimulationGUIRun
 		else:                                       raise ValueError("Unsupported value in 'testResult'.")
 
+	def UpdateFromCache(self, runtime, phaseTimes):
+		"""Mark this test case as a cached result. The run time and phase timings
+		of the cached run are reported instead of the measured ones."""
+		self._status =          SimulationStatus.SimulationCached
+		self._cachedRuntimeNs = runtime
+		self._phaseTimes =      OrderedDict(phaseTimes)
+
+	def ToDict(self):
+		data = super().ToDict()
+		data["Phases"] = list(self._phaseTimes.items())
+		return data
+
+	def LoadDict(self, data):
+		super().LoadDict(data)
+		self._phaseTimes = OrderedDict(data["Phases"])
+
 
 class Synthesis(TestBase):
-	def __init__(self, synthesis):
-		super().__init__(synthesis)
+	def __init__(self, synthesis, name=None):
+		super().__init__(synthesis, name)
 
 		self._status =          CompileStatus.Unknown
+		self._cacheHit =        None
 
 	@property
 	def Netlist(self):      return self._test
 
+	@property
+	def CacheHit(self):         return self._cacheHit		# None, if no netlist cache was used
+	@CacheHit.setter
+	def CacheHit(self, value):  self._cacheHit = value
+
 	def UpdateStatus(self, synthResult):
 		if (synthResult is synthResult.NotRun):     self._status = CompileStatus.Unknown
 		if (synthResult is synthResult.DryRun):     self._status = CompileStatus.DryRun
 		elif (synthResult is synthResult.Error):    self._status = CompileStatus.CompileError
 		elif (synthResult is synthResult.Success):  self._status = CompileStatus.CompileSuccess
 		else:                                       raise IndentationError("Wuhu2")
+
+	def ToDict(self):
+		data = super().ToDict()
+		data["CacheHit"] = self._cacheHit
+		return data
+
+	def LoadDict(self, data):
+		super().LoadDict(data)
+		self._cacheHit = data["CacheHit"]
@@ -31,7 +31,7 @@
 from pathlib                      import Path
 
 from pyIPCMI.Base.Executable              import DryRunException
-from pyIPCMI.Base.Project                 import FileTypes, ToolChain, Tool
+from pyIPCMI.Base.Project                 import ToolChain, Tool
 from pyIPCMI.ToolChain.Aldec.ActiveHDL    import ActiveHDL, ActiveHDLException
 from pyIPCMI.Simulator                    import VHDL_TESTBENCH_LIBRARY_NAME, SimulatorException, SkipableSimulatorException, SimulationSteps, Simulator as BaseSimulator
 
@@ -46,8 +46,8 @@ class Simulator(BaseSimulator):
 	TOOL_CHAIN =      ToolChain.Aldec_ActiveHDL
 	TOOL =            Tool.Aldec_aSim
 
-	def __init__(self, host, dryRun, simulationSteps):
-		super().__init__(host, dryRun, simulationSteps)
+	def __init__(self, host, dryRun, simulationSteps, noCache=False):
+		super().__init__(host, dryRun, simulationSteps, noCache)
 
 		activeHDLFilesDirectoryName =   host.Config['CONFIG.DirectoryNames']['ActiveHDLFiles']
 		self.Directories.Working =      host.Directories.Temp / activeHDLFilesDirectoryName
@@ -74,6 +74,7 @@ class Simulator(BaseSimulator):
 	def _RunAnalysis(self, _):
 		# create a ActiveHDLVHDLCompiler instance
 		alib = self._toolChain.GetVHDLLibraryTool()
+		alib.WorkingDirectory = self.Directories.Working
 
 		for lib in self._pyIPCMIProject.VHDLLibraries:
 			alib.Parameters[alib.SwitchLibraryName] = lib.Name
@@ -88,22 +89,22 @@ class Simulator(BaseSimulator):
 
 		# create a ActiveHDLVHDLCompiler instance
 		acom = self._toolChain.GetVHDLCompiler()
+		acom.WorkingDirectory = self.Directories.Working
 		acom.Parameters[acom.SwitchVHDLVersion] = repr(self._vhdlVersion)
 
-		# run acom compile for each VHDL file
-		for file in self._pyIPCMIProject.Files(fileType=FileTypes.VHDLSourceFile):
-			if (not file.Path.exists()):                  raise SimulatorException("Cannot analyse '{0!s}'.".format(file.Path)) from FileNotFoundError(str(file.Path))
-			acom.Parameters[acom.SwitchVHDLLibrary] =  file.LibraryName
-			acom.Parameters[acom.ArgSourceFile] =      file.Path
-			# set a per file log-file with '-l', 'vcom.log',
+		# run acom once for each batch of VHDL files sharing a VHDL library
+		for libraryName, files in self._GetVHDLSourceFileBatches():
+			acom.Parameters[acom.SwitchVHDLLibrary] =  libraryName
+			acom.Parameters[acom.ArgSourceFile] =      None
+			acom.Parameters[acom.ArgSourceFiles] =     [file.Path for file in files]
 			try:
 				acom.Compile()
 			except DryRunException:
 				pass
 			except ActiveHDLException as ex:
-				raise SimulatorException("Error while compiling '{0!s}'.".format(file.Path)) from ex
+				raise SimulatorException("Error while compiling VHDL library '{0}'.".format(libraryName)) from ex
 			if acom.HasErrors:
-				raise SkipableSimulatorException("Error while compiling '{0!s}'.".format(file.Path))
+				self._RunAnalysisPerFile(acom, libraryName, files, ActiveHDLException)
 
 	def _RunSimulation(self, testbench):
 		if (SimulationSteps.ShowWaveform in self._simulationSteps):
@@ -113,6 +114,7 @@ class Simulator(BaseSimulator):
 
 		# create a ActiveHDLSimulator instance
 		asim = self._toolChain.GetSimulator()
+		asim.WorkingDirectory = self.Directories.Working
 		asim.Parameters[asim.SwitchBatchCommand] = "asim -lib {0} {1}; run -all; bye".format(VHDL_TESTBENCH_LIBRARY_NAME, testbench.ModuleName)
 
 		# asim.Optimization =      True
@@ -28,12 +28,12 @@
 # ==============================================================================
 #
 # load dependencies
-from shutil                  import copy as shutil_copy
+from os                      import link as os_link
+from shutil                  import copy2 as shutil_copy2
 from textwrap                import dedent
 
 from pyIPCMI.Base.Project            import FileTypes, ToolChain, Tool
 from pyIPCMI.DataBase.Config         import Vendors
-from pyIPCMI.DataBase.Entity         import WildCard
 from pyIPCMI.ToolChain.GNU           import Make
 from pyIPCMI.Simulator               import SimulatorException, SimulationSteps, Simulator as BaseSimulator
 
@@ -50,12 +50,19 @@ class Simulator(BaseSimulator):
 	COCOTB_SIMBUILD_DIRECTORY = "sim_build"
 
 	def __init__(self, host, dryRun, simulationSteps):
-		super().__init__(host, dryRun, simulationSteps)
+		# Staged files and build outputs are kept per testbench, so make can skip unchanged steps
+		simulationSteps &= ~SimulationSteps.CleanUpBefore
+		# Cocotb test modules are not part of the project, so results are never cached
+		super().__init__(host, dryRun, simulationSteps, noCache=True)
+		# Cocotb always shows a simulation report
+		self._simulationSteps |= SimulationSteps.ShowReport
 
 		configSection =                 host.Config['CONFIG.DirectoryNames']
 		self.Directories.Working =      host.Directories.Temp / configSection['CocotbFiles']
 		self.Directories.PreCompiled =  host.Directories.PreCompiled / configSection['ModelSimFiles']
 
+		self._makefileTemplates =       {}
+
 		self._PrepareSimulationEnvironment()
 		self._PrepareSimulator()
 
@@ -63,25 +70,11 @@ class Simulator(BaseSimulator):
 		# create the Cocotb executable factory
 		self.LogVerbose("Preparing Cocotb simulator.")
 
-	def RunAll(self, fqnList, *args, **kwargs):
-		self._testSuite.StartTimer()
-		try:
-			for fqn in fqnList:
-				entity = fqn.Entity
-				if (isinstance(entity, WildCard)):
-					for testbench in entity.GetCocoTestbenches():
-						self.TryRun(testbench, *args, **kwargs)
-				else:
-					testbench = entity.CocoTestbench
-					self.TryRun(testbench, *args, **kwargs)
-		except KeyboardInterrupt:
-			self.LogError("Received a keyboard interrupt.")
-		finally:
-			self._testSuite.StopTimer()
-
-		self.PrintOverallSimulationReport()
-
-		return self._testSuite.IsAllPassed
+	def _GetTestbenches(self, wildcard):
+		return wildcard.GetCocoTestbenches()
+
+	def _GetTestbench(self, entity):
+		return entity.CocoTestbench
 
 	def _RunSimulation(self, testbench): # mccabe:disable=MC0001
 		# select modelsim.ini from precompiled
@@ -99,7 +92,9 @@ class Simulator(BaseSimulator):
 			raise SimulatorException("ModelSim ini file '{0!s}' not found.".format(precompiledModelsimIniPath)) \
 				from FileNotFoundError(str(precompiledModelsimIniPath))
 
-		simBuildPath = self.Directories.Working / self.COCOTB_SIMBUILD_DIRECTORY
+		# each testbench has a persistent directory for its staged files, Makefile and build outputs
+		testbenchDirectory =  self.Directories.Working / str(testbench.Parent)
+		simBuildPath =        testbenchDirectory / self.COCOTB_SIMBUILD_DIRECTORY
 		# create temporary directory for Cocotb if not existent
 		if (not (simBuildPath).exists()):
 			self.LogVerbose("Creating build directory for simulator files.")
@@ -111,18 +106,11 @@ class Simulator(BaseSimulator):
 
 		# write local modelsim.ini
 		modelsimIniPath = simBuildPath / "modelsim.ini"
-		if modelsimIniPath.exists():
-			try:
-				modelsimIniPath.unlink()
-			except OSError as ex:
-				raise SimulatorException("Error while deleting '{0!s}'.".format(modelsimIniPath)) from ex
-
-		with modelsimIniPath.open('w') as fileHandle:
-			fileContent = dedent("""\
-				[Library]
-				others = {0!s}
-				""").format(precompiledModelsimIniPath)
-			fileHandle.write(fileContent)
+		fileContent = dedent("""\
+			[Library]
+			others = {0!s}
+			""").format(precompiledModelsimIniPath)
+		self._WriteFileIfChanged(modelsimIniPath, fileContent)
 
 		#
 		self.LogNormal("Running simulation...")
@@ -139,35 +127,69 @@ class Simulator(BaseSimulator):
 					from FileNotFoundError(str(file.Path))
 			vhdlSources += str(file.Path) + " "
 
-		# copy Cocotb (Python) files to temp directory
-		self.LogVerbose("Copying Cocotb (Python) files into temporary directory.")
-		cocotbTempDir = str(self.Directories.Working)
+		# stage Cocotb (Python) files in temp directory
+		self.LogVerbose("Staging Cocotb (Python) files in temporary directory.")
 		for file in self._pyIPCMIProject.Files(fileType=FileTypes.CocotbSourceFile):
 			if (not file.Path.exists()):
 				raise SimulatorException("Cannot copy '{0!s}' to Cocotb temp directory.".format(file.Path)) \
 					from FileNotFoundError(str(file.Path))
-			self.LogDebug("copy {0!s} {1}".format(file.Path, cocotbTempDir))
-			try:
-				shutil_copy(str(file.Path), cocotbTempDir)
-			except OSError as ex:
-				raise SimulatorException("Error while copying '{0!s}'.".format(file.Path)) from ex
+			self._StageFile(file.Path, testbenchDirectory / file.Path.name)
 
 		# read/write Makefile template
 		self.LogVerbose("Generating Makefile...")
-		self.LogDebug("Reading Cocotb Makefile template file from '{0!s}'".format(cocotbTemplateFilePath))
-		with cocotbTemplateFilePath.open('r') as fileHandle:
-			cocotbMakefileContent = fileHandle.read()
-
-		cocotbMakefileContent = cocotbMakefileContent.format(pyIPCMIRootDirectory=str(self.Host.Directories.Root),
+		try:
+			cocotbMakefileTemplate = self._makefileTemplates[cocotbTemplateFilePath]
+		except KeyError:
+			self.LogDebug("Reading Cocotb Makefile template file from '{0!s}'".format(cocotbTemplateFilePath))
+			with cocotbTemplateFilePath.open('r') as fileHandle:
+				cocotbMakefileTemplate = fileHandle.read()
+			self._makefileTemplates[cocotbTemplateFilePath] = cocotbMakefileTemplate
+
+		cocotbMakefileContent = cocotbMakefileTemplate.format(pyIPCMIRootDirectory=str(self.Host.Directories.Root),
 																													VHDLSources=vhdlSources,
 																													TopLevel=topLevel, CocotbModule=cocotbModule)
 
-		cocotbMakefilePath = self.Directories.Working / "Makefile"
-		self.LogDebug("Writing Cocotb Makefile to '{0!s}'".format(cocotbMakefilePath))
-		with cocotbMakefilePath.open('w') as fileHandle:
-			fileHandle.write(cocotbMakefileContent)
+		cocotbMakefilePath = testbenchDirectory / "Makefile"
+		self._WriteFileIfChanged(cocotbMakefilePath, cocotbMakefileContent)
 
 		# execute make
 		make = Make(self.Host.Platform, self.DryRun, logger=self.Logger)
+		make.WorkingDirectory = testbenchDirectory
 		if (SimulationSteps.ShowWaveform in self._simulationSteps): make.Parameters[Make.SwitchGui] = 1
 		testbench.Result = make.RunCocotb()
+
+	def _StageFile(self, sourcePath, targetPath):
+		"""Hardlink *sourcePath* to *targetPath* or copy it, if a hardlink is not
+		possible (e.g. across filesystems). A staged file with the same size and
+		modification time is kept, so make doesn't see a change."""
+		try:
+			sourceStat = sourcePath.stat()
+			if targetPath.exists():
+				targetStat = targetPath.stat()
+				if ((targetStat.st_size == sourceStat.st_size) and (targetStat.st_mtime_ns == sourceStat.st_mtime_ns)):
+					self.LogDebug("Staged file '{0!s}' is up-to-date.".format(targetPath))
+					return
+				targetPath.unlink()
+
+			self.LogDebug("Staging '{0!s}' as '{1!s}'.".format(sourcePath, targetPath))
+			try:
+				os_link(str(sourcePath), str(targetPath))
+			except OSError:
+				shutil_copy2(str(sourcePath), str(targetPath))
+		except OSError as ex:
+			raise SimulatorException("Error while copying '{0!s}'.".format(sourcePath)) from ex
+
+	def _WriteFileIfChanged(self, filePath, content):
+		"""Write *content* to *filePath*, unless the file already has this content.
+		An unchanged file keeps its modification time, so make doesn't rebuild."""
+		try:
+			if filePath.exists():
+				with filePath.open('r') as fileHandle:
+					if (fileHandle.read() == content):
+						self.LogDebug("File '{0!s}' is up-to-date.".format(filePath))
+						return
+			self.LogDebug("Writing '{0!s}'.".format(filePath))
+			with filePath.open('w') as fileHandle:
+				fileHandle.write(content)
+		except OSError as ex:
+			raise SimulatorException("Error while writing '{0!s}'.".format(filePath)) from ex
@@ -28,16 +28,22 @@
 # ==============================================================================
 #
 # load dependencies
+from concurrent.futures     import ThreadPoolExecutor
+from hashlib                import sha256
+from os                     import cpu_count, getpid, link as os_link, replace as os_replace
 from pathlib                import Path
+from re                     import compile as re_compile
+from shutil                 import copy2 as shutil_copy2, rmtree as shutil_rmtree
 
 from pyIPCMI.Base.Exceptions        import NotConfiguredException
 from pyIPCMI.Base.Executable        import DryRunException
+from pyIPCMI.Base.Incremental       import AnalysisState, GetFileHash
 from pyIPCMI.Base.Logging           import Severity
 from pyIPCMI.Base.Project           import FileTypes, VHDLVersion, ToolChain, Tool
 from pyIPCMI.Simulator              import VHDL_TESTBENCH_LIBRARY_NAME, SimulatorException, SkipableSimulatorException, SimulationSteps, Simulator as BaseSimulator
 from pyIPCMI.ToolChain.GHDL         import GHDL, GHDLException, GHDLReanalyzeException
-from pyIPCMI.ToolChain.GTKWave      import GTKWave
-from pyIPCMI.ToolChain.GNU          import LCov, GenHtml
+from pyIPCMI.ToolChain.GTKWave      import GTKWave, GTKWaveException
+from pyIPCMI.ToolChain.GNU          import GNUException, LCov, GenHtml
 
 
 __api__ = [
@@ -55,19 +61,31 @@ class Simulator(BaseSimulator):
 	class __Directories__(BaseSimulator.__Directories__):
 		GTKWBinary = None
 
-	def __init__(self, host, dryRun, simulationSteps):
+	def __init__(self, host, dryRun, simulationSteps, incremental=False, noCache=False):
 		"""Constructor"""
-		super().__init__(host, dryRun, simulationSteps)
+		# Incremental analysis reuses the VHDL libraries of previous runs
+		if (incremental is True):
+			simulationSteps &= ~SimulationSteps.CleanUpBefore
+		super().__init__(host, dryRun, simulationSteps, noCache)
 
 		ghdlFilesDirectoryName =        host.Config['CONFIG.DirectoryNames']['GHDLFiles']
 		self.Directories.Working =      host.Directories.Temp / ghdlFilesDirectoryName
 		self.Directories.PreCompiled =  host.Directories.PreCompiled / ghdlFilesDirectoryName
 
 		self._withCoverage =            False
+		self._coverageReportPerTestbench = False
+		self._coverageTracefiles =      []
+		self._elaborationCache =        None
+		self._elaborationKey =          None
+		self._elaborationRestored =     False
+		self._analysisState =           AnalysisState(self.Directories.Working / "analysis.json", logger=self.Logger) if (incremental and not dryRun) else None
 
 		self._PrepareSimulationEnvironment()
 		self._PrepareSimulator()
 
+		if (not (noCache or dryRun or (self._toolChain.Backend == "mcode"))):
+			self._elaborationCache =      host.Directories.Root / host.Config['CONFIG.DirectoryNames']['ElaborationCacheFiles']
+
 		if (self._toolChain.Backend == "mcode"):
 			# A separate elaboration step is not implemented in GHDL (mcode)
 			self._simulationSteps &= ~SimulationSteps.Elaborate
@@ -89,16 +107,26 @@ class Simulator(BaseSimulator):
 		backend =         ghdlSection['Backend']
 		self._toolChain = GHDL(self.Host.Platform, self.DryRun, binaryPath, version, backend, logger=self.Logger)
 
-	def Run(self, testbench, board, vhdlVersion, vhdlGenerics=None, withCoverage=False):
-		self._withCoverage = withCoverage
+	def Run(self, testbench, board, vhdlVersion, vhdlGenerics=None, withCoverage=False, coverageReportPerTestbench=False):
+		self._withCoverage =        withCoverage
+		self._coverageReportPerTestbench = coverageReportPerTestbench
+		self._elaborationKey =      None
+		self._elaborationRestored = False
 
 		super().Run(testbench, board, vhdlVersion, vhdlGenerics)
 
 	def _RunAnalysis(self, testbench):
 		""""""
 
+		# an elaborated executable of unchanged sources makes the analysis obsolete
+		if (SimulationSteps.Elaborate in self._simulationSteps):
+			self._elaborationRestored = self._TryRestoreElaboration(testbench, self._GetGHDLElaborate(testbench))
+			if self._elaborationRestored:
+				return
+
 		# create a GHDLAnalyzer instance
 		ghdl = self._toolChain.GetGHDLAnalyze()
+		ghdl.WorkingDirectory = self.Directories.Working
 		ghdl.Parameters[ghdl.FlagVerbose] =           (self.Logger.LogLevel is Severity.Debug)
 		ghdl.Parameters[ghdl.FlagExplicit] =          True
 		ghdl.Parameters[ghdl.FlagRelaxedRules] =      True
@@ -116,22 +144,38 @@ class Simulator(BaseSimulator):
 		self._SetVHDLVersionAndIEEEFlavor(ghdl)
 		self._SetExternalLibraryReferences(ghdl)
 
-		# run GHDL analysis for each VHDL file
-		for file in self._pyIPCMIProject.Files(fileType=FileTypes.VHDLSourceFile):
+		files = list(self._pyIPCMIProject.Files(fileType=FileTypes.VHDLSourceFile))
+		for file in files:
 			if (not file.Path.exists()):                  raise SkipableSimulatorException("Cannot analyse '{0!s}'.".format(file.Path)) from FileNotFoundError(str(file.Path))
 
-			ghdl.Parameters[ghdl.SwitchVHDLLibrary] =     file.LibraryName
-			ghdl.Parameters[ghdl.ArgSourceFile] =         file.Path
-			try:
-				ghdl.Analyze()
-			except DryRunException:
-				pass
-			except GHDLReanalyzeException as ex:
-				raise SkipableSimulatorException("Error while analysing '{0!s}'.".format(file.Path)) from ex
-			except GHDLException as ex:
-				raise SimulatorException("Error while analysing '{0!s}'.".format(file.Path)) from ex
-			if ghdl.HasErrors:
-				raise SkipableSimulatorException("Error while analysing '{0!s}'.".format(file.Path))
+		# in incremental mode, analyze only changed files and their dependents
+		if (self._analysisState is not None):
+			ghdl.Parameters[ghdl.SwitchVHDLLibrary] =     None
+			ghdl.Parameters[ghdl.ArgSourceFile] =         None
+			self._analysisState.Load()
+			files = self._analysisState.GetOutdatedFiles(files, " ".join(ghdl.Parameters.ToArgumentList()))
+			self.LogNormal("Incremental analysis: {0} file(s) outdated.".format(len(files)))
+
+		# run GHDL analysis for each VHDL file
+		try:
+			for file in files:
+				ghdl.Parameters[ghdl.SwitchVHDLLibrary] =     file.LibraryName
+				ghdl.Parameters[ghdl.ArgSourceFile] =         file.Path
+				try:
+					ghdl.Analyze()
+				except DryRunException:
+					pass
+				except GHDLReanalyzeException as ex:
+					raise SkipableSimulatorException("Error while analysing '{0!s}'.".format(file.Path)) from ex
+				except GHDLException as ex:
+					raise SimulatorException("Error while analysing '{0!s}'.".format(file.Path)) from ex
+				if ghdl.HasErrors:
+					raise SkipableSimulatorException("Error while analysing '{0!s}'.".format(file.Path))
+				if (self._analysisState is not None):
+					self._analysisState.Update([file])
+		finally:
+			if (self._analysisState is not None):
+				self._analysisState.Save()
 
 	def _SetVHDLVersionAndIEEEFlavor(self, ghdl):
 		""""""
@@ -161,9 +205,28 @@ class Simulator(BaseSimulator):
 
 		if (self._toolChain.Backend == "mcode"):
 			return
+		if self._elaborationRestored:
+			return
+
+		ghdl = self._GetGHDLElaborate(testbench)
+		if ((SimulationSteps.Analyze not in self._simulationSteps) and self._TryRestoreElaboration(testbench, ghdl)):
+			return
 
-		# create a GHDLElaborate instance
+		try:
+			ghdl.Elaborate()
+		except DryRunException:
+			pass
+		except GHDLException as ex:
+			raise SimulatorException("Error while elaborating '{0}.{1}'.".format(VHDL_TESTBENCH_LIBRARY_NAME, testbench.ModuleName)) from ex
+		if ghdl.HasErrors:
+			raise SkipableSimulatorException("Error while elaborating '{0}.{1}'.".format(VHDL_TESTBENCH_LIBRARY_NAME, testbench.ModuleName))
+
+		self._StoreElaboration(testbench)
+
+	def _GetGHDLElaborate(self, testbench):
+		"""Create and configure a GHDLElaborate instance for *testbench*."""
 		ghdl = self._toolChain.GetGHDLElaborate()
+		ghdl.WorkingDirectory = self.Directories.Working
 		ghdl.Parameters[ghdl.FlagVerbose] =           (self.Logger.LogLevel is Severity.Debug)
 		ghdl.Parameters[ghdl.SwitchVHDLLibrary] =     VHDL_TESTBENCH_LIBRARY_NAME
 		ghdl.Parameters[ghdl.ArgTopLevel] =           testbench.ModuleName
@@ -174,21 +237,108 @@ class Simulator(BaseSimulator):
 
 		self._SetVHDLVersionAndIEEEFlavor(ghdl)
 		self._SetExternalLibraryReferences(ghdl)
+		return ghdl
+
+	def _GetExecutablePath(self, testbench):
+		"""Return the path of the executable created by GHDL's elaboration step."""
+		executableName = testbench.ModuleName.lower()
+		if (self.Host.Platform == "Windows"):
+			executableName += ".exe"
+		return self.Directories.Working / executableName
+
+	def _GetElaborationKey(self, testbench, ghdl):
+		"""Compute the elaboration cache key from the GHDL version and backend,
+		all analyzed VHDL source files, the referenced external libraries, the
+		top-level name and the elaboration flags."""
+		hash = sha256()
+		def _update(value):
+			hash.update(str(value).encode("utf-8"))
+			hash.update(b"\0")
+
+		_update(self._toolChain.Version)
+		_update(self._toolChain.Backend)
+		_update(self._withCoverage)
+		for file in self._pyIPCMIProject.Files(fileType=FileTypes.VHDLSourceFile):
+			_update(file.LibraryName)
+			_update(file.Path.as_posix())
+			_update(GetFileHash(file.Path))
+		for extLibrary in self._pyIPCMIProject.ExternalVHDLLibraries:
+			for libraryFilePath in sorted(extLibrary.Path.glob("**/*.cf")):
+				_update(libraryFilePath.as_posix())
+				_update(GetFileHash(libraryFilePath))
+		_update(testbench.ModuleName)
+		for param in ghdl.Parameters:
+			if (param is not ghdl.FlagVerbose):
+				_update(param.AsArgument())
+		return hash.hexdigest()
+
+	def _TryRestoreElaboration(self, testbench, ghdl):
+		"""Restore the elaborated executable of *testbench* from the elaboration
+		cache. Each testbench has its own cache directory holding one entry per key.
+
+		:rtype:   bool
+		:return:  True, if the elaboration can be skipped.
+		"""
+		self._elaborationKey = None
+		if ((self._elaborationCache is None) or self._withCoverage):
+			return False
 
 		try:
-			ghdl.Elaborate()
-		except DryRunException:
-			pass
-		except GHDLException as ex:
-			raise SimulatorException("Error while elaborating '{0}.{1}'.".format(VHDL_TESTBENCH_LIBRARY_NAME, testbench.ModuleName)) from ex
-		if ghdl.HasErrors:
-			raise SkipableSimulatorException("Error while elaborating '{0}.{1}'.".format(VHDL_TESTBENCH_LIBRARY_NAME, testbench.ModuleName))
+			self._elaborationKey = self._GetElaborationKey(testbench, ghdl)
+		except OSError as ex:
+			self.LogWarning("Cannot compute elaboration cache key: {0!s}".format(ex))
+			return False
+
+		self.LogDebug("Elaboration cache key: {0}".format(self._elaborationKey))
+		executablePath =  self._GetExecutablePath(testbench)
+		cachedFilePath =  self._elaborationCache / testbench.ModuleName / self._elaborationKey / executablePath.name
+		if (not cachedFilePath.exists()):
+			return False
+
+		try:
+			if executablePath.exists():
+				executablePath.unlink()
+			try:
+				os_link(str(cachedFilePath), str(executablePath))
+			except OSError:
+				shutil_copy2(str(cachedFilePath), str(executablePath))
+		except OSError as ex:
+			raise SimulatorException("Error while restoring '{0!s}' from elaboration cache.".format(executablePath)) from ex
+
+		self.LogNormal("Reusing elaborated executable from cache.")
+		return True
+
+	def _StoreElaboration(self, testbench):
+		"""Store the elaborated executable of *testbench* in the elaboration cache
+		and remove outdated entries of the same testbench."""
+		if (self._elaborationKey is None):
+			return
+
+		executablePath =      self._GetExecutablePath(testbench)
+		if (not executablePath.exists()):
+			self.LogDebug("Not caching elaboration, because '{0!s}' doesn't exist.".format(executablePath))
+			return
+
+		testbenchDirectory =  self._elaborationCache / testbench.ModuleName
+		entryDirectory =      testbenchDirectory / self._elaborationKey
+		temporaryDirectory =  testbenchDirectory / "{0}.{1}.tmp".format(self._elaborationKey, getpid())
+		try:
+			if testbenchDirectory.exists():
+				for outdatedDirectory in testbenchDirectory.iterdir():
+					shutil_rmtree(str(outdatedDirectory))
+			temporaryDirectory.mkdir(parents=True)
+			shutil_copy2(str(executablePath), str(temporaryDirectory / executablePath.name))
+			os_replace(str(temporaryDirectory), str(entryDirectory))
+		except OSError as ex:
+			raise SimulatorException("Error while writing elaboration cache entry '{0!s}'.".format(entryDirectory)) from ex
+		self.LogDebug("Stored elaborated executable in cache entry '{0}'.".format(self._elaborationKey))
 
 	def _RunSimulation(self, testbench):
 		""""""
 
 		# create a GHDLRun instance
 		ghdl = self._toolChain.GetGHDLRun()
+		ghdl.WorkingDirectory = self.Directories.Working
 		ghdl.Parameters[ghdl.FlagVerbose] =             (self.Logger.LogLevel is Severity.Debug)
 		ghdl.Parameters[ghdl.FlagExplicit] =            True
 		ghdl.Parameters[ghdl.FlagRelaxedRules] =        True
@@ -206,10 +356,17 @@ class Simulator(BaseSimulator):
 		# configure RUNOPTS
 		ghdl.RunOptions[ghdl.SwitchIEEEAsserts] = "disable-at-0"    # enable, disable, disable-at-0
 
+		# pass generics at run time, so the elaborated executable can be reused
+		generics = self._GetHDLParameters(testbench.ConfigSectionName)
+		if (self._vhdlGenerics is not None):
+			generics.update(self._vhdlGenerics)
+		if (len(generics) > 0):
+			ghdl.RunOptions[ghdl.SwitchGenerics] = ["{0}={1}".format(key, value) for key, value in sorted(generics.items())]
+
 		# set dump format to save simulation results to *.vcd file
 		if (SimulationSteps.ShowWaveform in self._simulationSteps):
 			configSection = self.Host.Config[testbench.ConfigSectionName]
-			testbench.WaveformOptionFile = Path(configSection['ghdlWaveformOptionFile'])
+			testbench.WaveformOptionFile = self.Host.Directories.Root / configSection['ghdlWaveformOptionFile']
 			testbench.WaveformFileFormat = configSection['ghdlWaveformFileFormat']
 
 			if (testbench.WaveformFileFormat == "vcd"):
@@ -245,6 +402,7 @@ class Simulator(BaseSimulator):
 		gtkwBinaryPath =    self.Directories.GTKWBinary
 		gtkwVersion =       self.Host.Config['INSTALL.GTKWave']['Version']
 		gtkw = GTKWave(self.Host.Platform, self.DryRun, gtkwBinaryPath, gtkwVersion, logger=self.Logger)
+		gtkw.WorkingDirectory = self.Directories.Working
 		gtkw.Parameters[gtkw.SwitchDumpFile] = str(testbench.WaveformFile)
 
 		# if GTKWave savefile exists, load it's settings
@@ -265,35 +423,89 @@ class Simulator(BaseSimulator):
 		# clean-up *.gtkw files
 		if gtkwSaveFilePath.exists():
 			self.LogVerbose("Cleaning up GTKWave save file...")
-			removeKeys =  ("[dumpfile]", "[savefile]")
-			buffer =      ""
-			with gtkwSaveFilePath.open('r') as gtkwHandle:
-				# search for these keys in the first 10 header lines
-				for lineNumber,line in enumerate(gtkwHandle):
-					if (not line.startswith(removeKeys)):   buffer += line
-					if (lineNumber > 10):                   break
-				# copy remaining lines without processing
-				for line in gtkwHandle:
-					buffer += line
-			with gtkwSaveFilePath.open('w') as gtkwHandle:
-				gtkwHandle.write(buffer)
+			try:
+				GTKWave.CleanUpSaveFile(gtkwSaveFilePath)
+			except GTKWaveException as ex:
+				raise SimulatorException("Error while cleaning up '{0!s}'.".format(gtkwSaveFilePath)) from ex
+
+	_TRACEFILE_NAME_REGEXP = re_compile(r"[^\w.-]")
 
 	def _RunCoverage(self, testbench):
+		"""Capture the coverage counters of this testbench into its own tracefile
+		and reset the counters for the next testbench. The tracefiles are merged
+		by :py:meth:`_RunCoverageMerge` at the end of a run."""
 		if (self._withCoverage is False):
 			pass
 			# self.LogError("No coverage information collected.")
 			# return
 
-		coverageStatisticsFile =            "coverage.info"
-		coverageStatisticsOutputDirectory = "html"
+		coverageDirectory = self.Host.Directories.Root / self.Host.Config['CONFIG.DirectoryNames']['CoverageFiles']
+		tracefileName =     self._TRACEFILE_NAME_REGEXP.sub("_", self._GetTestbenchName(testbench))
+		tracefile =         coverageDirectory / (tracefileName + ".info")
+		if (not coverageDirectory.exists()):
+			coverageDirectory.mkdir(parents=True)
+
+		lCov = LCov(self.Host.Platform, self.DryRun, logger=self.Logger)
+		lCov.WorkingDirectory = self.Directories.Working
+		lCov.Capture(self.Directories.Working, tracefile)
+		# the counters accumulate in the *.gcda files of the shared working directory
+		lCov.ZeroCounters(self.Directories.Working)
+
+		if (tracefile not in self._coverageTracefiles):
+			self._coverageTracefiles.append(tracefile)
+
+		if self._coverageReportPerTestbench:
+			self._RunGenHtml([tracefile], coverageDirectory / "html" / tracefileName)
 
+	def _RunCoverageMerge(self):
+		"""Merge all tracefiles of this run pairwise as a tree of parallel
+		``lcov --add-tracefile`` invocations and render the combined tracefile once."""
+		if (len(self._coverageTracefiles) == 0):
+			return
+
+		coverageDirectory = self.Host.Directories.Root / self.Host.Config['CONFIG.DirectoryNames']['CoverageFiles']
+		tracefiles =        list(self._coverageTracefiles)
+		intermediates =     []
+		self.LogNormal("Merging {0} coverage tracefiles...".format(len(tracefiles)))
+		try:
+			with ThreadPoolExecutor(max_workers=(cpu_count() or 1)) as executor:
+				level = 0
+				while (len(tracefiles) > 1):
+					futures =   []
+					merged =    []
+					for index in range(0, len(tracefiles) - 1, 2):
+						outputFile = coverageDirectory / "merge-{0}-{1}.info".format(level, index // 2)
+						futures.append(executor.submit(self._MergeTracefiles, tracefiles[index:index + 2], outputFile))
+						merged.append(outputFile)
+					if ((len(tracefiles) % 2) == 1):
+						merged.append(tracefiles[-1])
+					for future in futures:
+						future.result()
+
+					intermediates.extend(file for file in merged if (file not in self._coverageTracefiles))
+					tracefiles =  merged
+					level +=      1
+		except GNUException as ex:
+			raise SimulatorException("Failed to merge coverage tracefiles.") from ex
+
+		combinedTracefile = tracefiles[0]
+		if ((combinedTracefile not in self._coverageTracefiles) and (not self.DryRun)):
+			combinedTracefile = coverageDirectory / "coverage.info"
+			os_replace(str(tracefiles[0]), str(combinedTracefile))
+			for file in intermediates:
+				if file.exists():
+					file.unlink()
+		self._coverageTracefiles = []
+		self._RunGenHtml([combinedTracefile], coverageDirectory / "html")
+
+	def _MergeTracefiles(self, tracefiles, outputFile):
 		lCov = LCov(self.Host.Platform, self.DryRun, logger=self.Logger)
-		lCov.Parameters[lCov.FlagCapture] =       True
-		lCov.Parameters[lCov.SwitchDirectory] =   "."
-		lCov.Parameters[lCov.SwitchOutputFile] =  coverageStatisticsFile
-		lCov.Execute()
+		lCov.WorkingDirectory = outputFile.parent
+		lCov.AddTracefiles(tracefiles, outputFile)
 
+	def _RunGenHtml(self, tracefiles, outputDirectory):
 		genHtml = GenHtml(self.Host.Platform, self.DryRun, logger=self.Logger)
-		genHtml.Parameters[genHtml.SwitchOutputDirectory] = coverageStatisticsOutputDirectory
-		genHtml.Parameters[genHtml.SwitchInputFiles] =      [coverageStatisticsFile]
+		genHtml.WorkingDirectory = self.Directories.Working
+		genHtml.Parameters[genHtml.SwitchOutputDirectory] = str(outputDirectory)
+		genHtml.Parameters[genHtml.SwitchInputFiles] =      [str(file) for file in tracefiles]
 		genHtml.Execute()
@@ -47,8 +47,10 @@ class Simulator(BaseSimulator, XilinxProjectExportMixIn):
 	TOOL_CHAIN =      ToolChain.Xilinx_ISE
 	TOOL =            Tool.Xilinx_iSim
 
-	def __init__(self, host, dryRun, simulationSteps):
-		super().__init__(host, dryRun, simulationSteps)
+	_BATCH_SCRIPT_OPTIONS = ("iSimBatchScript",)
+
+	def __init__(self, host, dryRun, simulationSteps, noCache=False):
+		super().__init__(host, dryRun, simulationSteps, noCache)
 		XilinxProjectExportMixIn.__init__(self)
 
 		iseFilesDirectoryName =         host.Config['CONFIG.DirectoryNames']['ISESimulatorFiles']
@@ -75,6 +77,7 @@ class Simulator(BaseSimulator, XilinxProjectExportMixIn):
 
 		# create a ISELinker instance
 		fuse = self._toolChain.GetFuse()
+		fuse.WorkingDirectory = self.Directories.Working
 		fuse.Parameters[fuse.FlagIncremental] =       True
 		fuse.Parameters[fuse.SwitchTimeResolution] =  "1fs"
 		fuse.Parameters[fuse.SwitchMultiThreading] =  "4"
@@ -101,6 +104,7 @@ class Simulator(BaseSimulator, XilinxProjectExportMixIn):
 
 		# create a ISESimulator instance
 		iSim = ISESimulator(self._host.Platform, self._host.DryRun, exeFilePath, self._toolChain._environment, logger=self.Logger)
+		iSim.WorkingDirectory = self.Directories.Working
 		iSim.Parameters[iSim.SwitchLogFile] =         str(iSimLogFilePath)
 
 		if (SimulationSteps.ShowWaveform not in self._simulationSteps):
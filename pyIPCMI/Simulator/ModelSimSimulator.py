@@ -32,7 +32,8 @@ from pathlib                      import Path
 from textwrap                     import dedent
 
 from pyIPCMI.Base.Executable              import DryRunException
-from pyIPCMI.Base.Project                 import FileTypes, ToolChain, Tool
+from pyIPCMI.Base.Incremental             import AnalysisState
+from pyIPCMI.Base.Project                 import ToolChain, Tool
 from pyIPCMI.DataBase.Config              import Vendors
 from pyIPCMI.ToolChain.Mentor.ModelSim    import ModelSim, ModelSimException, VHDLCompilerCoverageOptions, VHDLCompilerFSMVerbosityLevel
 from pyIPCMI.Simulator                    import VHDL_TESTBENCH_LIBRARY_NAME, SimulatorException, SkipableSimulatorException, SimulationSteps, Simulator as BaseSimulator
@@ -48,10 +49,15 @@ class Simulator(BaseSimulator):
 	TOOL_CHAIN =      ToolChain.Mentor_ModelSim
 	TOOL =            Tool.Mentor_vSim
 
-	def __init__(self, host, dryRun, simulationSteps):
+	_BATCH_SCRIPT_OPTIONS = ("vSimBatchScript", "vSimDefaultBatchScript")
+
+	def __init__(self, host, dryRun, simulationSteps, incremental=False, noCache=False):
 		# A separate elaboration step is not implemented in ModelSim
 		simulationSteps &= ~SimulationSteps.Elaborate
-		super().__init__(host, dryRun, simulationSteps)
+		# Incremental analysis reuses the VHDL libraries of previous runs
+		if (incremental is True):
+			simulationSteps &= ~SimulationSteps.CleanUpBefore
+		super().__init__(host, dryRun, simulationSteps, noCache)
 
 		vSimSimulatorFiles =            host.Config['CONFIG.DirectoryNames']['ModelSimFiles']
 		self.Directories.Working =      host.Directories.Temp / vSimSimulatorFiles
@@ -60,6 +66,7 @@ class Simulator(BaseSimulator):
 		self.ModelSimIniPath =          "modelsim.ini"
 
 		self._withCoverage =            False
+		self._analysisState =           AnalysisState(self.Directories.Working / "analysis.json", logger=self.Logger) if (incremental and not dryRun) else None
 
 		if (SimulationSteps.CleanUpBefore in self._simulationSteps):
 			pass
@@ -105,15 +112,25 @@ class Simulator(BaseSimulator):
 	def _RunAnalysis(self, _):
 		# create a VHDLCompiler instance
 		vlib = self._toolChain.GetVHDLLibraryTool()
+		vlib.WorkingDirectory = self.Directories.Working
+		if (self._analysisState is not None):
+			self._analysisState.Load()
 		for lib in self._pyIPCMIProject.VHDLLibraries:
+			if ((self._analysisState is not None) and (self.Directories.Working / lib.Name).exists()):
+				continue
 			vlib.Parameters[vlib.SwitchLibraryName] = lib.Name
 			try:
 				vlib.CreateLibrary()
 			except DryRunException:
 				pass
+			# a new library is empty, so no recorded file is analyzed into it
+			if (self._analysisState is not None):
+				self._analysisState.RemoveLibrary(lib.Name)
+				self._analysisState.Save()
 
 		# create a VHDLCompiler instance
 		vcom = self._toolChain.GetVHDLCompiler()
+		vcom.WorkingDirectory = self.Directories.Working
 		vcom.Parameters[vcom.FlagQuietMode] =         True
 		vcom.Parameters[vcom.FlagExplicit] =          True
 		vcom.Parameters[vcom.FlagRangeCheck] =        True
@@ -128,37 +145,61 @@ class Simulator(BaseSimulator):
 			puts "Recompiling..."
 			""")
 
-		# run vcom compile for each VHDL file
-		for file in self._pyIPCMIProject.Files(fileType=FileTypes.VHDLSourceFile):
-			if (not file.Path.exists()):              raise SimulatorException("Cannot analyse '{0!s}'.".format(file.Path)) from FileNotFoundError(str(file.Path))
-
-			vcomLogFile = self.Directories.Working / (file.Path.stem + ".vcom.log")
-			vcom.Parameters[vcom.SwitchVHDLLibrary] = file.LibraryName
-			vcom.Parameters[vcom.ArgLogFile] =        vcomLogFile
-			vcom.Parameters[vcom.ArgSourceFile] =     file.Path
-
-			try:
-				vcom.Compile()
-			except ModelSimException as ex:
-				raise SimulatorException("Error while compiling '{0!s}'.".format(file.Path)) from ex
-			if vcom.HasErrors:
-				raise SkipableSimulatorException("Error while compiling '{0!s}'.".format(file.Path))
-
-			# delete empty log files
-			if (vcomLogFile.exists() and vcomLogFile.stat().st_size == 0):
-				try:
-					vcomLogFile.unlink()
-				except OSError as ex:
-					raise SimulatorException("Error while deleting '{0!s}'.".format(vcomLogFile)) from ex
-
-			# collecting all compile commands in a buffer
-			recompileScriptContent += dedent("""\
-				puts "  Compiling '{file}'..."
-				{tcl}
-				""").format(
-					file=file.Path.as_posix(),
-					tcl=vcom.GetTclCommand()
-				)
+		# in incremental mode, analyze only changed files and their dependents
+		outdatedFiles = None
+		if (self._analysisState is not None):
+			vcom.Parameters[vcom.SwitchVHDLLibrary] = None
+			vcom.Parameters[vcom.ArgLogFile] =        None
+			vcom.Parameters[vcom.ArgSourceFile] =     None
+			vcom.Parameters[vcom.ArgSourceFiles] =    None
+			outdatedFiles = set(self._analysisState.GetOutdatedFiles(
+				[file for _, files in self._GetVHDLSourceFileBatches() for file in files],
+				vcom.GetTclCommand()
+			))
+			self.LogNormal("Incremental analysis: {0} file(s) outdated.".format(len(outdatedFiles)))
+
+		# run vcom once for each batch of VHDL files sharing a VHDL library
+		try:
+			for batchIndex, (libraryName, files) in enumerate(self._GetVHDLSourceFileBatches()):
+				analyzedFiles = files if (outdatedFiles is None) else [file for file in files if (file in outdatedFiles)]
+
+				vcomLogFile = self.Directories.Working / "{0}.{1}.vcom.log".format(libraryName, batchIndex)
+				vcom.Parameters[vcom.SwitchVHDLLibrary] = libraryName
+				vcom.Parameters[vcom.ArgLogFile] =        vcomLogFile
+				vcom.Parameters[vcom.ArgSourceFile] =     None
+				vcom.Parameters[vcom.ArgSourceFiles] =    [file.Path for file in analyzedFiles]
+
+				if (len(analyzedFiles) > 0):
+					try:
+						vcom.Compile()
+					except ModelSimException as ex:
+						raise SimulatorException("Error while compiling VHDL library '{0}'.".format(libraryName)) from ex
+					if vcom.HasErrors:
+						self._RunAnalysisPerFile(vcom, libraryName, analyzedFiles, ModelSimException)
+					if (self._analysisState is not None):
+						self._analysisState.Update(analyzedFiles)
+
+				# delete empty log files
+				if (vcomLogFile.exists() and vcomLogFile.stat().st_size == 0):
+					try:
+						vcomLogFile.unlink()
+					except OSError as ex:
+						raise SimulatorException("Error while deleting '{0!s}'.".format(vcomLogFile)) from ex
+
+				# collecting all compile commands in a buffer
+				vcom.Parameters[vcom.ArgSourceFile] =     None
+				vcom.Parameters[vcom.ArgSourceFiles] =    [file.Path for file in files]
+				recompileScriptContent += dedent("""\
+					puts "  Compiling {count} file(s) into library '{library}'..."
+					{tcl}
+					""").format(
+						count=len(files),
+						library=libraryName,
+						tcl=vcom.GetTclCommand()
+					)
+		finally:
+			if (self._analysisState is not None):
+				self._analysisState.Save()
 
 		recompileScriptContent += dedent("""\
 			puts "Recompilation done"
@@ -182,6 +223,7 @@ class Simulator(BaseSimulator):
 
 		# create a VHDLSimulator instance
 		vsim = self._toolChain.GetSimulator()
+		vsim.WorkingDirectory = self.Directories.Working
 		vsim.Parameters[vsim.SwitchModelSimIniFile] = self.ModelSimIniPath.as_posix()
 		# vsim.Parameters[vsim.FlagEnableOptimization] =      True			# FIXME:
 		vsim.Parameters[vsim.FlagReportAsError] =     "3473"
@@ -225,6 +267,7 @@ class Simulator(BaseSimulator):
 
 		# create a VHDLSimulator instance
 		vsim = self._toolChain.GetSimulator()
+		vsim.WorkingDirectory = self.Directories.Working
 		vsim.Parameters[vsim.SwitchModelSimIniFile] = self.ModelSimIniPath.as_posix()
 		# vsim.Parameters[vsim.FlagEnableOptimization] =      True			# FIXME:
 		vsim.Parameters[vsim.FlagReportAsError] =     "3473"
@@ -31,11 +31,11 @@
 from pathlib                      import Path
 from textwrap                     import dedent
 
-from pyIPCMI.Base.Project                 import FileTypes, ToolChain, Tool
+from pyIPCMI.Base.Project                 import ToolChain, Tool
 from pyIPCMI.DataBase.Config              import Vendors
 from pyIPCMI.ToolChain.Mentor.ModelSim    import ModelSim
 from pyIPCMI.ToolChain.Mentor.QuestaSim   import QuestaSimException
-from pyIPCMI.Simulator                    import VHDL_TESTBENCH_LIBRARY_NAME, SimulatorException, SkipableSimulatorException, SimulationSteps, Simulator as BaseSimulator
+from pyIPCMI.Simulator                    import VHDL_TESTBENCH_LIBRARY_NAME, SimulatorException, SimulationSteps, Simulator as BaseSimulator
 from pyIPCMI.Simulator.ModelSimSimulator  import Simulator as ModelSimSimulator_Simulator
 
 __api__ = [
@@ -48,10 +48,10 @@ class Simulator(ModelSimSimulator_Simulator):
 	TOOL_CHAIN =      ToolChain.Mentor_QuestaSim
 	TOOL =            Tool.Mentor_vSim
 
-	def __init__(self, host, dryRun, simulationSteps):
+	def __init__(self, host, dryRun, simulationSteps, incremental=False, noCache=False):
 		# A separate elaboration step is not implemented in ModelSim
 		simulationSteps &= ~SimulationSteps.Elaborate
-		super().__init__(host, dryRun, simulationSteps)
+		super().__init__(host, dryRun, simulationSteps, incremental=incremental, noCache=noCache)
 
 		vSimSimulatorFiles =            host.Config['CONFIG.DirectoryNames']['ModelSimFiles']
 		self.Directories.Working =      host.Directories.Temp / vSimSimulatorFiles
@@ -99,70 +99,6 @@ class Simulator(ModelSimSimulator_Simulator):
 
 		super().Run(testbench, board, vhdlVersion, vhdlGenerics)
 
-	def _RunAnalysis(self, _):
-		# create a VHDLCompiler instance
-		vlib = self._toolChain.GetVHDLLibraryTool()
-		for lib in self._pyIPCMIProject.VHDLLibraries:
-			vlib.Parameters[vlib.SwitchLibraryName] = lib.Name
-			vlib.CreateLibrary()
-
-		# create a VHDLCompiler instance
-		vcom = self._toolChain.GetVHDLCompiler()
-		vcom.Parameters[vcom.FlagQuietMode] =         True
-		vcom.Parameters[vcom.FlagExplicit] =          True
-		vcom.Parameters[vcom.FlagRangeCheck] =        True
-		vcom.Parameters[vcom.SwitchModelSimIniFile] = self.ModelSimIniPath.as_posix()
-		vcom.Parameters[vcom.SwitchVHDLVersion] =     repr(self._vhdlVersion)
-
-		recompileScriptContent = dedent("""\
-			puts "Recompiling..."
-			""")
-
-		# run vcom compile for each VHDL file
-		for file in self._pyIPCMIProject.Files(fileType=FileTypes.VHDLSourceFile):
-			if (not file.Path.exists()):              raise SimulatorException("Cannot analyse '{0!s}'.".format(file.Path)) from FileNotFoundError(str(file.Path))
-
-			vcomLogFile = self.Directories.Working / (file.Path.stem + ".vcom.log")
-			vcom.Parameters[vcom.SwitchVHDLLibrary] = file.LibraryName
-			vcom.Parameters[vcom.ArgLogFile] =        vcomLogFile
-			vcom.Parameters[vcom.ArgSourceFile] =     file.Path
-
-			try:
-				vcom.Compile()
-			except QuestaSimException as ex:
-				raise SimulatorException("Error while compiling '{0!s}'.".format(file.Path)) from ex
-			if vcom.HasErrors:
-				raise SkipableSimulatorException("Error while compiling '{0!s}'.".format(file.Path))
-
-			# delete empty log files
-			if (vcomLogFile.stat().st_size == 0):
-				try:
-					vcomLogFile.unlink()
-				except OSError as ex:
-					raise SimulatorException("Error while deleting '{0!s}'.".format(vcomLogFile)) from ex
-
-			# collecting all compile commands in a buffer
-			recompileScriptContent += dedent("""\
-				puts "  Compiling '{file}'..."
-				{tcl}
-				""").format(
-					file=file.Path.as_posix(),
-					tcl=vcom.GetTclCommand()
-				)
-
-		recompileScriptContent += dedent("""\
-			puts "Recompilation done"
-			puts "Restarting simulation..."
-			restart -force
-			puts "Simulation is restarted."
-			""")
-		recompileScriptContent = recompileScriptContent.replace("\\", "/")   # WORKAROUND: to convert all paths to Tcl compatible paths.
-
-		recompileScriptPath = self.Directories.Working / "recompile.do"
-		self.LogDebug("Writing recompile script to '{0!s}'".format(recompileScriptPath))
-		with recompileScriptPath.open('w') as fileHandle:
-			fileHandle.write(recompileScriptContent)
-
 	def _RunSimulation(self, testbench):
 		if (SimulationSteps.ShowWaveform in self._simulationSteps):
 			return self._RunSimulationWithGUI(testbench)
@@ -172,6 +108,7 @@ class Simulator(ModelSimSimulator_Simulator):
 
 		# create a VHDLSimulator instance
 		vsim = self._toolChain.GetSimulator()
+		vsim.WorkingDirectory = self.Directories.Working
 		vsim.Parameters[vsim.SwitchModelSimIniFile] = self.ModelSimIniPath.as_posix()
 		# vsim.Parameters[vsim.FlagEnableOptimization] =      True			# FIXME:
 		vsim.Parameters[vsim.FlagReportAsError] =     "3473"
@@ -203,6 +140,7 @@ class Simulator(ModelSimSimulator_Simulator):
 
 		# create a VHDLSimulator instance
 		vsim = self._toolChain.GetSimulator()
+		vsim.WorkingDirectory = self.Directories.Working
 		vsim.Parameters[vsim.SwitchModelSimIniFile] = self.ModelSimIniPath.as_posix()
 		# vsim.Parameters[vsim.FlagEnableOptimization] =      True			# FIXME:
 		vsim.Parameters[vsim.FlagReportAsError] =     "3473"
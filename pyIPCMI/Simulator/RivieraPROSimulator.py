@@ -31,20 +31,22 @@ from pathlib                      import Path
 from textwrap                     import dedent
 
 from pyIPCMI.Base.Executable              import DryRunException
-from pyIPCMI.Base.Project                 import FileTypes, ToolChain, Tool
+from pyIPCMI.Base.Project                 import ToolChain, Tool
 from pyIPCMI.DataBase.Config              import Vendors
 from pyIPCMI.ToolChain.Aldec.RivieraPRO   import RivieraPRO, RivieraPROException
-from pyIPCMI.Simulator                    import VHDL_TESTBENCH_LIBRARY_NAME, SimulatorException, SkipableSimulatorException, SimulationSteps, Simulator as BaseSimulator
+from pyIPCMI.Simulator                    import VHDL_TESTBENCH_LIBRARY_NAME, SimulatorException, SimulationSteps, Simulator as BaseSimulator
 
 
 class Simulator(BaseSimulator):
 	_TOOL_CHAIN =   ToolChain.Aldec_RivieraPRO
 	_TOOL =         Tool.Aldec_rPro
 
-	def __init__(self, host, dryRun, simulationSteps):
+	_BATCH_SCRIPT_OPTIONS = ("vSimBatchScript", "vSimDefaultBatchScript")
+
+	def __init__(self, host, dryRun, simulationSteps, noCache=False):
 		# A separate elaboration step is not implemented in RivieraPRO
 		simulationSteps &= ~SimulationSteps.Elaborate
-		super().__init__(host, dryRun, simulationSteps)
+		super().__init__(host, dryRun, simulationSteps, noCache)
 
 		vSimSimulatorFiles =            host.Config['CONFIG.DirectoryNames']['RivieraPROFiles']
 		self.Directories.Working =      host.Directories.Temp / vSimSimulatorFiles
@@ -97,6 +99,7 @@ class Simulator(BaseSimulator):
 	def _RunAnalysis(self, _):
 		# create a RivieraPROVHDLCompiler instance
 		vlib = self._toolChain.GetVHDLLibraryTool()
+		vlib.WorkingDirectory = self.Directories.Working
 		for lib in self._pyIPCMIProject.VHDLLibraries:
 			vlib.Parameters[vlib.SwitchLibraryName] = lib.Name
 			try:
@@ -106,24 +109,23 @@ class Simulator(BaseSimulator):
 
 		# create a RivieraPROVHDLCompiler instance
 		vcom = self._toolChain.GetVHDLCompiler()
+		vcom.WorkingDirectory = self.Directories.Working
 		vcom.Parameters[vcom.SwitchVHDLVersion] =       repr(self._vhdlVersion)
 
-		# run vcom compile for each VHDL file
-		for file in self._pyIPCMIProject.Files(fileType=FileTypes.VHDLSourceFile):
-			if (not file.Path.exists()):              raise SimulatorException("Cannot analyse '{0!s}'.".format(file.Path)) from FileNotFoundError(str(file.Path))
-
-			vcomLogFile = self.Directories.Working / (file.Path.stem + ".vcom.log")
-			vcom.Parameters[vcom.SwitchVHDLLibrary] = file.LibraryName
-			vcom.Parameters[vcom.ArgSourceFile] =     file.Path
+		# run vcom once for each batch of VHDL files sharing a VHDL library
+		for libraryName, files in self._GetVHDLSourceFileBatches():
+			vcom.Parameters[vcom.SwitchVHDLLibrary] = libraryName
+			vcom.Parameters[vcom.ArgSourceFile] =     None
+			vcom.Parameters[vcom.ArgSourceFiles] =    [file.Path for file in files]
 
 			try:
 				vcom.Compile()
 			except DryRunException:
 				pass
 			except RivieraPROException as ex:
-				raise SimulatorException("Error while compiling '{0!s}'.".format(file.Path)) from ex
+				raise SimulatorException("Error while compiling VHDL library '{0}'.".format(libraryName)) from ex
 			if vcom.HasErrors:
-				raise SkipableSimulatorException("Error while compiling '{0!s}'.".format(file.Path))
+				self._RunAnalysisPerFile(vcom, libraryName, files, RivieraPROException)
 
 	def _RunSimulation(self, testbench):
 		if (SimulationSteps.ShowWaveform in self._simulationSteps):
@@ -134,6 +136,7 @@ class Simulator(BaseSimulator):
 
 		# create a RivieraPROSimulator instance
 		vsim = self._toolChain.GetSimulator()
+		vsim.WorkingDirectory = self.Directories.Working
 		vsim.Parameters[vsim.SwitchTimeResolution] = "1fs"
 		vsim.Parameters[vsim.FlagCommandLineMode] = True
 		vsim.Parameters[vsim.SwitchTopLevel] = "{0}.{1}".format(VHDL_TESTBENCH_LIBRARY_NAME, testbench.ModuleName)
@@ -165,6 +168,7 @@ class Simulator(BaseSimulator):
 
 		# create a RivieraPROSimulator instance
 		vsim = self._toolChain.GetSimulator()
+		vsim.WorkingDirectory = self.Directories.Working
 		vsim.Parameters[vsim.SwitchRivieraPROIniFile] = self._RivieraPROIniPath.as_posix()
 		vsim.Parameters[vsim.SwitchTimeResolution] = "1fs"
 		vsim.Parameters[vsim.SwitchTopLevel] = "{0}.{1}".format(VHDL_TESTBENCH_LIBRARY_NAME, testbench.ModuleName)
@@ -48,8 +48,10 @@ class Simulator(BaseSimulator, XilinxProjectExportMixIn):
 	TOOL_CHAIN =      ToolChain.Xilinx_Vivado
 	TOOL =            Tool.Xilinx_xSim
 
-	def __init__(self, host, dryRun, simulationSteps):
-		super().__init__(host, dryRun, simulationSteps)
+	_BATCH_SCRIPT_OPTIONS = ("xSimBatchScript",)
+
+	def __init__(self, host, dryRun, simulationSteps, noCache=False):
+		super().__init__(host, dryRun, simulationSteps, noCache)
 		XilinxProjectExportMixIn.__init__(self)
 
 		vivadoFilesDirectoryName =      host.Config['CONFIG.DirectoryNames']['VivadoSimulatorFiles']
@@ -76,6 +78,7 @@ class Simulator(BaseSimulator, XilinxProjectExportMixIn):
 
 		# create a VivadoLinker instance
 		xelab = self._toolChain.GetElaborator()
+		xelab.WorkingDirectory = self.Directories.Working
 		xelab.Parameters[xelab.SwitchTimeResolution] =  "1fs"	# set minimum time precision to 1 fs
 		xelab.Parameters[xelab.SwitchMultiThreading] =  "off" if self.Logger.LogLevel is Severity.Debug else "auto"		# disable multithreading support in debug mode
 		xelab.Parameters[xelab.FlagRangeCheck] =        True
@@ -106,6 +109,7 @@ class Simulator(BaseSimulator, XilinxProjectExportMixIn):
 
 		# create a VivadoSimulator instance
 		xSim = self._toolChain.GetSimulator()
+		xSim.WorkingDirectory = self.Directories.Working
 		xSim.Parameters[xSim.SwitchLogFile] =         str(xSimLogFilePath)
 
 		if (SimulationSteps.ShowWaveform not in self._simulationSteps):
@@ -27,15 +27,24 @@
 # ==============================================================================
 #
 # load dependencies
+import json
 from datetime           import datetime
 from enum               import Enum, unique
+from hashlib            import sha256
+from itertools          import groupby
+from os                 import getpid, replace as os_replace
+from time               import sleep
+from xml.etree          import ElementTree
 
 from flags              import Flags
 
 from pyIPCMI.Base               import IHost
-from pyIPCMI.Base.Exceptions    import ExceptionBase, SkipableException
-from pyIPCMI.Base.Logging       import LogEntry
-from pyIPCMI.Base.Project       import Environment, VHDLVersion
+from pyIPCMI.Base.Exceptions    import ExceptionBase, CommonException, SkipableException
+from pyIPCMI.Base.Executable    import DryRunException, Watchdog
+from pyIPCMI.Base.History       import RuntimeHistory
+from pyIPCMI.Base.Incremental   import GetFileHash
+from pyIPCMI.Base.Logging       import ILogable, LogEntry
+from pyIPCMI.Base.Project       import Environment, VHDLVersion, FileTypes
 from pyIPCMI.Base.Shared        import Shared, to_time
 from pyIPCMI.DataBase.Entity    import WildCard, SimulationResult
 from pyIPCMI.DataBase.TestCase  import TestCase, SimulationStatus, TestSuite
@@ -48,10 +57,13 @@ __api__ = [
 	'SimulatorException',
 	'SkipableSimulatorException',
 	'pyIPCMISimulationResultNotFoundException',
+	'SimulationTimeoutException',
 	'SimulationSteps',
 	'SimulationState',
 	'SimulationResult',
+	'SimulationResultCache',
 	'Simulator',
+	'RegressionPlanner',
 	'pyIPCMISimulationResultFilter'
 ]
 __all__ = __api__
@@ -75,6 +87,11 @@ class pyIPCMISimulationResultNotFoundException(SkipableSimulatorException):
 	not found in the simulator's output.
 	"""
 
+class SimulationTimeoutException(SkipableSimulatorException):
+	"""This exception is raised if a testbench exceeded its wall-clock or
+	inactivity timeout and its processes were killed.
+	"""
+
 
 @unique
 class SimulationSteps(Flags):
@@ -112,17 +129,81 @@ class SimulationState(Enum):
 	Coverage =    6
 
 
+class SimulationResultCache(ILogable):
+	"""A cache of passed simulation results.
+
+	Each entry is a JSON file named by a cache key, which holds the run time and
+	the phase timings of a passed testbench run.
+	"""
+	_FORMAT_VERSION = 1
+
+	def __init__(self, directory, logger=None):
+		"""Class initializer
+
+		:type  directory: pathlib.Path
+		:param directory: The cache's root directory.
+		"""
+		super().__init__(logger)
+
+		self._directory = directory
+
+	@property
+	def Directory(self):      return self._directory
+
+	def Lookup(self, key):
+		"""Return the cache entry *key* or ``None``, if no passed result is stored."""
+		entryFilePath = self._directory / (key + ".json")
+		if (not entryFilePath.exists()):
+			return None
+
+		try:
+			with entryFilePath.open('r') as fileHandle:
+				entry = json.load(fileHandle)
+		except (OSError, ValueError) as ex:
+			self.LogWarning("Ignoring unreadable simulation cache entry '{0}': {1!s}".format(key, ex))
+			return None
+
+		if ((entry.get("Version") != self._FORMAT_VERSION) or (entry.get("Result") != SimulationResult.Passed.name)):
+			return None
+		return entry
+
+	def Store(self, key, testCase):
+		"""Store the result and timings of a passed *testCase* as entry *key*."""
+		entry = {
+			"Version":    self._FORMAT_VERSION,
+			"Testbench":  str(testCase.Testbench.Parent),
+			"Result":     SimulationResult.Passed.name,
+			"StartTime":  testCase.StartTime.isoformat(),
+			"Duration":   testCase.OverallRunTimeNs,
+			"Phases":     testCase.PhaseTimes
+		}
+		entryFilePath =     self._directory / (key + ".json")
+		temporaryFilePath = self._directory / "{0}.{1}.tmp".format(key, getpid())
+		try:
+			if (not self._directory.exists()):
+				self._directory.mkdir(parents=True)
+			with temporaryFilePath.open('w') as fileHandle:
+				json.dump(entry, fileHandle, indent=1)
+			os_replace(str(temporaryFilePath), str(entryFilePath))
+		except OSError as ex:
+			raise SimulatorException("Error while writing simulation cache entry '{0!s}'.".format(entryFilePath)) from ex
+		self.LogDebug("Stored simulation result in cache entry '{0}'.".format(key))
+
+
 class Simulator(Shared):
 	"""Base class for all Simulator classes."""
 
 	ENVIRONMENT =     Environment.Simulation
 	VHDL_VERSION =    VHDLVersion.VHDL2008
 
+	# testbench options naming the Tcl/do scripts, which drive a batch simulation
+	_BATCH_SCRIPT_OPTIONS = ()
+
 	class __Directories__(Shared.__Directories__):
 		PreCompiled = None
 
 	@DocumentMemberAttribute()
-	def __init__(self, host : IHost, dryRun, simulationSteps : SimulationSteps):
+	def __init__(self, host : IHost, dryRun, simulationSteps : SimulationSteps, noCache=False):
 		"""Class initializer
 
 		:type  host:            object
@@ -131,24 +212,43 @@ class Simulator(Shared):
 		:param dryRun:          Enable dry-run mode
 		:type  simulationSteps: SimulationSteps
 		:param simulationSteps: A set of simulation step to precess.
+		:type  noCache:         bool
+		:param noCache:         Don't skip testbenches with a cached passed result.
 		"""
 		super().__init__(host, dryRun)
 
 		self._vhdlVersion =     None
 		self._vhdlGenerics =    None
 		self._toolChain =       None
+		self._withCoverage =    False
 
 		self._simulationSteps = simulationSteps
 		self._testSuite =       TestSuite()  # TODO: This includes not the read ini files phases ...
 		self._state =           SimulationState.Prepare
+		self._testCase =        None
+		self._resultCache =     None
+		self._history =         None
+		self._cacheKey =        None
+		self._cacheEntry =      None
+		self._prepareTime =     None
 		self._analyzeTime =     None
 		self._elaborationTime = None
 		self._simulationTime =  None
+		self._profiler =        host.Profiler
+
+		if (not (noCache or dryRun)):
+			cacheDirectory =      host.Directories.Root / host.Config['CONFIG.DirectoryNames']['SimulationCacheFiles']
+			self._resultCache =   SimulationResultCache(cacheDirectory, logger=self.Logger)
+		if (not dryRun):
+			historyFilePath =     host.Directories.Root / host.Config['CONFIG.DirectoryNames']['RuntimeHistoryFile']
+			self._history =       RuntimeHistory(historyFilePath, logger=self.Logger)
 
 	# class properties
 	# ============================================================================
 	@property
 	def TestSuite(self):      return self._testSuite
+	@property
+	def NoCache(self):        return (self._resultCache is None)
 
 	def _PrepareSimulationEnvironment(self):
 		self.LogNormal("Preparing simulation environment...")
@@ -162,32 +262,218 @@ class Simulator(Shared):
 	def _PrepareSimulator(self):
 		pass
 
-	def RunAll(self, fqnList, *args, **kwargs):
-		"""Run a list of testbenches. Expand wildcards to all selected testbenches."""
+	def RunAll(self, fqnList, *args, maxFailures=None, shard=None, **kwargs):
+		"""Run a list of testbenches. Expand wildcards to all selected testbenches.
+
+		If *maxFailures* is given, no further testbenches are started after this
+		number of testbenches failed. The remaining testbenches are reported as not
+		run.
+
+		Testbenches are run longest-first according to the runtime history. If
+		*shard* is given as ``(index, count)``, only the testbenches of this shard
+		are run.
+		"""
 		self._testSuite.StartTimer()
 		self.Logger.BaseIndent = int(len(fqnList) > 1)
 		try:
-			for fqn in fqnList:
-				entity = fqn.Entity
-				if (isinstance(entity, WildCard)):
-					self.Logger.BaseIndent = 1
-					for testbench in entity.GetVHDLTestbenches():
-						self.TryRun(testbench, *args, **kwargs)
-				else:
-					testbench = entity.VHDLTestbench
-					self.TryRun(testbench, *args, **kwargs)
+			testbenches = self._ResolveTestbenches(fqnList)
+			testbenches = self._SelectShard(testbenches, shard, self._GetTestbenchName)
+			testbenches = self._SortByRuntimeHistory(testbenches, self._GetRuntimeEstimates())
+
+			for index, testbench in enumerate(testbenches):
+				self.TryRun(testbench, *args, **kwargs)
+				if ((maxFailures is not None) and (self._testSuite.FailedCount + self._testSuite.ErrorCount >= maxFailures)):
+					self._SkipRemainingTestbenches(testbenches[index + 1:], maxFailures)
+					break
+
+			if (SimulationSteps.ShowCoverage in self._simulationSteps):
+				self._RunCoverageMerge()
 		except KeyboardInterrupt:
 			self.LogError("Received a keyboard interrupt.")
 		finally:
 			self._testSuite.StopTimer()
+			if (self._history is not None):
+				self._history.Close()
 
 		if (SimulationSteps.ShowReport in self._simulationSteps):
 			self.PrintOverallSimulationReport()
 
 		return self._testSuite.IsAllPassed
 
-	def TryRun(self, testbench, *args, **kwargs):
-		"""Try to run a testbench. Skip skipable exceptions by printing the error and its cause."""
+	def WatchAll(self, fqnList, *args, pollInterval=1.0, debounce=0.5, **kwargs):
+		"""Run a list of testbenches and rerun them on file changes until a
+		keyboard interrupt is received.
+
+		After each run, all files of the testbenches' pyIPCMI projects, including
+		the ``*.files`` files, are polled every *pollInterval* seconds. Changes are
+		collected until no further file changed for *debounce* seconds, so saving
+		several files triggers a single run. Then only the testbenches, whose
+		projects contain a changed file, are rerun.
+		"""
+		self.Logger.BaseIndent = int(len(fqnList) > 1)
+		testbenches = self._ResolveTestbenches(fqnList)
+		fileSets =    {}
+		try:
+			affected = testbenches
+			while True:
+				self._RunWatchCycle(affected, fileSets, args, kwargs)
+
+				stamps = self._GetFileStamps(set().union(*fileSets.values()))
+				self.LogQuiet("Watching {0} file(s) of {1} testbench(es). Press Ctrl+C to stop.".format(len(stamps), len(testbenches)))
+				changedFiles = self._WaitForChanges(stamps, pollInterval, debounce)
+				for path in sorted(changedFiles):
+					self.LogNormal("Changed: '{0!s}'".format(path))
+
+				affected = [testbench for testbench in testbenches if (not fileSets[self._GetTestbenchName(testbench)].isdisjoint(changedFiles))]
+				self.LogQuiet("Rerunning {0} affected testbench(es).".format(len(affected)))
+		except KeyboardInterrupt:
+			self.LogQuiet("Stopped watching.")
+		finally:
+			if (self._history is not None):
+				self._history.Close()
+
+	def _RunWatchCycle(self, testbenches, fileSets, args, kwargs):
+		"""Run *testbenches* as a new test suite and record the files of each
+		testbench's pyIPCMI project in *fileSets*."""
+		self._testSuite = TestSuite()
+		self._testSuite.StartTimer()
+		try:
+			for testbench in testbenches:
+				self._pyIPCMIProject = None
+				try:
+					self.TryRun(testbench, *args, **kwargs)
+				except ExceptionBase as ex:
+					# keep watching; the next change may fix the error
+					self.LogError("{0!s}".format(ex.__cause__ or ex))
+				fileSets[self._GetTestbenchName(testbench)] = self._GetWatchedFiles(testbench)
+		finally:
+			self._testSuite.StopTimer()
+
+		if (SimulationSteps.ShowReport in self._simulationSteps):
+			self.PrintOverallSimulationReport()
+
+	def _GetWatchedFiles(self, testbench):
+		"""Return the paths of all files in the pyIPCMI project of the last run of
+		*testbench*. If the project could not be created, only its ``*.files``
+		file is watched."""
+		files = {testbench.FilesFile}
+		if (self._pyIPCMIProject is not None):
+			files.update(file.Path for file in self._pyIPCMIProject.Files())
+		return files
+
+	@staticmethod
+	def _GetFileStamps(paths):
+		stamps = {}
+		for path in paths:
+			try:
+				stamps[path] = path.stat().st_mtime_ns
+			except OSError:
+				stamps[path] = None
+		return stamps
+
+	@classmethod
+	def _GetChangedFiles(cls, stamps):
+		"""Return all files, whose modification time changed, and update *stamps*."""
+		newStamps = cls._GetFileStamps(stamps.keys())
+		changedFiles = {path for path, stamp in newStamps.items() if (stamp != stamps[path])}
+		stamps.update(newStamps)
+		return changedFiles
+
+	def _WaitForChanges(self, stamps, pollInterval, debounce):
+		"""Block until files in *stamps* changed and no further change happened
+		for *debounce* seconds. Return all changed files."""
+		while True:
+			sleep(pollInterval)
+			changedFiles = self._GetChangedFiles(stamps)
+			if (len(changedFiles) > 0):
+				break
+
+		while True:
+			sleep(debounce)
+			moreFiles = self._GetChangedFiles(stamps)
+			if (len(moreFiles) == 0):
+				return changedFiles
+			changedFiles |= moreFiles
+
+	def _ResolveTestbenches(self, fqnList):
+		"""Return all testbenches selected by *fqnList*. Wildcards are expanded."""
+		testbenches = []
+		for fqn in fqnList:
+			entity = fqn.Entity
+			if (isinstance(entity, WildCard)):
+				self.Logger.BaseIndent = 1
+				testbenches.extend(self._GetTestbenches(entity))
+			else:
+				testbenches.append(self._GetTestbench(entity))
+		return testbenches
+
+	def _GetTestbenches(self, wildcard):
+		"""Return all testbenches selected by *wildcard*."""
+		return wildcard.GetVHDLTestbenches()
+
+	def _GetTestbench(self, entity):
+		"""Return the testbench of *entity*."""
+		return entity.VHDLTestbench
+
+	def _GetToolVersion(self):
+		return str(self._toolChain.Version) if (self._toolChain is not None) else ""
+
+	@staticmethod
+	def _GetTestbenchName(testbench):
+		return str(testbench.Parent)
+
+	def _GetRuntimeEstimates(self):
+		"""Return the estimated run times of all testbenches recorded in the
+		runtime history for this tool."""
+		if (self._history is None):
+			return {}
+
+		try:
+			return self._history.GetEstimates(self.TOOL.name, self._GetToolVersion())
+		except CommonException as ex:
+			self.LogWarning("Ignoring runtime history: {0!s}".format(ex.__cause__ or ex))
+			self._history = None
+			return {}
+
+	def _SortByRuntimeHistory(self, testbenches, estimates):
+		"""Order *testbenches* longest-first by their estimated run time.
+		Testbenches without history are run first, as their run time is unknown.
+		Testbenches with equal estimates keep their order."""
+		unknown = float("inf")
+		return sorted(testbenches, key=lambda testbench: estimates.get(self._GetTestbenchName(testbench), unknown), reverse=True)
+
+	def _RecordRuntimeHistory(self, testbench, testCase):
+		"""Record an executed testbench run in the runtime history. Cached
+		results and GUI runs are not recorded."""
+		if ((self._history is None) or (testCase.Status in (SimulationStatus.SimulationCached, SimulationStatus.SimulationGUIRun))):
+			return
+
+		try:
+			self._history.Record(self._GetTestbenchName(testbench), self.TOOL.name, self._GetToolVersion(), testCase)
+		except CommonException as ex:
+			self.LogWarning("Disabling runtime history: {0!s}".format(ex.__cause__ or ex))
+			self._history = None
+
+	def _SkipRemainingTestbenches(self, testbenches, maxFailures):
+		"""Report all *testbenches* as not run, because *maxFailures* was reached."""
+		if (len(testbenches) == 0):
+			return
+
+		self.LogWarning("Reached the maximum number of failures ({0}). Skipping {1} remaining testbench(es).".format(maxFailures, len(testbenches)))
+		self._testSuite.IsAborted = True
+		for testbench in testbenches:
+			testCase = TestCase(testbench)
+			testCase.Status = SimulationStatus.NotRun
+			self._testSuite.AddTestCase(testCase)
+
+	def TryRun(self, testbench, *args, timeout=None, inactivityTimeout=None, **kwargs):
+		"""Try to run a testbench. Skip skipable exceptions by printing the error and its cause.
+
+		A testbench exceeding its wall-clock timeout or producing no output for
+		*inactivityTimeout* seconds is killed and skipped. Both timeouts can be
+		overridden per testbench by the options ``Timeout`` and
+		``InactivityTimeout``.
+		"""
 		__SIMULATION_STATE_TO_TESTCASE_STATUS__ = {
 			SimulationState.Prepare:   SimulationStatus.InternalError,
 			SimulationState.Analyze:   SimulationStatus.AnalyzeError,
@@ -198,12 +484,30 @@ class Simulator(Shared):
 
 		testCase = TestCase(testbench)
 		self._testSuite.AddTestCase(testCase)
+		self._testCase =    testCase
+		self._cacheKey =    None
+		self._cacheEntry =  None
+		watchdog =          self._GetWatchdog(testbench, timeout, inactivityTimeout)
 		testCase.StartTimer()
 		try:
-			self.Run(testbench, *args, **kwargs)
-			testCase.UpdateStatus(testbench.Result)
+			with watchdog:
+				try:
+					self.Run(testbench, *args, **kwargs)
+				except ExceptionBase as ex:
+					if (not watchdog.HasExpired):   raise
+					raise SimulationTimeoutException("Timeout in testbench '{0!s}': {1}".format(testbench.Parent, watchdog.Reason)) from ex
+			if watchdog.HasExpired:
+				raise SimulationTimeoutException("Timeout in testbench '{0!s}': {1}".format(testbench.Parent, watchdog.Reason))
+
+			if (self._cacheEntry is not None):
+				testCase.UpdateFromCache(self._cacheEntry["Duration"], self._cacheEntry["Phases"])
+			else:
+				testCase.UpdateStatus(testbench.Result)
 		except SkipableSimulatorException as ex:
-			testCase.Status = __SIMULATION_STATE_TO_TESTCASE_STATUS__[self._state]
+			if isinstance(ex, SimulationTimeoutException):
+				testCase.Status = SimulationStatus.SimulationTimeout
+			else:
+				testCase.Status = __SIMULATION_STATE_TO_TESTCASE_STATUS__[self._state]
 
 			self.LogQuiet("  {RED}ERROR:{NOCOLOR} {ExMsg}".format(ExMsg=ex.message, **Init.Foreground))
 			cause = ex.__cause__
@@ -221,6 +525,42 @@ class Simulator(Shared):
 			raise
 		finally:
 			testCase.StopTimer()
+			self._testCase = None
+			self._RecordRuntimeHistory(testbench, testCase)
+
+		if ((self._cacheKey is not None) and (testCase.Status is SimulationStatus.SimulationSuccess)):
+			self._resultCache.Store(self._cacheKey, testCase)
+
+	def _GetWatchdog(self, testbench, timeout, inactivityTimeout):
+		"""Create a watchdog for *testbench*. Per testbench options override the
+		global timeouts. Interactive (GUI) runs are never timed out."""
+		if (SimulationSteps.ShowWaveform in self._simulationSteps):
+			return Watchdog()
+
+		configSection = self.Host.Config[testbench.ConfigSectionName]
+		def _GetTimeout(optionName, default):
+			value = configSection[optionName]
+			if (value == ""):
+				return default
+			try:
+				return float(value)
+			except ValueError as ex:
+				raise SimulatorException("Option '{0}' in section '{1}' is not a number.".format(optionName, testbench.ConfigSectionName)) from ex
+
+		return Watchdog(_GetTimeout("Timeout", timeout), _GetTimeout("InactivityTimeout", inactivityTimeout))
+
+	def _StopPhaseTimer(self, phase):
+		"""Record the duration of a simulation phase on the current test case.
+
+		:param phase: Name of the finished phase.
+		:rtype:       int
+		:return:      The duration of the phase in nanoseconds or ``None``, if no test case is running.
+		"""
+		if (self._profiler is not None):
+			self._profiler.Phase(phase)
+		if (self._testCase is None):
+			return None
+		return self._testCase.StopPhaseTimer(phase)
 
 	def Run(self, testbench, board, vhdlVersion, vhdlGenerics=None):
 		"""Write the Testbench message line, create a pyIPCMIProject and add the first *.files file to it."""
@@ -233,7 +573,10 @@ class Simulator(Shared):
 		self._CreatepyIPCMIProject(testbench.ModuleName, board)
 		self._AddFileListFile(testbench.FilesFile)
 
-		self._prepareTime = self._GetTimeDeltaSinceLastEvent()
+		self._prepareTime = self._StopPhaseTimer("Prepare")
+
+		if self._TryRestoreFromResultCache(testbench):
+			return
 
 		if self._simulationSteps.CleanUpBefore:
 			pass
@@ -245,13 +588,13 @@ class Simulator(Shared):
 			self.LogNormal("Running analysis for every vhdl file...")
 			self._state = SimulationState.Analyze
 			self._RunAnalysis(testbench)
-			self._analyzeTime = self._GetTimeDeltaSinceLastEvent()
+			self._analyzeTime = self._StopPhaseTimer("Analyze")
 
 		if self._simulationSteps.Elaborate:
 			self.LogNormal("Running elaboration...")
 			self._state = SimulationState.Elaborate
 			self._RunElaboration(testbench)
-			self._elaborationTime = self._GetTimeDeltaSinceLastEvent()
+			self._elaborationTime = self._StopPhaseTimer("Elaborate")
 
 		# if self._simulationSteps.Optimize:
 		# 	pass
@@ -260,7 +603,7 @@ class Simulator(Shared):
 			self.LogNormal("Running simulation...")
 			self._state = SimulationState.Simulate
 			self._RunSimulation(testbench)
-			self._simulationTime = self._GetTimeDeltaSinceLastEvent()
+			self._simulationTime = self._StopPhaseTimer("Simulate")
 
 		if self._simulationSteps.ShowWaveform:
 			self.LogNormal("Executing waveform viewer...")
@@ -274,6 +617,116 @@ class Simulator(Shared):
 
 		self._endAt = datetime.now()
 
+	def _GetSimulationCacheKey(self, testbench):
+		"""Compute the simulation cache key from the tool, its version, the VHDL
+		version, the board and device, the coverage flag, the testbench's HDL
+		generics, the batch scripts driving the simulation and all files in the
+		project."""
+		hash = sha256()
+		def _update(value):
+			hash.update(str(value).encode("utf-8"))
+			hash.update(b"\0")
+
+		board = self._pyIPCMIProject.Board
+		_update(self.TOOL)
+		_update(self._toolChain.Version if (self._toolChain is not None) else None)
+		_update(self._vhdlVersion)
+		_update(board.Name)
+		_update(board.Device)
+		_update(testbench.ModuleName)
+		_update(self._withCoverage)
+
+		generics = self._GetHDLParameters(testbench.ConfigSectionName)
+		if (self._vhdlGenerics is not None):
+			generics.update(self._vhdlGenerics)
+		for key in sorted(generics):
+			_update("{0}={1}".format(key, generics[key]))
+
+		configSection = self.Host.Config[testbench.ConfigSectionName]
+		for optionName in self._BATCH_SCRIPT_OPTIONS:
+			scriptFilePath = self.Host.Directories.Root / configSection[optionName]
+			_update(optionName)
+			if scriptFilePath.exists():
+				_update(scriptFilePath.as_posix())
+				_update(GetFileHash(scriptFilePath))
+			else:
+				_update(None)
+
+		for file in self._pyIPCMIProject.Files():
+			_update(file.Path.as_posix())
+			_update(GetFileHash(file.Path))
+		return hash.hexdigest()
+
+	def _TryRestoreFromResultCache(self, testbench):
+		"""Look up a passed result of an identical testbench run.
+
+		The cache is only used for batch simulations; runs displaying a waveform,
+		collecting coverage data or displaying it are always executed.
+
+		:rtype:   bool
+		:return:  True, if the testbench doesn't need to be executed.
+		"""
+		if (self._resultCache is None):
+			return False
+		if ((SimulationSteps.Simulate not in self._simulationSteps) or (self._withCoverage is True) or
+				(SimulationSteps.ShowWaveform in self._simulationSteps) or
+				(SimulationSteps.ShowCoverage in self._simulationSteps)):
+			return False
+
+		try:
+			self._cacheKey = self._GetSimulationCacheKey(testbench)
+		except OSError as ex:
+			self.LogWarning("Cannot compute simulation cache key: {0!s}".format(ex))
+			return False
+
+		self.LogDebug("Simulation cache key: {0}".format(self._cacheKey))
+		self._cacheEntry = self._resultCache.Lookup(self._cacheKey)
+		if (self._cacheEntry is None):
+			return False
+
+		self.LogNormal("Sources and generics are unchanged since the last passed run. Skipping simulation.")
+		testbench.Result = SimulationResult.Passed
+		return True
+
+	def _GetVHDLSourceFileBatches(self):
+		"""Group consecutive VHDL source files sharing the same VHDL library into
+		batches, so each batch can be analyzed by a single compiler invocation.
+
+		The analysis order of the project is preserved. All files of a project are
+		analyzed with the same VHDL version, so the library name is the only key.
+
+		:rtype:   generator
+		:return:  Tuples of a VHDL library name and a list of VHDL source files.
+		"""
+		for libraryName, files in groupby(self._pyIPCMIProject.Files(fileType=FileTypes.VHDLSourceFile), key=lambda file: file.LibraryName):
+			files = list(files)
+			for file in files:
+				if (not file.Path.exists()):    raise SimulatorException("Cannot analyse '{0!s}'.".format(file.Path)) from FileNotFoundError(str(file.Path))
+			yield libraryName, files
+
+	def _RunAnalysisPerFile(self, compiler, libraryName, files, toolException):
+		"""Recompile a failed batch file by file to pinpoint the erroneous source file.
+
+		:param compiler:      The VHDL compiler instance, which failed to analyze the batch.
+		:param libraryName:   The VHDL library name of the batch.
+		:param files:         The list of VHDL source files of the batch.
+		:param toolException: The tool specific exception class raised by the compiler.
+		"""
+		self.LogWarning("Analysis of VHDL library '{0}' failed. Recompiling file by file...".format(libraryName))
+		compiler.Parameters[compiler.ArgSourceFiles] = None
+		for file in files:
+			compiler.Parameters[compiler.ArgSourceFile] = file.Path
+			try:
+				compiler.Compile()
+			except DryRunException:
+				pass
+			except toolException as ex:
+				raise SimulatorException("Error while compiling '{0!s}'.".format(file.Path)) from ex
+			if compiler.HasErrors:
+				raise SkipableSimulatorException("Error while compiling '{0!s}'.".format(file.Path))
+
+		raise SkipableSimulatorException("Error while compiling VHDL library '{0}'.".format(libraryName))
+
 	def _RunAnalysis(self, testbench):
 		pass
 
@@ -289,6 +742,10 @@ class Simulator(Shared):
 	def _RunCoverage(self, testbench):
 		pass
 
+	def _RunCoverageMerge(self):
+		"""Combine the coverage data of all testbenches after the last run."""
+		pass
+
 	def PrintOverallSimulationReport(self):
 		self.LogQuiet("{HEADLINE}{line}{NOCOLOR}".format(line="=" * 80, **Init.Foreground))
 		self.LogQuiet("{HEADLINE}{headline: ^80s}{NOCOLOR}".format(headline="Overall Simulation Report", **Init.Foreground))
@@ -307,33 +764,43 @@ class Simulator(Shared):
 			failed=self._testSuite.FailedCount,
 			error=self._testSuite.ErrorCount
 		))
+		if ((self._resultCache is not None) or (self._testSuite.CachedCount > 0)):
+			self.LogQuiet("Simulation cache:  Cached: {cached: <3}".format(cached=self._testSuite.CachedCount))
+		if self._testSuite.IsAborted:
+			self.LogQuiet("{RED}Aborted after too many failures.{NOCOLOR}  Not run: {notrun: <3}".format(notrun=self._testSuite.NotRunCount, **Init.Foreground))
 		self.LogQuiet("{HEADLINE}{line}{NOCOLOR}".format(line="=" * 80, **Init.Foreground))
 
 	__SIMULATION_REPORT_COLOR_TABLE__ = {
 		SimulationStatus.Unknown:             "RED",
 		SimulationStatus.DryRun:              "YELLOW",
+		SimulationStatus.NotRun:              "DARK_GRAY",
 		SimulationStatus.InternalError:       "DARK_RED",
 		SimulationStatus.SystemError:         "DARK_RED",
 		SimulationStatus.AnalyzeError:        "DARK_RED",
 		SimulationStatus.ElaborationError:    "DARK_RED",
 		SimulationStatus.SimulationError:     "RED",
 		SimulationStatus.SimulationFailed:    "RED",
+		SimulationStatus.SimulationTimeout:   "RED",
 		SimulationStatus.SimulationNoAsserts: "YELLOW",
 		SimulationStatus.SimulationSuccess:   "GREEN",
+		SimulationStatus.SimulationCached:    "GREEN",
 		SimulationStatus.SimulationGUIRun:    "YELLOW"
 	}
 
 	__SIMULATION_REPORT_STATUS_TEXT_TABLE__ = {
 		SimulationStatus.Unknown:             "-- ?? --",
 		SimulationStatus.DryRun:              "DRY RUN",
+		SimulationStatus.NotRun:              "NOT RUN",
 		SimulationStatus.InternalError:       "INT. ERROR",
 		SimulationStatus.SystemError:         "SYS. ERROR",
 		SimulationStatus.AnalyzeError:        "ANA. ERROR",
 		SimulationStatus.ElaborationError:    "ELAB. ERROR",
 		SimulationStatus.SimulationError:     "SIM. ERROR",
 		SimulationStatus.SimulationFailed:    "FAILED",
+		SimulationStatus.SimulationTimeout:   "TIMEOUT",
 		SimulationStatus.SimulationNoAsserts: "NO ASSERTS",
 		SimulationStatus.SimulationSuccess:   "PASSED",
+		SimulationStatus.SimulationCached:    "CACHED",
 		SimulationStatus.SimulationGUIRun:    "GUI RUN"
 	}
 
@@ -350,6 +817,204 @@ class Simulator(Shared):
 																		status=self.__SIMULATION_REPORT_STATUS_TEXT_TABLE__[testCase.Status], **Init.Foreground))
 
 
+	__SIMULATION_REPORT_JUNIT_ERRORS__ = (
+		SimulationStatus.InternalError, SimulationStatus.SystemError, SimulationStatus.AnalyzeError,
+		SimulationStatus.ElaborationError, SimulationStatus.SimulationError, SimulationStatus.SimulationTimeout
+	)
+	__SIMULATION_REPORT_JUNIT_SKIPPED__ = (SimulationStatus.Unknown, SimulationStatus.DryRun, SimulationStatus.NotRun)
+
+	def _IterateTestCases(self, testObject, groupPath):
+		"""Yield all test cases in *testObject* together with their group path."""
+		for group in testObject.Groups.values():
+			yield from self._IterateTestCases(group, groupPath + [group.Name])
+		for testCase in testObject.TestCases.values():
+			yield ".".join(groupPath), testCase
+
+	def WriteJUnitReport(self, reportFilePath):
+		"""Write the results of all test cases as a JUnit XML file. Phase timings
+		are stored as properties of each test case.
+
+		:type  reportFilePath:  pathlib.Path
+		:param reportFilePath:  Path of the XML report file.
+		"""
+		self.LogVerbose("Writing JUnit report to '{0!s}'.".format(reportFilePath))
+		testSuite = self._testSuite
+		testCases = list(self._IterateTestCases(testSuite, [testSuite.Name]))
+		rootElement = ElementTree.Element("testsuites", name=testSuite.Name)
+		suiteElement = ElementTree.SubElement(rootElement, "testsuite",
+			name=testSuite.Name,
+			tests=str(len(testCases)),
+			failures=str(testSuite.FailedCount),
+			errors=str(testSuite.ErrorCount),
+			skipped=str(sum([1 for _, tc in testCases if tc.Status in self.__SIMULATION_REPORT_JUNIT_SKIPPED__])),
+			time="{0:.6f}".format(testSuite.OverallRunTime),
+			timestamp=testSuite.StartTime.replace(microsecond=0).isoformat()
+		)
+
+		for groupName, testCase in testCases:
+			testCaseElement = ElementTree.SubElement(suiteElement, "testcase", classname=groupName, name=testCase.Name,
+																								time="{0:.6f}".format(testCase.OverallRunTime))
+			propertiesElement = ElementTree.SubElement(testCaseElement, "properties")
+			for phase, duration in testCase.PhaseTimes.items():
+				ElementTree.SubElement(propertiesElement, "property", name="time." + phase, value="{0:.6f}".format(duration / 1e9))
+			if (testCase.Status is SimulationStatus.SimulationCached):
+				ElementTree.SubElement(propertiesElement, "property", name="cached", value="true")
+
+			statusText = self.__SIMULATION_REPORT_STATUS_TEXT_TABLE__[testCase.Status]
+			if (testCase.Status is SimulationStatus.SimulationFailed):
+				ElementTree.SubElement(testCaseElement, "failure", type=testCase.Status.name, message=statusText)
+			elif (testCase.Status in self.__SIMULATION_REPORT_JUNIT_ERRORS__):
+				ElementTree.SubElement(testCaseElement, "error", type=testCase.Status.name, message=statusText)
+			elif (testCase.Status in self.__SIMULATION_REPORT_JUNIT_SKIPPED__):
+				ElementTree.SubElement(testCaseElement, "skipped", message=statusText)
+
+		try:
+			reportFilePath.parent.mkdir(parents=True, exist_ok=True)
+			ElementTree.ElementTree(rootElement).write(str(reportFilePath), encoding="utf-8", xml_declaration=True)
+		except OSError as ex:
+			raise SimulatorException("Cannot write JUnit report '{0!s}'.".format(reportFilePath)) from ex
+
+	def WriteJSONReport(self, reportFilePath):
+		"""Write the results and phase timings of all test cases as a JSON file.
+
+		:type  reportFilePath:  pathlib.Path
+		:param reportFilePath:  Path of the JSON report file.
+		"""
+		self.LogVerbose("Writing JSON report to '{0!s}'.".format(reportFilePath))
+		testSuite = self._testSuite
+		report = {
+			"Name":       testSuite.Name,
+			"StartTime":  testSuite.StartTime.isoformat(),
+			"Duration":   testSuite.OverallRunTime,
+			"Count":      testSuite.Count,
+			"Passed":     testSuite.PassedCount,
+			"NoAsserts":  testSuite.NoAssertsCount,
+			"Failed":     testSuite.FailedCount,
+			"Errors":     testSuite.ErrorCount,
+			"TestCases":  [
+				{
+					"Name":       testCase.Name,
+					"Group":      groupName,
+					"Status":     testCase.Status.name,
+					"StartTime":  testCase.StartTime.isoformat() if (testCase.StartTime is not None) else None,
+					"Duration":   testCase.OverallRunTime if (testCase.OverallRunTimeNs is not None) else None,
+					"Phases":     {phase: duration / 1e9 for phase, duration in testCase.PhaseTimes.items()}
+				} for groupName, testCase in self._IterateTestCases(testSuite, [testSuite.Name])
+			]
+		}
+
+		try:
+			reportFilePath.parent.mkdir(parents=True, exist_ok=True)
+			with reportFilePath.open('w') as fileHandle:
+				json.dump(report, fileHandle, indent=2)
+		except OSError as ex:
+			raise SimulatorException("Cannot write JSON report '{0!s}'.".format(reportFilePath)) from ex
+
+
+class RegressionPlanner(Shared):
+	"""Build the :py:class:`VirtualProject` of each testbench from its ``*.files``
+	file without starting a tool and count the VHDL file analyses a regression
+	would run.
+
+	An analysis is identified by the tuple of file path, VHDL library and VHDL
+	version. The redundancy factor is the number of analyses divided by the
+	number of unique analyses; shared files are files analyzed for more than one
+	testbench.
+	"""
+	ENVIRONMENT =     Environment.Simulation
+
+	def __init__(self, host : IHost, toolChain, tool, board, vhdlVersion):
+		super().__init__(host, False)
+
+		self.TOOL_CHAIN =   toolChain
+		self.TOOL =         tool
+		self._board =       board
+		self._vhdlVersion = vhdlVersion
+		self._testbenches = []
+		self._analyses =    {}
+		self._errors =      {}
+
+	@property
+	def TestbenchCount(self):   return len(self._testbenches)
+	@property
+	def AnalysisCount(self):    return sum(self._analyses.values())
+	@property
+	def UniqueCount(self):      return len(self._analyses)
+	@property
+	def Errors(self):           return self._errors
+
+	@staticmethod
+	def _GetRedundancy(counts):
+		counts = list(counts)
+		return (sum(counts) / len(counts)) if (len(counts) > 0) else 0.0
+
+	@property
+	def RedundancyFactor(self):
+		return self._GetRedundancy(self._analyses.values())
+
+	@property
+	def SharedAnalyses(self):
+		"""Return a dictionary of all analyses needed by more than one testbench."""
+		return {key: count for key, count in self._analyses.items() if (count > 1)}
+
+	def AddTestbench(self, testbench):
+		"""Parse the ``*.files`` file of *testbench* and count its VHDL file
+		analyses. Parser errors are recorded per testbench."""
+		name = str(testbench.Parent)
+		self.LogVerbose("Planning testbench '{0}'".format(name))
+		try:
+			self._CreatepyIPCMIProject(testbench.ModuleName, self._board)
+			self._AddFileListFile(testbench.FilesFile)
+		except SkipableException as ex:
+			self.LogWarning("{0!s}: {1!s}".format(ex, ex.__cause__ or ""))
+			self._errors[name] = str(ex.__cause__ or ex)
+			return
+
+		files = []
+		for file in self._pyIPCMIProject.Files(fileType=FileTypes.VHDLSourceFile):
+			key = (file.Path.as_posix(), file.LibraryName, str(self._vhdlVersion))
+			self._analyses[key] = self._analyses.get(key, 0) + 1
+			files.append(key)
+		self._testbenches.append((name, files))
+
+	def ToDict(self):
+		"""Return the plan as a JSON serializable dictionary."""
+		sharedAnalyses = self.SharedAnalyses
+		return {
+			"Tool":                     self.TOOL.LongName,
+			"VHDLVersion":              str(self._vhdlVersion),
+			"Testbenches":              self.TestbenchCount,
+			"Analyses":                 self.AnalysisCount,
+			"UniqueAnalyses":           self.UniqueCount,
+			"RedundancyFactor":         self.RedundancyFactor,
+			"SharedFiles":              len(sharedAnalyses),
+			"SharedAnalyses":           sum(sharedAnalyses.values()),
+			"SharedRedundancyFactor":   self._GetRedundancy(sharedAnalyses.values()),
+			"Errors":                   self._errors,
+			"PerTestbench": [
+				{"Name": name, "Analyses": len(files)} for name, files in self._testbenches
+			],
+			"Files": [
+				{"Path": path, "Library": library, "VHDLVersion": version, "Testbenches": count}
+				for (path, library, version), count in sorted(self._analyses.items(), key=lambda item: (-item[1], item[0]))
+			]
+		}
+
+	def WriteJSONReport(self, reportFilePath):
+		"""Write the plan as a JSON file.
+
+		:type  reportFilePath:  pathlib.Path
+		:param reportFilePath:  Path of the JSON report file.
+		"""
+		self.LogVerbose("Writing JSON plan to '{0!s}'.".format(reportFilePath))
+		try:
+			reportFilePath.parent.mkdir(parents=True, exist_ok=True)
+			with reportFilePath.open('w') as fileHandle:
+				json.dump(self.ToDict(), fileHandle, indent=2)
+		except OSError as ex:
+			raise SimulatorException("Cannot write JSON plan '{0!s}'.".format(reportFilePath)) from ex
+
+
 def PoCSimulationResultFilter(gen, simulationResult):
 	state = 0
 	for line in gen:
@@ -34,7 +34,7 @@ from lib.CallBy                 import CallByRefParam
 from pyIPCMI.Base.Exceptions    import PlatformNotSupportedException
 from pyIPCMI.Base.Logging       import LogEntry, Severity
 from pyIPCMI.Base.Executable    import Executable, ShortFlagArgument, DryRunException
-from pyIPCMI.Base.Executable    import ExecutableArgument, PathArgument, StringArgument
+from pyIPCMI.Base.Executable    import ExecutableArgument, PathArgument, StringArgument, StringListArgument
 from pyIPCMI.Base.Executable    import LongFlagArgument, ShortValuedFlagArgument, ShortTupleArgument, CommandLineArgumentList
 from pyIPCMI.DataBase.Entity    import SimulationResult
 from pyIPCMI.ToolChain          import ToolMixIn, ConfigurationException, ToolConfiguration, EditionDescription, Edition, ToolSelector, OutputFilteredExecutable
@@ -252,12 +252,16 @@ class VHDLCompiler(OutputFilteredExecutable, ToolMixIn):
 	class ArgSourceFile(metaclass=PathArgument):
 		_value =    None
 
+	class ArgSourceFiles(metaclass=StringListArgument):
+		_value =    None
+
 	Parameters = CommandLineArgumentList(
 		Executable,
 		# FlagNoRangeCheck,
 		SwitchVHDLVersion,
 		SwitchVHDLLibrary,
-		ArgSourceFile
+		ArgSourceFile,
+		ArgSourceFiles
 	)
 
 	def Compile(self):
@@ -276,27 +280,30 @@ class VHDLCompiler(OutputFilteredExecutable, ToolMixIn):
 		self._hasOutput =   False
 		self._hasWarnings = False
 		self._hasErrors =   False
+		batchMode =   (self.Parameters[self.ArgSourceFiles] is not None)
+		sourceFile =  None if batchMode else self.Parameters[self.ArgSourceFile]
 		try:
-			iterator = iter(VComFilter(self.GetReader()))
-			line = next(iterator)
-
-
-			self._hasOutput = True
-			self.LogNormal("  acom messages for '{0}'".format(self.Parameters[self.ArgSourceFile]))
-			self.LogNormal("  " + ("-" * (78 - self.Logger.BaseIndent*2)))
+			for line in VComFilter(self.GetReader()):
+				# in batch mode, attribute each message to the source file announced by acom
+				if (batchMode and line.Message.startswith("COMP96 File: ")):
+					if self._hasOutput:
+						self.LogNormal("  " + ("-" * (78 - self.Logger.BaseIndent*2)))
+						self._hasOutput = False
+					sourceFile = line.Message[13:]
+
+				if (not self._hasOutput):
+					self._hasOutput = True
+					self.LogNormal("  acom messages for '{0!s}'".format(sourceFile if (sourceFile is not None) else self.Parameters[self.SwitchVHDLLibrary]))
+					self.LogNormal("  " + ("-" * (78 - self.Logger.BaseIndent*2)))
 
-			while True:
 				self._hasWarnings |= (line.Severity is Severity.Warning)
-				self._hasErrors |= (line.Severity is Severity.Error)
+				self._hasErrors |=   (line.Severity is Severity.Error)
 
 				line.IndentBy(self.Logger.BaseIndent + 1)
 				self.Log(line)
-				line = next(iterator)
 
 		except DryRunException:
 			pass
-		except StopIteration:
-			pass
 		finally:
 			if self._hasOutput:
 				self.LogNormal("  " + ("-" * (78 - self.Logger.BaseIndent*2)))
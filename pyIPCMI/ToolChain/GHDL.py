@@ -37,7 +37,7 @@ from lib.CallBy                 import CallByRefParam
 from pyIPCMI.Base.Exceptions    import PlatformNotSupportedException
 from pyIPCMI.Base.Logging       import LogEntry, Severity
 from pyIPCMI.Base.Executable    import LongValuedFlagArgument, DryRunException
-from pyIPCMI.Base.Executable    import ExecutableArgument, PathArgument, StringArgument, ValuedFlagListArgument
+from pyIPCMI.Base.Executable    import ExecutableArgument, PathArgument, StringArgument, StringListArgument, ValuedFlagListArgument
 from pyIPCMI.Base.Executable    import ShortFlagArgument, LongFlagArgument, CommandLineArgumentList
 from pyIPCMI.DataBase.Entity    import SimulationResult
 from pyIPCMI.ToolChain          import ToolMixIn, ToolChainException, ConfigurationException, ToolConfiguration, OutputFilteredExecutable
@@ -361,6 +361,9 @@ class GHDL(OutputFilteredExecutable, ToolMixIn):
 	class SwitchWaveformOptionFile(metaclass=LongValuedFlagArgument):
 		_name =     "read-wave-opt"		# requires GHDL update
 
+	class SwitchGenerics(metaclass=StringListArgument):
+		_pattern =  "-g{0}"
+
 	RunOptions = CommandLineArgumentList(
 		SwitchIEEEAsserts,
 		SwitchStopDelta,
@@ -368,7 +371,8 @@ class GHDL(OutputFilteredExecutable, ToolMixIn):
 		SwitchVCDGZWaveform,
 		SwitchFastWaveform,
 		SwitchGHDLWaveform,
-		SwitchWaveformOptionFile
+		SwitchWaveformOptionFile,
+		SwitchGenerics
 	)
 
 	def GetGHDLAnalyze(self):
@@ -392,6 +396,8 @@ class GHDL(OutputFilteredExecutable, ToolMixIn):
 		for param in ghdl.Parameters:
 			if (param is not ghdl.Executable):
 				ghdl.Parameters[param] =        None
+		for param in ghdl.RunOptions:
+			ghdl.RunOptions[param] =          None
 		ghdl.Parameters[ghdl.CmdRun] =      True
 		return ghdl
 
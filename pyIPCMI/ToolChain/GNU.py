@@ -30,12 +30,14 @@
 # load dependencies
 from pathlib                  import Path
 from re                       import compile as re_compile
+from threading                import Lock
 
 from lib.Functions            import Init
 from lib.CallBy               import CallByRefParam
 from pyIPCMI.Base.Exceptions  import PlatformNotSupportedException
 from pyIPCMI.Base.Executable  import Environment, DryRunException, Executable, CommandLineArgumentList
 from pyIPCMI.Base.Executable  import ExecutableArgument, ValuedFlagArgument, ShortTupleArgument, LongTupleArgument, LongFlagArgument, StringListArgument
+from pyIPCMI.Base.Executable  import LongValuedFlagListArgument
 from pyIPCMI.Base.Logging     import LogEntry, Severity
 from pyIPCMI.DataBase.Entity  import SimulationResult
 from pyIPCMI.ToolChain        import ToolChainException, OutputFilteredExecutable
@@ -169,6 +171,10 @@ class Bash(Executable):
 
 
 class LCov(Executable):
+	# argument values are stored in the shared argument classes, so setting
+	# them and building the argument list must not interleave between threads
+	_parameterLock = Lock()
+
 	def __init__(self, platform, dryrun, logger=None):
 		if (platform == "Linux"):     executablePath = Path("/usr/bin/lcov")
 		else:	                        raise PlatformNotSupportedException(platform)
@@ -176,27 +182,72 @@ class LCov(Executable):
 
 		self.Parameters[self.Executable] = executablePath
 
+	def Clear(self):
+		for param in self.Parameters:
+			if (param is not self.Executable):
+				self.Parameters[param] = None
+
 	class Executable(metaclass=ExecutableArgument):
 		pass
 
 	class FlagCapture(metaclass=LongFlagArgument):
 		_name = "capture"
 
+	class FlagZeroCounters(metaclass=LongFlagArgument):
+		_name = "zerocounters"
+
 	class SwitchDirectory(metaclass=LongTupleArgument):
 		_name = "directory"
 
+	class SwitchAddTracefiles(metaclass=LongValuedFlagListArgument):
+		_name = "add-tracefile"
+
 	class SwitchOutputFile(metaclass=LongTupleArgument):
 		_name = "output-file"
 
 	Parameters = CommandLineArgumentList(
 		Executable,
 		FlagCapture,
+		FlagZeroCounters,
 		SwitchDirectory,
+		SwitchAddTracefiles,
 		SwitchOutputFile
 	)
 
+	def Capture(self, directory, outputFile):
+		"""Capture the coverage counters in *directory* into the tracefile *outputFile*."""
+		with self._parameterLock:
+			self.Clear()
+			self.Parameters[self.FlagCapture] =       True
+			self.Parameters[self.SwitchDirectory] =   str(directory)
+			self.Parameters[self.SwitchOutputFile] =  str(outputFile)
+			parameterList = self.Parameters.ToArgumentList()
+		self._Execute(parameterList)
+
+	def ZeroCounters(self, directory):
+		"""Reset the coverage counters in *directory*."""
+		with self._parameterLock:
+			self.Clear()
+			self.Parameters[self.FlagZeroCounters] =  True
+			self.Parameters[self.SwitchDirectory] =   str(directory)
+			parameterList = self.Parameters.ToArgumentList()
+		self._Execute(parameterList)
+
+	def AddTracefiles(self, tracefiles, outputFile):
+		"""Merge *tracefiles* into the tracefile *outputFile*."""
+		with self._parameterLock:
+			self.Clear()
+			self.Parameters[self.SwitchAddTracefiles] = [str(file) for file in tracefiles]
+			self.Parameters[self.SwitchOutputFile] =    str(outputFile)
+			parameterList = self.Parameters.ToArgumentList()
+		self._Execute(parameterList)
+
 	def Execute(self):
-		parameterList = self.Parameters.ToArgumentList()
+		with self._parameterLock:
+			parameterList = self.Parameters.ToArgumentList()
+		self._Execute(parameterList)
+
+	def _Execute(self, parameterList):
 		self.LogVerbose("command: {0}".format(" ".join(parameterList)))
 
 		if (self._dryrun):
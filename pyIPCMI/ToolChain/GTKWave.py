@@ -28,9 +28,13 @@
 # ==============================================================================
 #
 # load dependencies
+from itertools                import islice
+from os                       import replace as os_replace, unlink
 from pathlib                  import Path
 from re                       import compile as re_compile
+from shutil                   import copymode as shutil_copymode
 from subprocess               import check_output, CalledProcessError
+from tempfile                 import NamedTemporaryFile
 
 from lib.Functions            import Init
 from pyIPCMI.Base.Exceptions          import PlatformNotSupportedException
@@ -144,6 +148,11 @@ class Configuration(ToolConfiguration):
 
 
 class GTKWave(OutputFilteredExecutable):
+	#: Header lines of a save file, which hold machine specific paths.
+	_SAVEFILE_CLEANUP_REGEXP =  re_compile(r"^\[(?:dumpfile|savefile)\]")
+	#: Number of header lines searched for machine specific paths.
+	_SAVEFILE_HEADER_LINES =    12
+
 	def __init__(self, platform, dryrun, binaryDirectoryPath, version, logger=None):
 		if (platform == "Windows"):     executablePath = binaryDirectoryPath/ "gtkwave.exe"
 		elif (platform == "Linux"):     executablePath = binaryDirectoryPath/ "gtkwave"
@@ -222,6 +231,47 @@ class GTKWave(OutputFilteredExecutable):
 				self.LogNormal("  " + ("-" * (78 - self.Logger.BaseIndent*2)))
 
 
+	@classmethod
+	def CleanUpSaveFile(cls, saveFilePath):
+		"""Remove the dump file and save file paths from the header of a GTKWave
+		save file.
+
+		The save file is streamed line by line into a temporary file next to it,
+		which replaces the save file, if a line was removed.
+
+		:type  saveFilePath:  pathlib.Path
+		:param saveFilePath:  Path of the GTKWave save file (``*.gtkw``).
+		:rtype:               bool
+		:return:              True, if the save file was changed.
+		"""
+		removedLines = 0
+		try:
+			with saveFilePath.open('r', newline="") as inputHandle:
+				outputHandle = NamedTemporaryFile('w', newline="", dir=str(saveFilePath.parent), prefix=saveFilePath.name + ".", suffix=".tmp", delete=False)
+				try:
+					with outputHandle:
+						for line in islice(inputHandle, cls._SAVEFILE_HEADER_LINES):
+							if (cls._SAVEFILE_CLEANUP_REGEXP.match(line) is None):  outputHandle.write(line)
+							else:                                                   removedLines += 1
+						# copy remaining lines without processing
+						if (removedLines > 0):
+							outputHandle.writelines(inputHandle)
+					if (removedLines > 0):
+						shutil_copymode(str(saveFilePath), outputHandle.name)
+						os_replace(outputHandle.name, str(saveFilePath))
+					else:
+						unlink(outputHandle.name)
+				except BaseException:
+					try:
+						unlink(outputHandle.name)
+					except OSError:
+						pass
+					raise
+		except OSError as ex:
+			raise GTKWaveException("Error while cleaning up GTKWave save file '{0!s}'.".format(saveFilePath)) from ex
+		return (removedLines > 0)
+
+
 def GTKWaveFilter(gen):
 	for line in gen:
 		yield LogEntry(line, Severity.Normal)
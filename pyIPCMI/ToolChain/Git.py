@@ -36,6 +36,7 @@ from shutil               import copy as shutil_copy
 
 from lib.Functions        import Init
 from pyIPCMI.Base.Exceptions      import PlatformNotSupportedException, CommonException
+from pyIPCMI.Base.Logging         import ILogable
 from pyIPCMI.Base.Executable      import Executable, ExecutableArgument, CommandLineArgumentList
 from pyIPCMI.Base.Executable      import CommandArgument, LongFlagArgument, ValuedFlagArgument, StringArgument, LongValuedFlagArgument, LongTupleArgument
 from pyIPCMI.ToolChain            import ToolMixIn, ToolChainException, ConfigurationException, SkipConfigurationException, ChangeState, ToolConfiguration
@@ -45,6 +46,7 @@ __api__ = [
 	'GitException',
 	'Configuration',
 	'Git',
+	'GitMetadata',
 	'GitSCM',
 	'GitRevParse',
 	'GitRevList',
@@ -208,14 +210,11 @@ class Configuration(ToolConfiguration):
 
 		self._host.Config[self._section]['Version'] = version
 
+	def __GetMetadata(self):
+		return GitMetadata(self._host.Directories.Root, self._git, logger=self._host.Logger)
+
 	def __IsUnderGitControl(self):
-		try:
-			gitRevParse = self._git.GetGitRevParse()
-			gitRevParse.RevParseParameters[gitRevParse.SwitchInsideWorkingTree] = True
-			output = gitRevParse.Execute()
-			return (output == "true")
-		except CommonException:
-			return False
+		return self.__GetMetadata().IsUnderGitControl
 
 	def __UninstallGitFilters(self):
 		self._host.LogNormal("  Uninstalling Git filters...")
@@ -323,22 +322,9 @@ class Configuration(ToolConfiguration):
 							raise ConfigurationException() from ex2
 
 	def __GetGitDirectory(self):
-		try:
-			gitRevParse = self._git.GetGitRevParse()
-			gitRevParse.RevParseParameters[gitRevParse.SwitchGitDir] = True
-			gitDirectory =      gitRevParse.Execute()
-			gitDirectoryPath =  Path(gitDirectory)
-		except CommonException as ex:
-			raise ConfigurationException() from ex
-
-		# WORKAROUND: GIT REV-PARSE
-		# if the Git repository isn't a Git submodule AND the current working
-		# directory is the Git top-level directory, then 'rev-parse' returns a
-		# relative path, otherwise the path is already absolute.
-		if (not gitDirectoryPath.is_absolute()):
-			pyIPCMIInstallationPath = Path(self._host.Config[self._host.LibraryKey]['InstallationDirectory'])
-			gitDirectoryPath =    pyIPCMIInstallationPath / gitDirectoryPath
-
+		gitDirectoryPath = self.__GetMetadata().GitDirectory
+		if (gitDirectoryPath is None):
+			raise ConfigurationException("Directory '{0!s}' is not under Git control.".format(self._host.Directories.Root))
 		return gitDirectoryPath
 
 
@@ -371,6 +357,202 @@ class Git(ToolMixIn):
 
 		return git
 
+	def GetMetadata(self, directory):
+		return GitMetadata(directory, self, logger=self._logger)
+
+
+class GitMetadata(ILogable):
+	"""Answer Git metadata queries for a working tree with as few ``git``
+	processes as possible.
+
+	The Git directory, the top-level directory, the checked-out branch and commit
+	are read directly from ``.git``. ``describe`` and all config values are
+	requested with one ``git`` call each. All answers are memoized per process
+	and keyed by the modification times of ``HEAD``, the checked-out branch's
+	ref, ``packed-refs`` and (for ``describe``) the tags directory or (for config
+	values) the repository's ``config`` file.
+	"""
+	_cache = {}           #: Memoized answers per Git directory and query: ``{(gitDirectory, query): (stamp, value)}``.
+	_locations = {}       #: Memoized ``(topLevel, gitDirectory)`` tuples per directory.
+
+	def __init__(self, directory, git=None, logger=None):
+		"""Class initializer
+
+		:type  directory: pathlib.Path
+		:param directory: A directory in the working tree.
+		:type  git:       Git
+		:param git:       The Git tool to run ``describe`` and ``config``. Only needed for these queries.
+		"""
+		super().__init__(logger)
+
+		self._directory = Path(directory).resolve()
+		self._git =       git
+
+	@classmethod
+	def ClearCache(cls):
+		"""Discard all memoized answers."""
+		cls._cache.clear()
+		cls._locations.clear()
+
+	def _Locate(self):
+		try:
+			return self._locations[self._directory]
+		except KeyError:
+			pass
+
+		location = (None, None)
+		for directory in [self._directory] + list(self._directory.parents):
+			dotGit = directory / ".git"
+			if dotGit.is_dir():
+				location = (directory, dotGit)
+				break
+			elif dotGit.is_file():
+				# submodules and linked worktrees: '.git' is a file with a 'gitdir: <path>' line
+				with dotGit.open('r') as fileHandle:
+					content = fileHandle.read().strip()
+				if content.startswith("gitdir: "):
+					location = (directory, (directory / content[8:]).resolve())
+					break
+
+		self._locations[self._directory] = location
+		return location
+
+	@property
+	def TopLevel(self):           return self._Locate()[0]
+	@property
+	def GitDirectory(self):       return self._Locate()[1]
+	@property
+	def IsUnderGitControl(self):  return (self.GitDirectory is not None)
+
+	@property
+	def CommonDirectory(self):
+		"""The directory of refs and config, which differs from :py:attr:`GitDirectory` in linked worktrees."""
+		gitDirectory = self._GetGitDirectory()
+		commonDirFile = gitDirectory / "commondir"
+		if commonDirFile.exists():
+			with commonDirFile.open('r') as fileHandle:
+				return (gitDirectory / fileHandle.read().strip()).resolve()
+		return gitDirectory
+
+	def _GetGitDirectory(self):
+		gitDirectory = self.GitDirectory
+		if (gitDirectory is None):
+			raise GitException("Directory '{0!s}' is not under Git control.".format(self._directory))
+		return gitDirectory
+
+	@staticmethod
+	def _GetStamp(paths):
+		stamp = []
+		for path in paths:
+			try:
+				stamp.append(path.stat().st_mtime_ns)
+			except OSError:
+				stamp.append(None)
+		return tuple(stamp)
+
+	def _Memoize(self, query, paths, compute):
+		key =   (self._GetGitDirectory(), query)
+		stamp = self._GetStamp(paths)
+		entry = self._cache.get(key)
+		if ((entry is not None) and (entry[0] == stamp)):
+			return entry[1]
+
+		self.LogDebug("Reading Git metadata '{0}' of '{1!s}'.".format(query, key[0]))
+		value = compute()
+		self._cache[key] = (stamp, value)
+		return value
+
+	def _ReadFile(self, path):
+		try:
+			with path.open('r') as fileHandle:
+				return fileHandle.read().strip()
+		except OSError as ex:
+			raise GitException("Cannot read '{0!s}'.".format(path)) from ex
+
+	def _GetHead(self):
+		headPath = self._GetGitDirectory() / "HEAD"
+		return self._Memoize("HEAD", (headPath,), lambda: self._ReadFile(headPath))
+
+	def _GetRefStampPaths(self):
+		commonDirectory = self.CommonDirectory
+		paths =           [self._GetGitDirectory() / "HEAD", commonDirectory / "packed-refs"]
+		head =            self._GetHead()
+		if head.startswith("ref: "):
+			paths.append(commonDirectory / head[5:])
+		return paths
+
+	def _ResolveRef(self, refName):
+		commonDirectory = self.CommonDirectory
+		refPath =         commonDirectory / refName
+		if refPath.is_file():
+			return self._ReadFile(refPath)
+
+		packedRefsPath = commonDirectory / "packed-refs"
+		if packedRefsPath.exists():
+			for line in self._ReadFile(packedRefsPath).splitlines():
+				if ((not line.startswith(("#", "^"))) and line.endswith(" " + refName)):
+					return line.split(" ", 1)[0]
+		return None
+
+	@property
+	def Branch(self):
+		"""The checked-out branch or ``None``, if HEAD is detached."""
+		head = self._GetHead()
+		return head[16:] if head.startswith("ref: refs/heads/") else None
+
+	@property
+	def Commit(self):
+		"""The commit hash of HEAD or ``None`` for a branch without commits."""
+		head = self._GetHead()
+		if (not head.startswith("ref: ")):
+			return head
+		return self._Memoize(head, self._GetRefStampPaths(), lambda: self._ResolveRef(head[5:]))
+
+	def _Execute(self, command):
+		command.WorkingDirectory = self.TopLevel
+		output = command.Execute()
+		if (output is None):
+			raise GitException("Git was not executed in dry-run mode.")
+		if output.startswith("fatal: "):
+			raise GitException(output)
+		return output
+
+	def Describe(self, abbrev=None):
+		"""Return the output of ``git describe`` for HEAD."""
+		def _Describe():
+			if (self._git is None):
+				raise GitException("No Git tool configured to run 'git describe'.")
+			gitDescribe = self._git.GetGitDescribe()
+			if (abbrev is not None):
+				gitDescribe.DescribeParameters[gitDescribe.SwitchAbbrev] = abbrev
+			return self._Execute(gitDescribe).strip()
+
+		paths = self._GetRefStampPaths() + [self.CommonDirectory / "refs" / "tags"]
+		return self._Memoize("describe:{0!s}".format(abbrev), paths, _Describe)
+
+	def _GetConfigValues(self):
+		def _ReadConfig():
+			if (self._git is None):
+				raise GitException("No Git tool configured to run 'git config'.")
+			gitConfig = self._git.GetGitConfig()
+			gitConfig.ConfigParameters[gitConfig.SwitchList] = True
+
+			values = {}
+			for line in self._Execute(gitConfig).splitlines():
+				name, _, value = line.partition("=")
+				values[name] = value
+			return values
+
+		return self._Memoize("config", (self.CommonDirectory / "config",), _ReadConfig)
+
+	def GetConfig(self, name, default=None):
+		"""Return the value of config variable *name* (e.g. ``filter.normalize.clean``)
+		or *default*, if it is not set."""
+		section, _, key = name.rpartition(".")
+		section, dot, subsection = section.partition(".")
+		name = section.lower() + dot + subsection + "." + key.lower()
+		return self._GetConfigValues().get(name, default)
+
 
 class GitSCM(Executable, ToolMixIn):
 	def __init__(self, toolchain : ToolMixIn):
@@ -449,9 +631,7 @@ class GitRevParse(GitSCM):
 			raise GitException("Failed to launch Git.") from ex
 
 		# FIXME: Replace GetReader with a shorter call to e.g. GetLine and/or GetLines
-		output = ""
-		for line in self.GetReader():
-			output += line
+		output = "\n".join(self.GetReader())
 
 		return output
 
@@ -497,9 +677,7 @@ class GitRevList(GitSCM):
 			raise GitException("Failed to launch Git.") from ex
 
 		# FIXME: Replace GetReader with a shorter call to e.g. GetLine and/or GetLines
-		output = ""
-		for line in self.GetReader():
-			output += line
+		output = "\n".join(self.GetReader())
 
 		return output
 
@@ -545,9 +723,7 @@ class GitDescribe(GitSCM):
 			raise GitException("Failed to launch Git.") from ex
 
 		# FIXME: Replace GetReader with a shorter call to e.g. GetLine and/or GetLines
-		output = ""
-		for line in self.GetReader():
-			output += line
+		output = "\n".join(self.GetReader())
 
 		return output
 
@@ -572,6 +748,9 @@ class GitConfig(GitSCM):
 	class SwitchRemoveSection(metaclass=LongFlagArgument):
 		_name =     "remove-section"
 
+	class SwitchList(metaclass=LongFlagArgument):
+		_name =     "list"
+
 	class ValueFilterClean(metaclass=ValuedFlagArgument):
 		_name =     "clean"
 		_pattern =  "filter.{1}.{0}"
@@ -587,6 +766,7 @@ class GitConfig(GitSCM):
 		Command,
 		SwitchUnset,
 		SwitchRemoveSection,
+		SwitchList,
 		ValueFilterClean,
 		ValueFilterSmudge,
 		ValueFilterParameters
@@ -607,9 +787,7 @@ class GitConfig(GitSCM):
 			raise GitException("Failed to launch Git.") from ex
 
 		# FIXME: Replace GetReader with a shorter call to e.g. GetLine and/or GetLines
-		output = ""
-		for line in self.GetReader():
-			output += line
+		output = "\n".join(self.GetReader())
 
 		return output
 
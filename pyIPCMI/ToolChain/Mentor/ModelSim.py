@@ -39,7 +39,7 @@ from flags                      import Flags
 from lib.Functions              import Init
 from lib.CallBy                 import CallByRefParam
 from pyIPCMI.Base.Exceptions    import PlatformNotSupportedException
-from pyIPCMI.Base.Executable    import ExecutableArgument, ShortFlagArgument, ShortTupleArgument, StringArgument, PathArgument, CommandLineArgumentList, DryRunException, OptionalValuedFlagArgument
+from pyIPCMI.Base.Executable    import ExecutableArgument, ShortFlagArgument, ShortTupleArgument, StringArgument, StringListArgument, PathArgument, CommandLineArgumentList, DryRunException, OptionalValuedFlagArgument
 from pyIPCMI.Base.Logging       import Severity, LogEntry
 from pyIPCMI.DataBase.Entity    import SimulationResult
 from pyIPCMI.ToolChain          import ConfigurationException, EditionDescription, Edition, ToolConfiguration, ToolSelector, ToolMixIn, OutputFilteredExecutable
@@ -628,6 +628,9 @@ class VHDLCompiler(OutputFilteredExecutable, ToolMixIn):
 	class ArgSourceFile(metaclass=PathArgument):
 		_value =    None
 
+	class ArgSourceFiles(metaclass=StringListArgument):
+		_value =    None
+
 	Parameters = CommandLineArgumentList(
 		Executable,
 		FlagTime,
@@ -656,7 +659,8 @@ class VHDLCompiler(OutputFilteredExecutable, ToolMixIn):
 		SwitchVHDLVersion,
 		ArgLogFile,
 		SwitchVHDLLibrary,
-		ArgSourceFile
+		ArgSourceFile,
+		ArgSourceFiles
 	)
 
 	def Compile(self):
@@ -672,31 +676,35 @@ class VHDLCompiler(OutputFilteredExecutable, ToolMixIn):
 		except Exception as ex:
 			raise ModelSimException("Failed to launch vcom run.") from ex
 
-		self._hasOutput =   False
-		self._hasWarnings = False
-		self._hasErrors =   False
+		self._hasOutput =       False
+		self._hasWarnings =     False
+		self._hasErrors =       False
+		batchMode =             (self.Parameters[self.ArgSourceFiles] is not None)
+		sourceFile =            None if batchMode else self.Parameters[self.ArgSourceFile]
 		try:
-			iterator = iter(VComFilter(self.GetReader()))
-
-			line = next(iterator)
-			line.IndentBy(self.Logger.BaseIndent + 1)
-			self._hasOutput = True
-			self.LogNormal("vcom messages for '{0}'".format(self.Parameters[self.ArgSourceFile]), indent=1)
-			self.LogNormal("-" * (78 - self.Logger.BaseIndent*2), indent=1)
-			self.Log(line)
+			for line in VComFilter(self.GetReader()):
+				# in batch mode, attribute each message to the source file it refers to
+				if batchMode:
+					match = VCOM_MESSAGE_SOURCE_FILE_REGEXP.match(line.Message)
+					if ((match is not None) and (match.group("File") != sourceFile)):
+						if self._hasOutput:
+							self.LogNormal("-" * (78 - self.Logger.BaseIndent*2), indent=1)
+							self._hasOutput = False
+						sourceFile = match.group("File")
+
+				if (not self._hasOutput):
+					self._hasOutput = True
+					self.LogNormal("vcom messages for '{0!s}'".format(sourceFile if (sourceFile is not None) else self.Parameters[self.SwitchVHDLLibrary]), indent=1)
+					self.LogNormal("-" * (78 - self.Logger.BaseIndent*2), indent=1)
 
-			while True:
 				self._hasWarnings |= (line.Severity is Severity.Warning)
 				self._hasErrors |= (line.Severity is Severity.Error)
 
-				line = next(iterator)
 				line.IndentBy(self.Logger.BaseIndent + 1)
 				self.Log(line)
 
 		except DryRunException:
 			pass
-		except StopIteration:
-			pass
 		finally:
 			if self._hasOutput:
 				self.LogNormal("-" * (78 - self.Logger.BaseIndent*2), indent=1)
@@ -923,6 +931,8 @@ def VLibFilter(gen):
 			yield LogEntry(line, Severity.Normal)
 
 
+VCOM_MESSAGE_SOURCE_FILE_REGEXP = re_compile(r"^\*\* (?:Warning|Error|Fatal)(?: \(suppressible\))?: (?P<File>.+?)\(\d+\): ")   #: Extracts the source file from a vcom message.
+
 def VComFilter(gen):
 	for line in gen:
 		if line.startswith("** Warning: "):
@@ -30,11 +30,10 @@
 # load dependencies
 from os                   import environ
 from pathlib              import Path
-from subprocess           import CalledProcessError
 
-from pyIPCMI.Base.Exceptions      import EnvironmentException
+from pyIPCMI.Base.Exceptions      import CommonException, EnvironmentException
 from pyIPCMI.ToolChain            import ToolConfiguration
-from pyIPCMI.ToolChain.Git        import Git
+from pyIPCMI.ToolChain.Git        import Git, GitException
 
 
 __api__ = [
@@ -81,15 +80,12 @@ class Configuration(ToolConfiguration):
 				binaryDirectoryPath = Path(self._host.Config['INSTALL.Git']['BinaryDirectory'])
 				git = Git(self._host.Platform, self._host.DryRun, binaryDirectoryPath, "", logger=self._host.Logger)
 
-				gitDescribe =   git.GetGitDescribe()
-				gitDescribe.DescribeParameters[gitDescribe.SwitchAbbrev] =  0
-				gitDescribe.DescribeParameters[gitDescribe.SwitchTags] =    "" # specify no hash
-				latestTagName = gitDescribe.Execute().strip()
+				latestTagName = git.GetMetadata(self._host.Directories.Root).Describe(abbrev=0)
 
 				self._host.LogNormal("  PoC version: {0} (found in git)".format(latestTagName))
 				self._host.Config[self._host.LibraryKey]['Version'] = latestTagName
 				success = True
-			except CalledProcessError:
+			except (CommonException, GitException):
 				pass
 
 		if not success:
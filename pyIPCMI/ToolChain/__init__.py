@@ -101,6 +101,9 @@ class ToolMixIn:
 		self._logger =              logger
 		self._environment =         Environment()
 
+	@property
+	def Version(self):    return self._version
+
 
 class AskMixIn:
 	def _Ask(self, question, default, beforeDefault="", afterDefault="", indent=1):
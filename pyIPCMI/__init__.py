@@ -26,6 +26,7 @@
 # limitations under the License.
 # ==============================================================================
 #
+import json
 from argparse       import RawDescriptionHelpFormatter
 from configparser   import DuplicateOptionError
 from datetime       import datetime
@@ -72,10 +73,13 @@ try:
 	from lib.ExtendedConfigParser                   import ExtendedConfigParser
 	from lib.Terminal                               import Terminal
 
-	from pyIPCMI.Compiler                           import CompilerException, CompileSteps
+	from pyIPCMI.Compiler                           import Compiler as BaseCompiler, CompilerException, CompileSteps
 	from pyIPCMI.Base.Exceptions                    import ExceptionBase, CommonException, PlatformNotSupportedException, EnvironmentException, NotConfiguredException
+	from pyIPCMI.Base.History                       import RuntimeHistory
 	from pyIPCMI.Base.Logging                       import ILogable, Logger, Severity
+	from pyIPCMI.Base.Profiling                     import Profiler
 	from pyIPCMI.Base.Project                       import VHDLVersion
+	from pyIPCMI.Base.Shared                        import to_time
 	from pyIPCMI.Compiler.LSECompiler               import Compiler as LSECompiler
 	from pyIPCMI.Compiler.QuartusCompiler           import Compiler as MapCompiler
 	from pyIPCMI.Compiler.ISECompiler               import Compiler as ISECompiler
@@ -87,7 +91,7 @@ try:
 	from pyIPCMI.DataBase.Config                    import Board
 	from pyIPCMI.DataBase.Entity                    import NamespaceRoot, FQN, EntityTypes, WildCard, TestbenchKind, NetlistKind
 	from pyIPCMI.DataBase.Solution                  import Repository
-	from pyIPCMI.Simulator                          import Simulator as BaseSimulator, SimulatorException, SimulationSteps
+	from pyIPCMI.Simulator                          import Simulator as BaseSimulator, SimulatorException, SimulationSteps, RegressionPlanner
 	from pyIPCMI.Simulator.ActiveHDLSimulator       import Simulator as ActiveHDLSimulator
 	from pyIPCMI.Simulator.RivieraPROSimulator      import Simulator as RivieraPROSimulator
 	from pyIPCMI.Simulator.CocotbSimulator          import Simulator as CocotbSimulator
@@ -134,6 +138,16 @@ class SimulationStepsAttributeGroup(Attribute):
 		self._AppendAttribute(func, SwitchArgumentAttribute("-W", "--review",       dest="Review",        help="Run only display the waveform in a GUI window."))
 		self._AppendAttribute(func, SwitchArgumentAttribute("-S", "--resimulate",   dest="Resimulate",    help="Run all simulation steps (prepare, simulation) and finally display the waveform in a GUI window."))
 		self._AppendAttribute(func, SwitchArgumentAttribute("-r", "--showreport",   dest="ShowReport",    help="Show a simulation report."))
+		self._AppendAttribute(func, SwitchArgumentAttribute(      "--cache",      dest="Cache",         help="Skip testbenches, if a passed result for unchanged sources is cached."))
+		self._AppendAttribute(func, SwitchArgumentAttribute(      "--no-cache",   dest="NoCache",       help="Run all testbenches, even if --cache is given."))
+		self._AppendAttribute(func, ArgumentAttribute(      "--timeout",            metavar="Seconds", dest="Timeout",           type=float, help="Kill a testbench after <Seconds>."))
+		self._AppendAttribute(func, ArgumentAttribute(      "--inactivity-timeout", metavar="Seconds", dest="InactivityTimeout", type=float, help="Kill a testbench, if it writes no output for <Seconds>."))
+		self._AppendAttribute(func, SwitchArgumentAttribute(      "--fail-fast",  dest="FailFast",      help="Stop after the first failed testbench."))
+		self._AppendAttribute(func, ArgumentAttribute(      "--max-failures", metavar="Count", dest="MaxFailures", type=int, help="Stop after <Count> failed testbenches."))
+		self._AppendAttribute(func, ArgumentAttribute(      "--junit-report", metavar="File", dest="JUnitReport", help="Write a JUnit XML report including phase timings to <File>."))
+		self._AppendAttribute(func, ArgumentAttribute(      "--json-report",  metavar="File", dest="JSONReport",  help="Write a JSON report including phase timings to <File>."))
+		self._AppendAttribute(func, ArgumentAttribute(      "--shard",  metavar="Index/Count", dest="Shard",      help="Run only the <Index>-th of <Count> parts of all selected testbenches."))
+		self._AppendAttribute(func, ArgumentAttribute(      "--result", metavar="File",        dest="ResultFile", help="Write the results to <File> for 'merge-report'."))
 		# self._AppendAttribute(func, SwitchArgumentAttribute(      "--cleanup-after",  dest="CleanUpAfter",  help="Don't delete intermediate files. Skip post-delete rules."))
 		return func
 
@@ -147,6 +161,12 @@ class CompileStepsAttributeGroup(Attribute):
 		# bitfile
 		self._AppendAttribute(func, SwitchArgumentAttribute("-r", "--showreport", dest="ShowReport", help="Show a simulation report."))
 		self._AppendAttribute(func, SwitchArgumentAttribute(      "--no-cleanup", dest="NoCleanUp",  help="Don't delete intermediate files. Skip post-delete rules."))
+		self._AppendAttribute(func, SwitchArgumentAttribute(      "--no-cache",   dest="NoCache",    help="Don't restore or store netlists in the netlist cache."))
+		self._AppendAttribute(func, ArgumentAttribute("-j", "--jobs", metavar="Count", dest="Jobs", type=int, default=1, help="Compile up to <Count> independent netlists in parallel."))
+		self._AppendAttribute(func, SwitchArgumentAttribute(      "--fail-fast",  dest="FailFast",   help="Stop after the first failed netlist."))
+		self._AppendAttribute(func, ArgumentAttribute(      "--max-failures", metavar="Count", dest="MaxFailures", type=int, help="Stop after <Count> failed netlists."))
+		self._AppendAttribute(func, ArgumentAttribute(      "--shard",  metavar="Index/Count", dest="Shard",      help="Compile only the <Index>-th of <Count> parts of all selected netlists."))
+		self._AppendAttribute(func, ArgumentAttribute(      "--result", metavar="File",        dest="ResultFile", help="Write the results to <File> for 'merge-report'."))
 		return func
 
 
@@ -197,7 +217,7 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		Project =     Path()
 
 
-	def __init__(self, debug, verbose, quiet, dryRun, sphinx=False):
+	def __init__(self, debug, verbose, quiet, dryRun, sphinx=False, profile=None):
 		# Call the initializer of ILogable
 		# --------------------------------------------------------------------------
 		if quiet:      severity = Severity.Quiet
@@ -208,6 +228,8 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		logger = Logger(severity, printToStdOut=True)
 		ILogable.__init__(self, logger=logger)
 
+		self._profiler = Profiler(profile, logger=logger) if (profile is not None) else None
+
 		# Call the constructor of the ArgParseMixin
 		# --------------------------------------------------------------------------
 		(terminalWidth, _) = Terminal.GetTerminalSize()
@@ -270,6 +292,8 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 	@property
 	def Platform(self):           return self.__PLATFORM
 	@property
+	def Profiler(self):           return self._profiler
+	@property
 	def DryRun(self):             return self.__dryRun
 
 	@property
@@ -329,6 +353,7 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 				self.Config.read(str(file))
 		except DuplicateOptionError as ex:
 			raise ConfigurationException("Error in configuration file '{0!s}'.".format(file)) from ex
+		Board.ResetBoardIndex()
 
 		# check pyIPCMI installation directory
 		installationDirectory = Path(self.Config[self.LibraryKey]['InstallationDirectory'])
@@ -402,8 +427,18 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 	@CommonSwitchArgumentAttribute("-q", "--quiet",   dest="quiet",   help="Reduce messages to a minimum.")
 	@CommonArgumentAttribute("--sln", metavar="SolutionID", dest="SolutionID",  help="Solution name.")
 	@CommonArgumentAttribute("--prj", metavar="ProjectID",  dest="ProjectID",   help="Project name.")
+	@CommonArgumentAttribute("--profile", metavar="Kind", dest="Profile", choices=("cpu", "mem"), help="Profile the command: cpu | mem.")
 	def Run(self):
-		ArgParseMixin.Run(self)
+		if (self._profiler is None):
+			ArgParseMixin.Run(self)
+			return
+
+		self._profiler.Start()
+		try:
+			ArgParseMixin.Run(self)
+		finally:
+			temporaryDirectory = getattr(self.Directories, "Temp", None)
+			self._profiler.Stop(temporaryDirectory if (temporaryDirectory is not None) else self.Directories.Working)
 
 	def PrintHeadline(self):
 		self.LogNormal("{HEADLINE}{line}{NOCOLOR}".format(line="="*80, **Init.Foreground))
@@ -846,6 +881,55 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		# check if GHDL is configure
 		self.__CheckSection("INSTALL.GHDL", "GHDL")
 
+	@staticmethod
+	def _GetMaxFailures(args):
+		return 1 if args.FailFast else args.MaxFailures
+
+	@staticmethod
+	def _IsSimulationCacheDisabled(args):
+		"""The simulation result cache is opt-in: it is used with ``--cache``, unless ``--no-cache`` is given, too."""
+		return ((not args.Cache) or args.NoCache)
+
+	@staticmethod
+	def _GetExitCode(testSuite, failed):
+		"""Return 2, if a regression was aborted due to ``--fail-fast`` or
+		``--max-failures``, 1 if it failed, otherwise 0."""
+		if testSuite.IsAborted:   return 2
+		elif failed:              return 1
+		else:                     return 0
+
+	@staticmethod
+	def _ExtractShard(shard):
+		"""Parse a shard argument 'Index/Count' into a tuple of integers."""
+		if (shard is None):
+			return None
+		try:
+			index, count = [int(part) for part in shard.split("/")]
+		except ValueError as ex:
+			raise CommonException("Argument --shard has an invalid value '{0}'. Expected: Index/Count".format(shard)) from ex
+		if (not (1 <= index <= count)):
+			raise CommonException("Argument --shard has an invalid value '{0}'. Index must be in range 1..{1}.".format(shard, count))
+		return (index, count)
+
+	def _WriteResultFile(self, instance, resultFile, shard):
+		"""Write the results of a simulator or compiler to the file given by
+		``--result``. Sharded runs default to 'temp/shards/shard<Index>of<Count>.json'."""
+		if (resultFile is not None):
+			resultFilePath = Path(resultFile)
+		elif (shard is not None):
+			index, count =    self._ExtractShard(shard)
+			resultFilePath =  self.Directories.Temp / "shards" / "shard{0}of{1}.json".format(index, count)
+		else:
+			return
+		self.LogNormal("Writing results to '{0!s}'.".format(resultFilePath))
+		instance.WriteResultFile(resultFilePath)
+
+	def _WriteSimulationReports(self, simulator, args):
+		if (args.JUnitReport is not None):
+			simulator.WriteJUnitReport(Path(args.JUnitReport))
+		if (args.JSONReport is not None):
+			simulator.WriteJSONReport(Path(args.JSONReport))
+
 	@staticmethod
 	def _ExtractSimulationSteps(guiMode, analyze, elaborate, optimize, recompile, simulate, showWaveform, showCoverage, resimulate, showReport, cleanUp):
 		simulationSteps = SimulationSteps.no_flags
@@ -982,6 +1066,179 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		Exit.exit()
 
 
+	# ----------------------------------------------------------------------------
+	# create the sub-parser for the "merge-report" command
+	# ----------------------------------------------------------------------------
+	@CommandGroupAttribute("Simulation commands")
+	@CommandAttribute("merge-report", help="Merge the results of sharded runs into one report.", description=dedent("""\
+		Merge result files written by simulation or compile commands with --shard
+		or --result and print the overall report. Nothing is rerun.
+		"""))
+	@ArgumentAttribute(metavar="File", dest="ResultFiles", type=str, nargs="+", help="A space separated list of result files.")
+	@ArgumentAttribute("--junit-report", metavar="File", dest="JUnitReport", help="Write a JUnit XML report of merged simulation results to <File>.")
+	@ArgumentAttribute("--json-report",  metavar="File", dest="JSONReport",  help="Write a JSON report of merged simulation results to <File>.")
+	@ArgumentAttribute("--result",       metavar="File", dest="ResultFile",  help="Write the merged results to <File>.")
+	def HandleMergeReport(self, args):
+		self.PrintHeadline()
+		self.__PrepareForConfiguration()
+
+		resultFilePaths = [Path(resultFile) for resultFile in args.ResultFiles]
+		try:
+			with resultFilePaths[0].open('r') as fileHandle:
+				kind = json.load(fileHandle).get("Kind")
+		except (OSError, ValueError, AttributeError) as ex:
+			raise CommonException("Cannot read result file '{0!s}'.".format(resultFilePaths[0])) from ex
+
+		if (kind == "TestSuite"):
+			instance = BaseSimulator(self, self.DryRun, SimulationSteps.ShowReport, noCache=True)
+		elif (kind == "SynthesisSuite"):
+			instance = BaseCompiler(self, self.DryRun, noCleanUp=True, noCache=True)
+		else:
+			raise CommonException("Result file '{0!s}' contains no simulation or compile results.".format(resultFilePaths[0]))
+
+		for resultFilePath in resultFilePaths:
+			instance.ReadResultFile(resultFilePath)
+		instance.CheckShardCoverage()
+
+		self._WriteResultFile(instance, args.ResultFile, None)
+		if (kind == "TestSuite"):
+			instance.PrintOverallSimulationReport()
+			self._WriteSimulationReports(instance, args)
+			Exit.exit(self._GetExitCode(instance.TestSuite, not instance.TestSuite.IsAllPassed))
+		else:
+			instance.PrintOverallCompileReport()
+			Exit.exit(self._GetExitCode(instance.TestSuite, False))
+
+	# ----------------------------------------------------------------------------
+	# create the sub-parser for the "history" command
+	# ----------------------------------------------------------------------------
+	@CommandGroupAttribute("Simulation commands")
+	@CommandAttribute("history", help="Show recorded testbench run times.", description=dedent("""\
+		Show the slowest testbenches and their run time trends from the runtime
+		history. If a testbench is given, show its most recent runs including
+		phase timings.
+		"""))
+	@ArgumentAttribute(metavar="Testbench", dest="Testbench", type=str, nargs="?", help="Show the most recent runs of a testbench, e.g. PoC.arith.prng.")
+	@ArgumentAttribute("--tool", metavar="Tool", dest="Tool", help="Show only runs of this tool, e.g. GHDL.")
+	@ArgumentAttribute("--count", metavar="Count", dest="Count", type=int, default=10, help="Number of testbenches or runs to show.")
+	def HandleHistory(self, args):
+		self.PrintHeadline()
+		self.__PrepareForConfiguration()
+
+		historyFilePath = self.Directories.Root / self.Config['CONFIG.DirectoryNames']['RuntimeHistoryFile']
+		if (not historyFilePath.exists()):
+			self.LogNormal("  {RED}No runtime history found.{NOCOLOR}".format(**Init.Foreground))
+			Exit.exit()
+
+		history = RuntimeHistory(historyFilePath, logger=self.Logger)
+		try:
+			if (args.Testbench is not None):
+				self._PrintTestbenchHistory(history, args.Testbench, args.Count)
+			else:
+				self._PrintSlowestTestbenches(history, args.Tool, args.Count)
+		finally:
+			history.Close()
+
+		Exit.exit()
+
+	def _PrintSlowestTestbenches(self, history, tool, count):
+		entries = history.GetSlowest(count, tool)
+		if (len(entries) == 0):
+			self.LogNormal("  {RED}No completed runs recorded.{NOCOLOR}".format(**Init.Foreground))
+			return
+
+		width = max(len(entry.Testbench) for entry in entries)
+		self.LogNormal("Slowest testbenches (last {0} completed runs):".format(RuntimeHistory.ESTIMATE_RUNS))
+		self.LogNormal("  {0: <{width}}  {1: <24}  {2: >4}  {3: >9}  {4: >9}  {5: >9}  {6: >7}".format(
+			"Testbench", "Tool", "Runs", "Last", "Average", "Maximum", "Trend", width=width))
+		for entry in entries:
+			tool = "{0} {1}".format(entry.Tool, entry.ToolVersion).strip()
+			if (entry.Trend is None):
+				trend =   "{0: >7}".format("-")
+			else:
+				color =   Init.Foreground['RED'] if (entry.Trend > 0.1) else Init.Foreground['GREEN'] if (entry.Trend < -0.1) else ""
+				trend =   "{0}{1: >+7.0%}{NOCOLOR}".format(color, entry.Trend, **Init.Foreground)
+			self.LogNormal("  {0: <{width}}  {1: <24}  {2: >4}  {3: >9}  {4: >9}  {5: >9}  {6}".format(
+				entry.Testbench, tool, entry.Runs, to_time(entry.Last / 1e9), to_time(entry.Average / 1e9), to_time(entry.Maximum / 1e9), trend, width=width))
+
+	def _PrintTestbenchHistory(self, history, testbench, count):
+		runs = history.GetRuns(testbench, count)
+		if (len(runs) == 0):
+			self.LogNormal("  {RED}No runs of '{0}' recorded.{NOCOLOR}".format(testbench, **Init.Foreground))
+			return
+
+		self.LogNormal("Most recent runs of '{0}':".format(testbench))
+		for startTime, tool, toolVersion, status, duration, phases in runs:
+			self.LogNormal("  {0}  {1: <24}  {2: <20}  {3: >9}".format(startTime, "{0} {1}".format(tool, toolVersion).strip(), status, to_time(duration / 1e9)))
+			self.LogVerbose("    " + "  ".join("{0}: {1}".format(phase, to_time(phaseDuration / 1e9)) for phase, phaseDuration in phases))
+
+
+	# ----------------------------------------------------------------------------
+	# create the sub-parser for the "plan" command
+	# ----------------------------------------------------------------------------
+	@CommandGroupAttribute("Simulation commands")
+	@CommandAttribute("plan", help="Show the work of a regression without running it.", description=dedent("""\
+		Resolve the given testbenches and parse their *.files files like a
+		simulation command, but start no tool. Print the number of testbenches,
+		VHDL file analyses and unique analyses as well as the redundancy of files
+		shared between testbenches.
+		"""))
+	@pyIPCMIEntityAttribute()
+	@BoardDeviceAttributeGroup()
+	@VHDLVersionAttribute()
+	@ArgumentAttribute("--tool", metavar="Tool", dest="Tool", default="ghdl", help="Simulator to plan for: asim | ghdl | isim | vsim | xsim. Default: ghdl.")
+	@ArgumentAttribute("--json-report", metavar="File", dest="JSONReport", help="Write the plan as JSON to <File>.")
+	def HandlePlan(self, args):
+		self.PrintHeadline()
+		self.__PrepareForSimulation()
+
+		simulators = {
+			"asim": ActiveHDLSimulator,
+			"ghdl": GHDLSimulator,
+			"isim": ISESimulator,
+			"vsim": QuestaSimulator,
+			"xsim": VivadoSimulator
+		}
+		try:
+			simulator = simulators[args.Tool.lower()]
+		except KeyError:
+			raise CommonException("Argument --tool has an unknown value '{0}'.".format(args.Tool))
+
+		fqnList =     self._ExtractFQNs(args.FQN)
+		board =       self._ExtractBoard(args.BoardName, args.DeviceName)
+		vhdlVersion = self._ExtractVHDLVersion(args.VHDLVersion)
+
+		planner = RegressionPlanner(self, simulator.TOOL_CHAIN, simulator.TOOL, board, vhdlVersion)
+		for fqn in fqnList:
+			entity = fqn.Entity
+			if (isinstance(entity, WildCard)):
+				testbenches = entity.GetVHDLTestbenches()
+			else:
+				testbenches = [entity.VHDLTestbench]
+			for testbench in testbenches:
+				planner.AddTestbench(testbench)
+
+		plan =    planner.ToDict()
+		self.LogNormal("Regression plan for {0} ({1}):".format(plan["Tool"], plan["VHDLVersion"]))
+		self.LogNormal("  Testbenches:              {0: >8}".format(plan["Testbenches"]))
+		self.LogNormal("  File analyses:            {0: >8}".format(plan["Analyses"]))
+		self.LogNormal("  Unique analyses:          {0: >8}".format(plan["UniqueAnalyses"]))
+		self.LogNormal("  Redundancy factor:        {0: >8.2f}".format(plan["RedundancyFactor"]))
+		self.LogNormal("  Shared files:             {0: >8}".format(plan["SharedFiles"]))
+		self.LogNormal("  Shared redundancy factor: {0: >8.2f}".format(plan["SharedRedundancyFactor"]))
+		if (len(plan["Errors"]) > 0):
+			self.LogNormal("  {RED}Testbenches with errors:  {0: >8}{NOCOLOR}".format(len(plan["Errors"]), **Init.Foreground))
+		for file in plan["Files"][:10]:
+			if (file["Testbenches"] < 2):
+				break
+			self.LogVerbose("    {0: >4}x  {1: <12} {2}".format(file["Testbenches"], file["Library"], file["Path"]))
+
+		if (args.JSONReport is not None):
+			planner.WriteJSONReport(Path(args.JSONReport))
+
+		Exit.exit()
+
+
 	# ----------------------------------------------------------------------------
 	# create the sub-parser for the "asim" command
 	# ----------------------------------------------------------------------------
@@ -1004,10 +1261,12 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		simulationSteps = self._ExtractSimulationSteps(args.GUIMode, args.Analyze, args.Elaborate, False, args.Recompile, args.Simulate, args.ShowWave, args.ShowCoverage, args.Resimulate, args.ShowReport, False)
 
 		# create a GHDLSimulator instance and prepare it
-		simulator = ActiveHDLSimulator(self, self.DryRun, simulationSteps)
-		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=vhdlVersion)
+		simulator = ActiveHDLSimulator(self, self.DryRun, simulationSteps, noCache=self._IsSimulationCacheDisabled(args))
+		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=vhdlVersion, timeout=args.Timeout, inactivityTimeout=args.InactivityTimeout, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteSimulationReports(simulator, args)
+		self._WriteResultFile(simulator, args.ResultFile, args.Shard)
 
-		Exit.exit(1 if ((SimulationSteps.Simulate in simulationSteps) and not allPassed) else 0)
+		Exit.exit(self._GetExitCode(simulator.TestSuite, (SimulationSteps.Simulate in simulationSteps) and not allPassed))
 
 
 # ----------------------------------------------------------------------------
@@ -1022,6 +1281,8 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 	@VHDLVersionAttribute()
 	@SimulationStepsAttributeGroup()
 	@SwitchArgumentAttribute("--with-coverage", dest="WithCoverage", help="Compile with coverage information.")
+	@SwitchArgumentAttribute("--coverage-per-testbench", dest="CoveragePerTestbench", help="Render an HTML coverage report per testbench.")
+	@SwitchArgumentAttribute("--incremental",   dest="Incremental",  help="Keep VHDL libraries and reanalyze only changed files and their dependents.")
 	@ArgumentAttribute("--reproducer", metavar="Name", dest="CreateReproducer", help="Create a bug reproducer")
 	def HandleGHDLSimulation(self, args):
 		self.PrintHeadline()
@@ -1037,10 +1298,51 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		vhdlVersion =     self._ExtractVHDLVersion(args.VHDLVersion)
 		simulationSteps = self._ExtractSimulationSteps(args.GUIMode, args.Analyze, args.Elaborate, False, args.Recompile, args.Simulate, args.ShowWave, args.ShowCoverage, args.Resimulate, args.ShowReport, False)
 
-		simulator = GHDLSimulator(self, self.DryRun, simulationSteps)
-		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=vhdlVersion, withCoverage=args.WithCoverage)
+		simulator = GHDLSimulator(self, self.DryRun, simulationSteps, incremental=args.Incremental, noCache=self._IsSimulationCacheDisabled(args))
+		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=vhdlVersion, withCoverage=args.WithCoverage, coverageReportPerTestbench=args.CoveragePerTestbench, timeout=args.Timeout, inactivityTimeout=args.InactivityTimeout, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteSimulationReports(simulator, args)
+		self._WriteResultFile(simulator, args.ResultFile, args.Shard)
 
-		Exit.exit(1 if ((SimulationSteps.Simulate in simulationSteps) and not allPassed) else 0)
+		Exit.exit(self._GetExitCode(simulator.TestSuite, (SimulationSteps.Simulate in simulationSteps) and not allPassed))
+
+
+	# ----------------------------------------------------------------------------
+	# create the sub-parser for the "watch" command
+	# ----------------------------------------------------------------------------
+	@CommandGroupAttribute("Simulation commands")
+	@CommandAttribute("watch", help="Rerun GHDL testbenches on file changes.", description=dedent("""\
+		Simulate the given testbenches with GHDL, then watch all files referenced
+		by their *.files files. On a change, rerun only the testbenches using a
+		changed file. VHDL files are analyzed incrementally, so only changed files and
+		their dependents are reanalyzed. Stop watching with Ctrl+C.
+		"""))
+	@pyIPCMIEntityAttribute()
+	@BoardDeviceAttributeGroup()
+	@VHDLVersionAttribute()
+	@SwitchArgumentAttribute("--cache",               dest="Cache",             help="Skip testbenches, if a passed result for unchanged sources is cached.")
+	@SwitchArgumentAttribute("--no-cache",            dest="NoCache",           help="Run all testbenches, even if --cache is given.")
+	@ArgumentAttribute("--timeout",            metavar="Seconds", dest="Timeout",           type=float, help="Kill a testbench after <Seconds>.")
+	@ArgumentAttribute("--inactivity-timeout", metavar="Seconds", dest="InactivityTimeout", type=float, help="Kill a testbench, if it writes no output for <Seconds>.")
+	@ArgumentAttribute("--poll-interval",      metavar="Seconds", dest="PollInterval",      type=float, default=1.0, help="Check for changed files every <Seconds>. Default: 1.0.")
+	@ArgumentAttribute("--debounce",           metavar="Seconds", dest="Debounce",          type=float, default=0.5, help="Wait until no file changed for <Seconds> before rerunning. Default: 0.5.")
+	def HandleWatch(self, args):
+		self.PrintHeadline()
+		self.__PrepareForSimulation()
+		self._CheckGHDL()
+
+		config = GHDLConfiguration(self)
+		if (not config.IsSupportedPlatform()):    raise PlatformNotSupportedException(self.Platform)
+		if (not config.IsConfigured()):           raise NotConfiguredException("GHDL is not configured on this system.")
+
+		fqnList =         self._ExtractFQNs(args.FQN)
+		board =           self._ExtractBoard(args.BoardName, args.DeviceName)
+		vhdlVersion =     self._ExtractVHDLVersion(args.VHDLVersion)
+		simulationSteps = self._ExtractSimulationSteps(False, False, False, False, False, False, False, False, False, True, False)
+
+		simulator = GHDLSimulator(self, self.DryRun, simulationSteps, incremental=True, noCache=self._IsSimulationCacheDisabled(args))
+		simulator.WatchAll(fqnList, board=board, vhdlVersion=vhdlVersion, pollInterval=args.PollInterval, debounce=args.Debounce, timeout=args.Timeout, inactivityTimeout=args.InactivityTimeout)
+
+		Exit.exit()
 
 
 	# ----------------------------------------------------------------------------
@@ -1062,10 +1364,12 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		board =           self._ExtractBoard(args.BoardName, args.DeviceName)
 		simulationSteps = self._ExtractSimulationSteps(args.GUIMode, args.Analyze, args.Elaborate, False, args.Recompile, args.Simulate, args.ShowWave, args.ShowCoverage, args.Resimulate, args.ShowReport, False)
 
-		simulator = ISESimulator(self, self.DryRun, simulationSteps)
-		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=VHDLVersion.VHDL93)
+		simulator = ISESimulator(self, self.DryRun, simulationSteps, noCache=self._IsSimulationCacheDisabled(args))
+		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=VHDLVersion.VHDL93, timeout=args.Timeout, inactivityTimeout=args.InactivityTimeout, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteSimulationReports(simulator, args)
+		self._WriteResultFile(simulator, args.ResultFile, args.Shard)
 
-		Exit.exit(1 if ((SimulationSteps.Simulate in simulationSteps) and not allPassed) else 0)
+		Exit.exit(self._GetExitCode(simulator.TestSuite, (SimulationSteps.Simulate in simulationSteps) and not allPassed))
 
 	# ----------------------------------------------------------------------------
 	# create the sub-parser for the "msim" command
@@ -1080,6 +1384,7 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 	@VHDLVersionAttribute()
 	@SimulationStepsAttributeGroup()
 	@SwitchArgumentAttribute("--with-coverage", dest="WithCoverage", help="Compile with coverage information.")
+	@SwitchArgumentAttribute("--incremental",   dest="Incremental",  help="Keep VHDL libraries and reanalyze only changed files and their dependents.")
 	def HandleModelSimSimulation(self, args):
 		self.PrintHeadline()
 		self.__PrepareForSimulation()
@@ -1092,10 +1397,12 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 													   args.Recompile, args.Simulate, args.ShowWave,
 													   args.ShowCoverage, args.Resimulate, args.ShowReport, False)
 
-		simulator = QuestaSimulator(self, self.DryRun, simulationSteps)
-		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=vhdlVersion, withCoverage=args.WithCoverage)
+		simulator = QuestaSimulator(self, self.DryRun, simulationSteps, incremental=args.Incremental, noCache=self._IsSimulationCacheDisabled(args))
+		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=vhdlVersion, withCoverage=args.WithCoverage, timeout=args.Timeout, inactivityTimeout=args.InactivityTimeout, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteSimulationReports(simulator, args)
+		self._WriteResultFile(simulator, args.ResultFile, args.Shard)
 
-		Exit.exit(1 if ((SimulationSteps.Simulate in simulationSteps) and not allPassed) else 0)
+		Exit.exit(self._GetExitCode(simulator.TestSuite, (SimulationSteps.Simulate in simulationSteps) and not allPassed))
 
 	# ----------------------------------------------------------------------------
 	# create the sub-parser for the "vsim" command
@@ -1110,6 +1417,7 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 	@VHDLVersionAttribute()
 	@SimulationStepsAttributeGroup()
 	@SwitchArgumentAttribute("--with-coverage", dest="WithCoverage", help="Compile with coverage information.")
+	@SwitchArgumentAttribute("--incremental",   dest="Incremental",  help="Keep VHDL libraries and reanalyze only changed files and their dependents.")
 	def HandleAnyMentorSimulation(self, args):
 		self.PrintHeadline()
 		self.__PrepareForSimulation()
@@ -1123,11 +1431,13 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 													   args.ShowCoverage, args.Resimulate, args.ShowReport,
 													   False)
 
-		simulator = QuestaSimulator(self, self.DryRun, simulationSteps)
+		simulator = QuestaSimulator(self, self.DryRun, simulationSteps, incremental=args.Incremental, noCache=self._IsSimulationCacheDisabled(args))
 		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=vhdlVersion,
-									 withCoverage=args.WithCoverage)
+									 withCoverage=args.WithCoverage, timeout=args.Timeout, inactivityTimeout=args.InactivityTimeout, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteSimulationReports(simulator, args)
+		self._WriteResultFile(simulator, args.ResultFile, args.Shard)
 
-		Exit.exit(1 if ((SimulationSteps.Simulate in simulationSteps) and not allPassed) else 0)
+		Exit.exit(self._GetExitCode(simulator.TestSuite, (SimulationSteps.Simulate in simulationSteps) and not allPassed))
 
 
 	# ----------------------------------------------------------------------------
@@ -1149,10 +1459,12 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		simulationSteps = self._ExtractSimulationSteps(args.GUIMode, args.Analyze, args.Elaborate, False, args.Recompile, args.Simulate, args.ShowWave, args.ShowCoverage, args.Resimulate, args.ShowReport, False)
 		vhdlVersion =     self._ExtractVHDLVersion(args.VHDLVersion)
 
-		simulator = RivieraPROSimulator(self, self.DryRun, simulationSteps)
-		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=vhdlVersion)
+		simulator = RivieraPROSimulator(self, self.DryRun, simulationSteps, noCache=self._IsSimulationCacheDisabled(args))
+		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=vhdlVersion, timeout=args.Timeout, inactivityTimeout=args.InactivityTimeout, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteSimulationReports(simulator, args)
+		self._WriteResultFile(simulator, args.ResultFile, args.Shard)
 
-		Exit.exit(1 if ((SimulationSteps.Simulate in simulationSteps) and not allPassed) else 0)
+		Exit.exit(self._GetExitCode(simulator.TestSuite, (SimulationSteps.Simulate in simulationSteps) and not allPassed))
 
 
 	# ----------------------------------------------------------------------------
@@ -1167,6 +1479,7 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 	@VHDLVersionAttribute()
 	@SimulationStepsAttributeGroup()
 	@SwitchArgumentAttribute("--with-coverage", dest="WithCoverage", help="Compile with coverage information.")
+	@SwitchArgumentAttribute("--incremental",   dest="Incremental",  help="Keep VHDL libraries and reanalyze only changed files and their dependents.")
 	def HandleQuestaSimSimulation(self, args):
 		self.PrintHeadline()
 		self.__PrepareForSimulation()
@@ -1177,10 +1490,12 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		vhdlVersion =     self._ExtractVHDLVersion(args.VHDLVersion)
 		simulationSteps = self._ExtractSimulationSteps(args.GUIMode, args.Analyze, args.Elaborate, False, args.Recompile, args.Simulate, args.ShowWave, args.ShowCoverage, args.Resimulate, args.ShowReport, False)
 
-		simulator = QuestaSimulator(self, self.DryRun, simulationSteps)
-		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=vhdlVersion, withCoverage=args.WithCoverage)
+		simulator = QuestaSimulator(self, self.DryRun, simulationSteps, incremental=args.Incremental, noCache=self._IsSimulationCacheDisabled(args))
+		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=vhdlVersion, withCoverage=args.WithCoverage, timeout=args.Timeout, inactivityTimeout=args.InactivityTimeout, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteSimulationReports(simulator, args)
+		self._WriteResultFile(simulator, args.ResultFile, args.Shard)
 
-		Exit.exit(1 if ((SimulationSteps.Simulate in simulationSteps) and not allPassed) else 0)
+		Exit.exit(self._GetExitCode(simulator.TestSuite, (SimulationSteps.Simulate in simulationSteps) and not allPassed))
 
 
 	# ----------------------------------------------------------------------------
@@ -1205,10 +1520,12 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		vhdlVersion =     self._ExtractVHDLVersion(args.VHDLVersion, defaultVersion=VHDLVersion.VHDL93)
 		simulationSteps = self._ExtractSimulationSteps(args.GUIMode, args.Analyze, args.Elaborate, False, args.Recompile, args.Simulate, args.ShowWave, args.ShowCoverage, args.Resimulate, args.ShowReport, False)
 
-		simulator = VivadoSimulator(self, self.DryRun, simulationSteps)
-		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=vhdlVersion)
+		simulator = VivadoSimulator(self, self.DryRun, simulationSteps, noCache=self._IsSimulationCacheDisabled(args))
+		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=vhdlVersion, timeout=args.Timeout, inactivityTimeout=args.InactivityTimeout, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteSimulationReports(simulator, args)
+		self._WriteResultFile(simulator, args.ResultFile, args.Shard)
 
-		Exit.exit(1 if ((SimulationSteps.Simulate in simulationSteps) and not allPassed) else 0)
+		Exit.exit(self._GetExitCode(simulator.TestSuite, (SimulationSteps.Simulate in simulationSteps) and not allPassed))
 
 
 	# ----------------------------------------------------------------------------
@@ -1237,9 +1554,11 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 
 		# create a CocotbSimulator instance and prepare it
 		simulator = CocotbSimulator(self, self.DryRun, simulationSteps)
-		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=VHDLVersion.VHDL2008)
+		allPassed = simulator.RunAll(fqnList, board=board, vhdlVersion=VHDLVersion.VHDL2008, timeout=args.Timeout, inactivityTimeout=args.InactivityTimeout, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteSimulationReports(simulator, args)
+		self._WriteResultFile(simulator, args.ResultFile, args.Shard)
 
-		Exit.exit(1 if ((SimulationSteps.Simulate in simulationSteps) and not allPassed) else 0)
+		Exit.exit(self._GetExitCode(simulator.TestSuite, (SimulationSteps.Simulate in simulationSteps) and not allPassed))
 
 
 	# ============================================================================
@@ -1299,10 +1618,11 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		fqnList =  self._ExtractFQNs(args.FQN, defaultType=EntityTypes.NetList)
 		board =    self._ExtractBoard(args.BoardName, args.DeviceName, force=True)
 
-		compiler = ISECompiler(self, self.DryRun, args.NoCleanUp)
-		compiler.RunAll(fqnList, board)
+		compiler = ISECompiler(self, self.DryRun, args.NoCleanUp, args.NoCache)
+		compiler.RunAll(fqnList, board, jobs=args.Jobs, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteResultFile(compiler, args.ResultFile, args.Shard)
 
-		Exit.exit()
+		Exit.exit(self._GetExitCode(compiler.TestSuite, False))
 
 	# ----------------------------------------------------------------------------
 	# create the sub-parser for the "coregen" command
@@ -1322,10 +1642,11 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		fqnList =  self._ExtractFQNs(args.FQN, defaultType=EntityTypes.NetList)
 		board =    self._ExtractBoard(args.BoardName, args.DeviceName, force=True)
 
-		compiler = XCOCompiler(self, self.DryRun, args.NoCleanUp)
-		compiler.RunAll(fqnList, board)
+		compiler = XCOCompiler(self, self.DryRun, args.NoCleanUp, args.NoCache)
+		compiler.RunAll(fqnList, board, jobs=args.Jobs, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteResultFile(compiler, args.ResultFile, args.Shard)
 
-		Exit.exit()
+		Exit.exit(self._GetExitCode(compiler.TestSuite, False))
 
 	# ----------------------------------------------------------------------------
 	# create the sub-parser for the "xst" command
@@ -1347,10 +1668,11 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		fqnList =  self._ExtractFQNs(args.FQN, defaultType=EntityTypes.NetList)
 		board =    self._ExtractBoard(args.BoardName, args.DeviceName, force=True)
 
-		compiler = XSTCompiler(self, self.DryRun, args.NoCleanUp)
-		compiler.RunAll(fqnList, board)
+		compiler = XSTCompiler(self, self.DryRun, args.NoCleanUp, args.NoCache)
+		compiler.RunAll(fqnList, board, jobs=args.Jobs, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteResultFile(compiler, args.ResultFile, args.Shard)
 
-		Exit.exit()
+		Exit.exit(self._GetExitCode(compiler.TestSuite, False))
 
 	# ----------------------------------------------------------------------------
 	# create the sub-parser for the "xci" command
@@ -1370,10 +1692,11 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		fqnList = self._ExtractFQNs(args.FQN, defaultType=EntityTypes.NetList)
 		board = self._ExtractBoard(args.BoardName, args.DeviceName, force=True)
 
-		compiler = XCICompiler(self, self.DryRun, args.NoCleanUp)
-		compiler.RunAll(fqnList, board)
+		compiler = XCICompiler(self, self.DryRun, args.NoCleanUp, args.NoCache)
+		compiler.RunAll(fqnList, board, jobs=args.Jobs, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteResultFile(compiler, args.ResultFile, args.Shard)
 
-		Exit.exit()
+		Exit.exit(self._GetExitCode(compiler.TestSuite, False))
 
 	# ----------------------------------------------------------------------------
 	# create the sub-parser for the "vivado" command
@@ -1393,10 +1716,11 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		fqnList =  self._ExtractFQNs(args.FQN, defaultType=EntityTypes.NetList)
 		board =    self._ExtractBoard(args.BoardName, args.DeviceName, force=True)
 
-		compiler = VivadoCompiler(self, self.DryRun, args.NoCleanUp)
-		compiler.RunAll(fqnList, board)
+		compiler = VivadoCompiler(self, self.DryRun, args.NoCleanUp, args.NoCache)
+		compiler.RunAll(fqnList, board, jobs=args.Jobs, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteResultFile(compiler, args.ResultFile, args.Shard)
 
-		Exit.exit()
+		Exit.exit(self._GetExitCode(compiler.TestSuite, False))
 
 
 	# ----------------------------------------------------------------------------
@@ -1417,10 +1741,11 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		fqnList =  self._ExtractFQNs(args.FQN, defaultType=EntityTypes.NetList)
 		board =    self._ExtractBoard(args.BoardName, args.DeviceName, force=True)
 
-		compiler = MapCompiler(self, self.DryRun, args.NoCleanUp)
-		compiler.RunAll(fqnList, board)
+		compiler = MapCompiler(self, self.DryRun, args.NoCleanUp, args.NoCache)
+		compiler.RunAll(fqnList, board, jobs=args.Jobs, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteResultFile(compiler, args.ResultFile, args.Shard)
 
-		Exit.exit()
+		Exit.exit(self._GetExitCode(compiler.TestSuite, False))
 
 
 	# ----------------------------------------------------------------------------
@@ -1441,7 +1766,8 @@ class IPCoreManagementInfrastructure(ILogable, ArgParseMixin):
 		fqnList =  self._ExtractFQNs(args.FQN, defaultType=EntityTypes.NetList)
 		board =    self._ExtractBoard(args.BoardName, args.DeviceName, force=True)
 
-		compiler = LSECompiler(self, self.DryRun, args.NoCleanUp)
-		compiler.RunAll(fqnList, board)
+		compiler = LSECompiler(self, self.DryRun, args.NoCleanUp, args.NoCache)
+		compiler.RunAll(fqnList, board, jobs=args.Jobs, maxFailures=self._GetMaxFailures(args), shard=self._ExtractShard(args.Shard))
+		self._WriteResultFile(compiler, args.ResultFile, args.Shard)
 
-		Exit.exit()
+		Exit.exit(self._GetExitCode(compiler.TestSuite, False))
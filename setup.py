@@ -71,7 +71,7 @@ setuptools.setup(
 	},
 	# download_url="",
 
-	packages=setuptools.find_packages(),
+	packages=setuptools.find_packages(exclude=["benchmarks", "benchmarks.*"]),
 	classifiers=[
 		"License :: OSI Approved :: Apache Software License",
 		"Operating System :: OS Independent",